@@ -0,0 +1,68 @@
+# 마지막 수정일 : 20261018
+# 벤치마크 공용 : --root 로 다른 체크아웃의 lib 를 불러와 변경 전/후 비교
+#   git worktree add --detach /tmp/before <변경 전 커밋>
+#   python bench/bench_xxx.py                  # 현재 트리
+#   python bench/bench_xxx.py --root /tmp/before
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup(description: str, **extra_args) -> argparse.Namespace:
+    # --root 의 lib 를 import 경로 맨 앞에 추가 (extra_args : 옵션 이름 → 기본값)
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--root", default=REPO_ROOT, help="lib 를 불러올 체크아웃 경로 (기본: 현재 저장소)")
+    for name, default in extra_args.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default)
+    args = parser.parse_args()
+    args.root = os.path.abspath(args.root)
+    sys.path.insert(0, args.root)
+    print(f"root={args.root}")
+    return args
+
+
+def best_of(func, repeat: int = 5) -> float:
+    # func() 를 repeat 번 실행한 최소 시간(초)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# SECTION : London 공용 준비 (lib 버전과 무관하게 동작하도록 인코딩은 여기서 직접)
+LONDON_SPECIAL = (0x02, 0x03, 0x06, 0x15, 0x1B)
+
+
+def london_frame(message: bytes) -> bytes:
+    # STX + 이스케이프(데이터 + XOR 체크섬) + ETX
+    checksum = 0
+    for b in message:
+        checksum ^= b
+    body = bytearray()
+    for b in message + bytes([checksum]):
+        body += bytes([0x1B, b + 0x80]) if b in LONDON_SPECIAL else bytes([b])
+    return b"\x02" + bytes(body) + b"\x03"
+
+
+def london_keys(count: int) -> list:
+    # 서로 다른 8바이트 상태 키 (node 2 + vd 1 + node_addr 3 + s_v 2), 일부는 이스케이프 대상 바이트 포함
+    return [bytes([0x00, 0x01, 0x03, 0x00, (i >> 8) & 0xFF, i & 0xFF, 0x4E, 0x00]) for i in range(count)]
+
+
+def london_set_frame(key: bytes, value: int) -> bytes:
+    return london_frame(b"\x88" + key + value.to_bytes(4, "big", signed=True))
+
+
+def london_controller():
+    # 네트워크 없이 parse() 만 사용하는 LondonController
+    from types import SimpleNamespace
+
+    from lib.london_controller import LondonController
+
+    dv = SimpleNamespace(receive=SimpleNamespace(listen=lambda _listener: None), send=lambda _data: None, isOnline=lambda: True)
+    return LondonController(dv)
@@ -0,0 +1,44 @@
+# 마지막 수정일 : 20261018
+# user-013 : add_button 으로 버튼 5,000 개 등록 시간 (가짜 터치패널, 디버그 로그 꺼짐)
+import time
+from types import SimpleNamespace
+
+from _bench import setup
+
+args = setup("add_button registration time", buttons=5000)
+
+import lib.button as button_module  # noqa: E402
+
+
+class FakeButton:
+    def __init__(self):
+        self.pythonWatchers = []
+
+    def watch(self, handler):
+        self.pythonWatchers.append(handler)
+
+
+class FakeTp:
+    # ButtonHandler 캐시 키로 쓰이므로 해시 가능한 객체
+    id = "tp1"
+
+    def __init__(self):
+        port = SimpleNamespace(button={i: FakeButton() for i in range(1, args.buttons + 1)})
+        port.channel = port.button
+        self.port = {1: port}
+
+
+# 실제 장비 없이 버튼 감시 등록
+button_module.tp_add_watcher = lambda tp, port, button, handler: tp.port[port].button[button].watch(handler)
+
+
+def make_callback(i):
+    return lambda: i
+
+
+tp = FakeTp()
+start = time.perf_counter()
+for i in range(1, args.buttons + 1):
+    button_module.add_button(tp, 1, i, "push", make_callback(i))
+elapsed = time.perf_counter() - start
+print(f"add_button x{args.buttons} : {elapsed * 1000:.1f} ms ({elapsed / args.buttons * 1e6:.2f} us/button)")
@@ -0,0 +1,87 @@
+# 마지막 수정일 : 20261018
+# user-024 : 버튼별 add_btn_ss 반복과 bind_range 의 등록 시간, 이벤트 하나당 처리 비용 (8 패널 x 8 포트 x 48 버튼)
+import time
+from types import SimpleNamespace
+
+from _bench import setup
+
+args = setup("add_btn_ss loop vs bind_range", panels=8, ports=8, buttons=48, events=20000)
+
+from lib import button as button_module  # noqa: E402
+
+
+class LazyDict(dict):
+    # 처음 접근할 때 factory(key) 로 생성
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, key):
+        value = self[key] = self.factory(key)
+        return value
+
+
+class FakeButton:
+    def __init__(self, path):
+        self.path = path
+        self.pythonWatchers = []
+
+    def watch(self, handler):
+        self.pythonWatchers.append(handler)
+
+
+class FakePort:
+    def __init__(self, port):
+        self.button = LazyDict(lambda button: FakeButton(f"port/{port}/button/{button}"))
+        self.channel = self.button
+
+
+class FakeTp:
+    def __init__(self, index):
+        self.id = f"tp{index}"
+        self.port = LazyDict(FakePort)
+
+
+panels = [FakeTp(i) for i in range(args.panels)]
+ports = range(1, args.ports + 1)
+buttons = range(101, 101 + args.buttons)
+hits = [0]
+
+
+def callback(_idx):
+    hits[0] += 1
+
+
+def register_add_btn_ss():
+    for port in ports:
+        for idx, button in enumerate(buttons):
+            button_module.add_btn_ss(panels, port, button, "push", lambda idx=idx: callback(idx))
+
+
+def register_bind_range():
+    for port in ports:
+        button_module.bind_range(panels, port, buttons, "push", callback)
+
+
+def fire(tp, port, button, value):
+    fake = tp.port[port].button[button]
+    evt = SimpleNamespace(path=fake.path, value=value, device=tp.id)
+    for watcher in fake.pythonWatchers:
+        watcher(evt)
+
+
+for name, register in (("add_btn_ss loop", register_add_btn_ss), ("bind_range", register_bind_range)):
+    button_module._button_handlers.clear()
+    button_module._port_routers.clear()
+    for tp in panels:
+        tp.port.clear()
+    start = time.perf_counter()
+    register()
+    registered = time.perf_counter() - start
+    hits[0] = 0
+    start = time.perf_counter()
+    for i in range(args.events):
+        fire(panels[i % args.panels], 1 + i % args.ports, buttons[i % args.buttons], i % 2 == 0)
+    per_event = (time.perf_counter() - start) / args.events
+    count = args.panels * args.ports * args.buttons
+    print(f"{name:16s} : register {count} buttons {registered * 1000:.1f} ms, dispatch {per_event * 1e6:.2f} us/event, pushes={hits[0]}")
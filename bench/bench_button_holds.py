@@ -0,0 +1,62 @@
+# 마지막 수정일 : 20261018
+# user-023 : 버튼 500 개를 동시에 3 초간 누르고 있을 때 스레드 수, hold 지연, repeat 횟수
+import threading
+import time
+from types import SimpleNamespace
+
+from _bench import setup
+
+args = setup("ButtonHandler cost of many simultaneous holds", buttons=500, hold_time=1.0, repeat_interval=0.1, seconds=3.0)
+
+from lib.button_handler import ButtonHandler  # noqa: E402
+
+started = [0]
+_thread_start = threading.Thread.start
+
+
+def counting_start(self):
+    started[0] += 1
+    return _thread_start(self)
+
+
+threading.Thread.start = counting_start
+
+holds = []
+repeats = [0]
+lock = threading.Lock()
+
+
+def on_hold():
+    with lock:
+        holds.append(time.monotonic())
+
+
+def on_repeat():
+    with lock:
+        repeats[0] += 1
+
+
+handlers = []
+for _ in range(args.buttons):
+    handler = ButtonHandler(hold_time=args.hold_time, repeat_interval=args.repeat_interval)
+    handler.on("hold", on_hold)
+    handler.on("repeat", on_repeat)
+    handlers.append(handler)
+
+push, release = SimpleNamespace(value=True), SimpleNamespace(value=False)
+base_threads = threading.active_count()
+peak = 0
+start = time.monotonic()
+for handler in handlers:
+    handler.handle_event(push)
+while time.monotonic() - start < args.seconds:
+    peak = max(peak, threading.active_count() - base_threads)
+    time.sleep(0.02)
+for handler in handlers:
+    handler.handle_event(release)
+time.sleep(0.3)
+
+lateness = sorted(t - (start + args.hold_time) for t in holds)
+print(f"threads : {started[0]} started, {peak} peak alive")
+print(f"holds {len(holds)}/{args.buttons} : lateness p50 {lateness[len(lateness) // 2] * 1e3:.1f} ms, max {lateness[-1] * 1e3:.1f} ms")
+print(f"repeats : {repeats[0]} ({repeats[0] / args.buttons:.1f} per button)")
@@ -0,0 +1,36 @@
+# 마지막 수정일 : 20261018
+# user-014 : 다른 스레드가 계속 핸들러를 등록/해제하는 동안 핸들러 수에 따른 emit 처리량
+import threading
+import time
+
+from _bench import setup
+
+args = setup("EventManager.emit throughput vs handler count with concurrent registration", seconds=1.0)
+
+from lib.event_manager import EventManager  # noqa: E402
+
+for count in (1, 4, 16, 64):
+    manager = EventManager("evt")
+    for _ in range(count):
+        manager.on("evt", lambda *_args: None)
+    stop = threading.Event()
+
+    def churn():
+        # 다른 액션에 핸들러 등록/해제 반복
+        handler = lambda *_args: None  # noqa: E731
+        while not stop.is_set():
+            manager.on("other", handler)
+            manager.remove_event_handler("other", handler)
+
+    thread = threading.Thread(target=churn, daemon=True)
+    thread.start()
+    emits = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.seconds:
+        for _ in range(1000):
+            manager.emit("evt", 1)
+        emits += 1000
+    elapsed = time.perf_counter() - start
+    stop.set()
+    thread.join()
+    print(f"{count:3d} handlers : {emits / elapsed:12,.0f} emits/s")
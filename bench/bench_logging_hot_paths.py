@@ -0,0 +1,69 @@
+# 마지막 수정일 : 20261018
+# user-012 : 디버그 로그가 꺼져 있을 때 핫패스 비용 (BSS vol_up/vol_down 연타, London 피드백 버스트)
+from types import SimpleNamespace
+
+from _bench import best_of, london_controller, london_keys, london_set_frame, setup
+
+args = setup("Hot path cost with debug logging disabled", calls=20000, frames=128, bursts=200)
+
+from lib.bss_controller import BssController  # noqa: E402
+
+
+class FakeComponent:
+    # value 를 설정하면 장비 피드백처럼 watch 콜백 호출
+    def __init__(self):
+        self._value = -20.0
+        self._watchers = []
+
+    def watch(self, callback):
+        self._watchers.append(callback)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        evt = SimpleNamespace(value=value)
+        for callback in self._watchers:
+            callback(evt)
+
+
+class FakeBssDv(dict):
+    def isOnline(self):
+        return True
+
+
+def bss_storm():
+    dv = FakeBssDv()
+    paths = [("Mixer", f"ch{i:02d}", "Gain") for i in range(32)]
+    for path in paths:
+        dv.setdefault(path[0], {}).setdefault(path[1], {})[path[2]] = FakeComponent()
+    bss = BssController(dv)
+    bss.init(paths)
+
+    def storm():
+        for i in range(args.calls):
+            (bss.vol_up if (i // 32) % 2 == 0 else bss.vol_down)(paths[i % 32])
+
+    return best_of(storm) / args.calls
+
+
+def london_burst():
+    controller = london_controller()
+    keys = london_keys(args.frames)
+    for key in keys:
+        controller.states.set_state(key, 0)
+    controller.add_path_event(lambda key, value: None)
+    data = b"".join(london_set_frame(key, i * 1000) for i, key in enumerate(keys))
+
+    def burst():
+        for _ in range(args.bursts):
+            controller.parse(data)
+
+    return best_of(burst) / (args.bursts * len(keys))
+
+
+print(f"bss vol_up/vol_down storm : {bss_storm() * 1e6:.2f} us/call")
+print(f"london feedback burst     : {london_burst() * 1e6:.2f} us/frame")
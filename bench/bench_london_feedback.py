@@ -0,0 +1,20 @@
+# 마지막 수정일 : 20261018
+# user-003 : 구독(상태 키) 수에 따른 피드백 처리량 (구독 키 SET 프레임을 40 개씩 parse)
+from _bench import best_of, london_controller, london_keys, london_set_frame, setup
+
+args = setup("LondonController feedback throughput vs subscriptions", frames=8000, chunk=40)
+
+for subscriptions in (10, 100, 600, 2000):
+    keys = london_keys(subscriptions)
+    frames = [london_set_frame(keys[i % subscriptions], i) for i in range(args.frames)]
+    chunks = [b"".join(frames[i : i + args.chunk]) for i in range(0, len(frames), args.chunk)]
+    controller = london_controller()
+    for key in keys:
+        controller.states.set_state(key, 0)
+
+    def parse_all():
+        for data in chunks:
+            controller.parse(data)
+
+    elapsed = best_of(parse_all, repeat=3)
+    print(f"{subscriptions:5d} subscriptions : {args.frames / elapsed:10.0f} frames/s ({elapsed / args.frames * 1e6:.2f} us/frame)")
@@ -0,0 +1,28 @@
+# 마지막 수정일 : 20261018
+# user-001 : 연결된 프레임 10k 개를 parse() 한 번 / 수신 단위(40 프레임)로 나눠 처리하는 시간
+from _bench import best_of, london_controller, london_keys, london_set_frame, setup
+
+args = setup("LondonController.parse() frame burst", frames=10000, chunk=40)
+
+keys = london_keys(256)
+frames = [london_set_frame(keys[i % len(keys)], i) for i in range(args.frames)]
+burst = b"".join(frames)
+chunks = [b"".join(frames[i : i + args.chunk]) for i in range(0, len(frames), args.chunk)]
+
+
+def run(data_list):
+    def parse_all():
+        controller = london_controller()
+        for key in keys:
+            controller.states.set_state(key, 0)
+        for data in data_list:
+            controller.parse(data)
+        assert controller.states.get_state(keys[(args.frames - 1) % len(keys)]) == args.frames - 1
+
+    return parse_all
+
+
+single = best_of(run([burst]), repeat=3)
+chunked = best_of(run(chunks), repeat=3)
+print(f"{args.frames} frames in one parse()          : {single * 1000:8.1f} ms ({single / args.frames * 1e6:.2f} us/frame)")
+print(f"{args.frames} frames in {args.chunk}-frame reads      : {chunked * 1000:8.1f} ms ({chunked / args.frames * 1e6:.2f} us/frame)")
@@ -0,0 +1,62 @@
+# 마지막 수정일 : 20261018
+# user-018 : set_timeout 10,000 개 (1~2초 후 실행) 의 스레드 수, 메모리, 실행 시각 오차
+import random
+import resource
+import threading
+import time
+import tracemalloc
+
+from _bench import setup
+
+args = setup("Scheduler cost of many pending timers", timers=10000)
+
+from lib.scheduler import Scheduler  # noqa: E402
+
+base_threads = threading.active_count()
+scheduler = Scheduler(name="bench")
+lateness = []
+lock = threading.Lock()
+done = threading.Event()
+random.seed(1)
+
+
+def make_callback(due):
+    def callback():
+        late = time.monotonic() - due
+        with lock:
+            lateness.append(late)
+            if len(lateness) == args.timers:
+                done.set()
+
+    return callback
+
+
+tracemalloc.start()
+start = time.monotonic()
+for _ in range(args.timers):
+    delay = 1.0 + random.random()
+    scheduler.set_timeout(delay, make_callback(time.monotonic() + delay))
+created = time.monotonic() - start
+traced, _ = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+threads_after_create = threading.active_count() - base_threads
+
+peak_threads = [threads_after_create]
+
+
+def sample_threads():
+    while not done.is_set():
+        peak_threads[0] = max(peak_threads[0], threading.active_count() - base_threads)
+        time.sleep(0.01)
+
+
+threading.Thread(target=sample_threads, daemon=True).start()
+done.wait(300)
+lateness.sort()
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(f"create {args.timers} timers : {created:.2f} s, traced memory {traced / 1e6:.1f} MB, max RSS {maxrss:.0f} MB")
+print(f"threads : {threads_after_create} after create, {peak_threads[0]} peak while firing")
+print(
+    f"fired {len(lateness)} : lateness p50 {lateness[len(lateness) // 2] * 1e3:.2f} ms, "
+    f"p99 {lateness[int(len(lateness) * 0.99)] * 1e3:.2f} ms, max {lateness[-1] * 1e3:.2f} ms"
+)
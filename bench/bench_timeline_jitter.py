@@ -0,0 +1,59 @@
+# 마지막 수정일 : 20261018
+# user-021 : 동시에 도는 Timeline 수(1, 50)에 따른 이벤트 지연과 누적 오차, 대기 중 CPU 사용량
+import threading
+import time
+
+from _bench import setup
+
+args = setup("Timeline event lateness with concurrent timelines", events=200, step_ms=20)
+
+from lib.timeline import Timeline  # noqa: E402
+
+
+def run(count):
+    # count 개 Timeline 을 step_ms 간격 events 개로 동시에 시작, (지연, 순번) 목록 반환
+    lateness = []
+    lock = threading.Lock()
+    done = threading.Event()
+    timelines = []
+    for _ in range(count):
+        timeline = Timeline()
+        started = [0.0]
+
+        def on_expired(evt, started=started):
+            ideal = started[0] + (evt.arguments["sequence"] + 1) * args.step_ms / 1000
+            with lock:
+                lateness.append((time.monotonic() - ideal, evt.arguments["sequence"]))
+                if len(lateness) == count * args.events:
+                    done.set()
+
+        timeline.expired.listen(on_expired)
+        timelines.append((timeline, started))
+    for timeline, started in timelines:
+        started[0] = time.monotonic()
+        timeline.start([args.step_ms] * args.events)
+    done.wait(60)
+    for timeline, _ in timelines:
+        timeline.stop()
+    return sorted(lateness)
+
+
+for count in (1, 50):
+    lateness = run(count)
+    last = max(late for late, sequence in lateness if sequence == args.events - 1)
+    print(
+        f"{count:2d} timelines : {len(lateness)} events, lateness p50 {lateness[len(lateness) // 2][0] * 1e3:.2f} ms, "
+        f"p99 {lateness[int(len(lateness) * 0.99)][0] * 1e3:.2f} ms, max {lateness[-1][0] * 1e3:.2f} ms, "
+        f"last event {last * 1e3:.2f} ms"
+    )
+
+# 긴 이벤트를 기다리는 Timeline 8 개 (하나는 일시정지) 의 대기 중 CPU 사용량
+timelines = [Timeline() for _ in range(8)]
+for timeline in timelines:
+    timeline.start([60000])
+timelines[0].pause()
+cpu = time.process_time()
+time.sleep(2)
+print(f"idle : {(time.process_time() - cpu) * 1000:.1f} ms CPU over 2 s, {threading.active_count()} threads")
+for timeline in timelines:
+    timeline.stop()
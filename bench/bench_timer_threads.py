@@ -0,0 +1,69 @@
+# 마지막 수정일 : 20261018
+# user-022 : debounce/throttle/pulse 호출 시 생성되는 스레드 수 (threading.Thread.start 횟수)
+#   공유 타이머의 워커 스레드는 프로세스에서 처음 필요할 때만 만들어지므로 첫 항목에 포함됨
+import threading
+import time
+from types import SimpleNamespace
+
+from _bench import setup
+
+args = setup("Threads started by debounce, throttle and pulse", panels=10, moves=200, pulses=1000)
+
+from lib.button_handler import LevelHandler  # noqa: E402
+from lib.utility import pulse  # noqa: E402
+
+started = [0]
+_thread_start = threading.Thread.start
+
+
+def counting_start(self):
+    started[0] += 1
+    return _thread_start(self)
+
+
+threading.Thread.start = counting_start
+
+
+def drag(mode):
+    # panels 개 레벨을 5 ms 간격으로 moves 번 변경 (1 초 드래그)
+    received = []
+    kwargs = {} if mode == "debounce" else {"mode": mode}
+    try:
+        handlers = [LevelHandler(received.append, 100, **kwargs) for _ in range(args.panels)]
+    except TypeError:
+        print(f"{mode:8s} : not supported in this tree")
+        return
+    started[0] = 0
+    peak = 0
+    for value in range(args.moves):
+        for handler in handlers:
+            handler.handle_event(SimpleNamespace(value=value))
+        peak = max(peak, threading.active_count())
+        time.sleep(0.005)
+    time.sleep(0.3)
+    last_ok = received[-args.panels :] == [args.moves - 1] * args.panels
+    print(f"{mode:8s} : {started[0]:5d} threads started, {peak} peak alive, {len(received)} level events, last value kept={last_ok}")
+
+
+def pulses():
+    off_count = [0]
+
+    def off():
+        off_count[0] += 1
+
+    @pulse(0.05, off)
+    def on():
+        pass
+
+    started[0] = 0
+    peak = 0
+    for _ in range(args.pulses):
+        on()
+        peak = max(peak, threading.active_count())
+    time.sleep(0.3)
+    print(f"pulse    : {started[0]:5d} threads started, {peak} peak alive, {off_count[0]}/{args.pulses} off calls")
+
+
+drag("debounce")
+drag("throttle")
+pulses()
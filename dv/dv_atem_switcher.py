@@ -1,4 +1,4 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
 from lib.network_manager import DEFAULT_UDP_CLIENT_RECONNECT_TIME, UdpClient
 from lib.utility import CommonLogger, handle_exception
@@ -79,7 +79,7 @@ class AtemSwitcher(CommonLogger, EventManager):
     @handle_exception
     def _handle_dv_receive(self, evt):
         data = evt.arguments.get("data", b"")
-        self.log_debug(f"received {data}")
+        self.log_debug("received %s", data)
         self.parse_data(data)
 
     @handle_exception
@@ -104,7 +104,7 @@ class AtemSwitcher(CommonLogger, EventManager):
         self.session_id = data[2] << 8 | data[3]
         header = data[0] >> 3
         self.last_remote_packet_id = data[10] << 8 | data[11]
-        self.log_debug(f"parse_data() : {packet_size=} {packet_length=} {self.session_id=:04x} {self.last_remote_packet_id=:04x}")
+        self.log_debug("parse_data() : packet_size=%d packet_length=%d self.session_id=%04x self.last_remote_packet_id=%04x", packet_size, packet_length, self.session_id, self.last_remote_packet_id)
         # note : phase 1
         if self.last_remote_packet_id < self.MAX_INIT_PACKAGE_COUNT:
             self.missed_initialization_packages[self.last_remote_packet_id >> 3] = self.missed_initialization_packages[
@@ -183,28 +183,28 @@ class AtemSwitcher(CommonLogger, EventManager):
                 if index_pointer + 2 > len_data:
                     break
                 command_length = (data[index_pointer] << 8) | data[index_pointer + 1]
-                self.log_debug(f"{index_pointer=} {len_data=} {counter=} {command_length=}")
+                self.log_debug("index_pointer=%d len_data=%d counter=%d command_length=%d", index_pointer, len_data, counter, command_length)
                 if command_length <= 8 or index_pointer + command_length > len_data:
                     break
                 if command_length > 8:
                     command_string = data[index_pointer + 4 : index_pointer + 4 + 4]
-                    self.log_debug(f"{command_length=} {command_string=}")
+                    self.log_debug("command_length=%d command_string=%r", command_length, command_string)
                     decoded_command = command_string.decode(errors="ignore")
                     if decoded_command.find("PrgI") != -1 and command_length >= 12:
                         self.program_input = data[index_pointer + 10] << 8 | data[index_pointer + 11]
-                        self.log_debug(f"parse_packet() : Program Input: {self.program_input}")
+                        self.log_debug("parse_packet() : Program Input: %s", self.program_input)
                         # emit: pgm_switched(program_input: int)
                         self.emit("pgm_switched", self.program_input)
                     elif decoded_command.find("PrvI") != -1 and command_length >= 12:
                         self.preview_input = data[index_pointer + 10] << 8 | data[index_pointer + 11]
-                        self.log_debug(f"parse_packet() : {self.preview_input=}")
+                        self.log_debug("parse_packet() : self.preview_input=%r", self.preview_input)
                         # emit: pvw_switched(preview_input: int)
                         self.emit("pvw_switched", self.preview_input)
                     elif decoded_command.find("AuxS") != -1 and command_length >= 13:
                         aux_index = int(data[index_pointer + 8])
                         if 0 <= aux_index <= 7:
                             self.aux_inputs[aux_index] = data[index_pointer + 11] << 8 | data[index_pointer + 12]
-                            self.log_debug(f"parse_packet() : Aux Input {aux_index}: {self.aux_inputs[aux_index]}")
+                            self.log_debug("parse_packet() : Aux Input %s: %s", aux_index, self.aux_inputs[aux_index])
                             # emit: aux_switched(aux_input: int)
                             self.emit("aux_switched", self.aux_inputs[aux_index])
                     elif decoded_command.find("InPr") != -1:
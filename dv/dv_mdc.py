@@ -1,6 +1,6 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger, handle_exception
 
 
@@ -26,7 +26,7 @@ class Mdc(CommonLogger, EventManager):
         self.power = False
         self.source = 0
         self.buffer = bytearray()
-        self.poll = Scheduler()
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
 
     @handle_exception
     def init(self):
@@ -58,8 +58,7 @@ class Mdc(CommonLogger, EventManager):
         def query_input():
             self.send(self.CMD_INPT_SRC, self.GET)
 
-        self.poll.set_timeout(1.0, lambda: self.poll.set_interval(10.0, query_power))
-        self.poll.set_timeout(3.0, lambda: self.poll.set_interval(10.0, query_input))
+        self.poll.start(query_power, query_input, interval=10.0)
 
     def _get_next_message(self):
         while self.buffer and self.buffer[0] != self.HEADER:
@@ -134,6 +133,7 @@ class Mdc(CommonLogger, EventManager):
     def set_power(self, value):
         self.send(self.CMD_PWR, 0x01 if value else 0x00)
         self.send(self.CMD_PWR, self.GET)
+        self.poll.boost()
         self.power = value
         # emit: power(value: bool)
         self.emit("power", value=self.power)
@@ -150,6 +150,7 @@ class Mdc(CommonLogger, EventManager):
     def set_input(self, source):
         self.send(self.CMD_INPT_SRC, source)
         self.send(self.CMD_INPT_SRC, self.GET)
+        self.poll.boost()
         self.source = source
         # emit: input(value: int)
         self.emit("input", value=self.source)
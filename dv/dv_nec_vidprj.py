@@ -1,6 +1,6 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger, handle_exception
 
 
@@ -17,7 +17,7 @@ class NecVidprj(CommonLogger, EventManager):
         self.mute = False
         self.buffer = bytearray()
         self.last_send_command = bytearray()
-        self.poll = Scheduler()
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
 
     @handle_exception
     def init(self):
@@ -41,8 +41,7 @@ class NecVidprj(CommonLogger, EventManager):
         def query_mute():
             self.send(self.CMD_QUERY_MUTE)
 
-        self.poll.set_timeout(1.0, lambda: self.poll.set_interval(10.0, query_power))
-        self.poll.set_timeout(3.0, lambda: self.poll.set_interval(10.0, query_mute))
+        self.poll.start(query_power, query_mute, interval=10.0)
 
     def _get_next_message(self):
         while self.buffer and self.buffer[0] not in (0x20, 0x21, 0x22, 0x23, 0xA0, 0xA1, 0xA2, 0xA3):
@@ -126,6 +125,7 @@ class NecVidprj(CommonLogger, EventManager):
     @handle_exception
     def set_power(self, value):
         self.send(b"\x02\x00\x00\x00\x00" if value else b"\x02\x01\x00\x00\x00")
+        self.poll.boost()
         self.power = value
         # emit: power(value: bool)
         self.emit("power", value=self.power)
@@ -147,6 +147,7 @@ class NecVidprj(CommonLogger, EventManager):
     @handle_exception
     def set_mute(self, value):
         self.send(b"\x02\x10\x00\x00\x00" if value else b"\x02\x11\x00\x00\x00")
+        self.poll.boost()
         self.mute = value
         # emit: mute(value: bool)
         self.emit("mute", value=self.mute)
@@ -1,7 +1,7 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
 from lib.network_manager import TcpClient, DEFAULT_TCP_CLIENT_RECONNECT_TIME
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger, handle_exception
 
 
@@ -18,7 +18,7 @@ class PanaVidprjTcp(CommonLogger, EventManager):
         self.mute = False  # USERDATA.get_value(f"{self.name}_mute", False)
         self.freeze = False  # USERDATA.get_value(f"{self.name}_freeze", False)
         self.last_sent_message = ""
-        self.poll = Scheduler()
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
 
     @handle_exception
     def init(self):
@@ -39,8 +39,7 @@ class PanaVidprjTcp(CommonLogger, EventManager):
         def query_mute():
             self.send("QSH")
 
-        self.poll.set_timeout(1.0, lambda: self.poll.set_interval(10.0, query_power))
-        self.poll.set_timeout(2.0, lambda: self.poll.set_interval(10.0, query_mute))
+        self.poll.start(query_power, query_mute, interval=10.0)
 
     @handle_exception
     def parse_response(self, *args):
@@ -75,6 +74,7 @@ class PanaVidprjTcp(CommonLogger, EventManager):
     @handle_exception
     def set_power(self, value):
         self.send("PON" if value else "POF")
+        self.poll.boost()
         self.power = value
         # USERDATA.set_value(f"{self.name}_power", self.power)
         # emit: power(value: bool)
@@ -91,6 +91,7 @@ class PanaVidprjTcp(CommonLogger, EventManager):
     @handle_exception
     def set_mute(self, value):
         self.send("OSH:1" if value else "OSH:0")
+        self.poll.boost()
         self.mute = value
         # USERDATA.set_value(f"{self.name}_mute", self.mute)
         # emit: mute(value: bool)
@@ -1,7 +1,7 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
 from lib.network_manager import TcpClient, DEFAULT_TCP_CLIENT_RECONNECT_TIME
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger, handle_exception
 
 
@@ -19,7 +19,7 @@ class PjLink(CommonLogger, EventManager):
         self.freeze = False  # USERDATA.get_value(f"{self.name}_freeze", False)
         self.source = "0"
         self.lamp_time = 0
-        self.poll = Scheduler()
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
 
     @handle_exception
     def init(self):
@@ -46,10 +46,7 @@ class PjLink(CommonLogger, EventManager):
         def query_freeze():
             self.dv.send("%2FREZ ?\r")
 
-        self.poll.set_timeout(1.0, lambda: self.poll.set_interval(10.0, query_power))
-        self.poll.set_timeout(2.0, lambda: self.poll.set_interval(10.0, query_mute))
-        self.poll.set_timeout(3.0, lambda: self.poll.set_interval(10.0, query_lamp))
-        self.poll.set_timeout(4.0, lambda: self.poll.set_interval(10.0, query_freeze))
+        self.poll.start(query_power, query_mute, query_lamp, query_freeze, interval=10.0)
 
     @handle_exception
     def parse_response(self, *args):
@@ -111,6 +108,7 @@ class PjLink(CommonLogger, EventManager):
     @handle_exception
     def set_power(self, value):
         self.dv.send("%1POWR 1\r" if value else "%1POWR 0\r")
+        self.poll.boost()
         self.power = value
         # USERDATA.set_value(f"{self.name}_power", self.power)
         # emit: power(value: bool)
@@ -127,6 +125,7 @@ class PjLink(CommonLogger, EventManager):
     @handle_exception
     def set_mute(self, value):
         self.dv.send("%1AVMT 31\r" if value else "%1AVMT 30\r")
+        self.poll.boost()
         self.mute = value
         # USERDATA.set_value(f"{self.name}_mute", self.mute)
         # emit: mute(value: bool)
@@ -143,6 +142,7 @@ class PjLink(CommonLogger, EventManager):
     @handle_exception
     def set_freeze(self, value):
         self.dv.send("%2FREZ 1\r" if value else "%2FREZ 0\r")
+        self.poll.boost()
         self.freeze = value
         # USERDATA.set_value(f"{self.name}_freeze", self.freeze)
         # emit: freeze(value: bool)
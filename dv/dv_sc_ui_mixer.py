@@ -1,6 +1,7 @@
-# 마지막 수정일 : 20260514
+# 마지막 수정일 : 20261018
 import re
 from lib.event_manager import EventManager
+from lib.level_converter import nearest_index
 from lib.scheduler import Scheduler
 from lib.network_manager import DEFAULT_TCP_CLIENT_RECONNECT_TIME, TcpClient
 from lib.utility import CommonLogger, handle_exception
@@ -158,6 +159,20 @@ class ScUiMixer(CommonLogger, EventManager):
     def get_master_volume(self) -> int:
         return int(self.state.get("m.mix", -1))
 
+    @handle_exception
+    def volume_to_db(self, v: int) -> float | None:
+        # 볼륨(0~100) → dB (미리 계산된 테이블)
+        return SCUI_DB_TABLE[v] if 0 <= v < len(SCUI_DB_TABLE) else None
+
+    @handle_exception
+    def db_to_volume(self, db: float) -> int:
+        # dB → 가장 가까운 볼륨(0~100) (bisect 역참조)
+        return nearest_index(SCUI_DB_TABLE, db)
+
+    @handle_exception
+    def get_input_volume_db(self, idx: int) -> float | None:
+        return self.volume_to_db(self.get_input_volume(idx))
+
     @handle_exception
     def parse_response(self, evt):
         data_text = evt.arguments["data"].decode()
@@ -306,6 +321,8 @@ ENUM_SCUI_INT_DB = {
     99: 9.5,
     100: 10.0,
 }
+# 볼륨(0~100) 순서의 dB 테이블 (역참조용, 오름차순)
+SCUI_DB_TABLE = tuple(ENUM_SCUI_INT_DB[i] for i in range(len(ENUM_SCUI_INT_DB)))
 # scuimixer_instance = SCUiMxer(dv=SCUIMXER, ip="192.168.0.99")
 # scuimixer_instance.dv.debug = True
 #
@@ -1,7 +1,7 @@
-# 마지막 수정일 : 20260514
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
 from lib.network_manager import DEFAULT_TCP_CLIENT_RECONNECT_TIME, TcpClient
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger, handle_exception
 
 
@@ -14,12 +14,12 @@ class SvsiN2600(CommonLogger, EventManager):
         self.dv = TcpClient(ip, port, reconnect_time=reconnect_time)
         self.name = f"{__class__.__name__.lower()}_{self.dv.name if self.dv.name else ''}"
         self.states = {}
-        self.poll = Scheduler()
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
 
     @handle_exception
     def init(self):
         self.dv.receive.listen(self.parse_response)
-        self.dv.online(lambda *_args, **_kwargs: self.poll.set_interval(10.0, self.get_status))
+        self.dv.online(lambda *_args, **_kwargs: self.poll.start(self.get_status, interval=10.0))
         self.dv.offline(lambda *_args, **_kwargs: self.poll.shutdown())
         self.dv.connect()
 
@@ -29,6 +29,7 @@ class SvsiN2600(CommonLogger, EventManager):
 
     def set_live(self):
         self.send("live")
+        self.poll.boost()
 
     @handle_exception
     def set_local(self, idx_ch):
@@ -36,21 +37,25 @@ class SvsiN2600(CommonLogger, EventManager):
             self.send("local:1")
         else:
             self.send(f"local:{idx_ch}")
+        self.poll.boost()
 
     @handle_exception
     # 인코더 용
     def set_stream(self, idx_ch):
         self.send(f"setSettings:stream:{idx_ch}")
+        self.poll.boost()
 
     @handle_exception
     # 디코더 용
     def set(self, idx_ch):
         self.send(f"set:{idx_ch}")
+        self.poll.boost()
 
     # 디코더 용
     @handle_exception
     def seta(self, idx_ch):
         self.send(f"seta:{idx_ch}")
+        self.poll.boost()
 
     def get_status(self):
         self.send("getStatus")
@@ -1,6 +1,6 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 from lib.event_manager import EventManager
-from lib.scheduler import Scheduler
+from lib.poll_coordinator import get_poll_coordinator
 from lib.utility import CommonLogger
 from lib.utility import handle_exception
 
@@ -21,8 +21,8 @@ class TascamCdp(CommonLogger, EventManager):
         super().__init__("play", "stop", "source", "status", "received", "error")
         self.dv = dv
         self.poll_interval = 3.0
-        self.poll = Scheduler()
         self.name = f"{__class__.__name__.lower()}_{self.dv.name if self.dv.name else ''}"
+        self.poll = get_poll_coordinator().group(self.name, transport=self.dv)
         self.is_playing = False
         self.source = "unknown"
         self.last_raw_message = ""
@@ -42,40 +42,46 @@ class TascamCdp(CommonLogger, EventManager):
 
     @handle_exception
     def start_poll(self):
-        self.poll.set_timeout(1.0, lambda: self.poll.set_interval(self.poll_interval, self.query_status))
+        self.poll.start(self.query_status, interval=self.poll_interval)
 
     @handle_exception
     def stop_poll(self):
-        self.poll.shutdown()
+        self.poll.stop()
 
     @handle_exception
     def play(self):
         self.send(self.COMMANDS.get("play"))
+        self.poll.boost()
         self._set_playing(True)
 
     @handle_exception
     def stop(self):
         self.send(self.COMMANDS.get("stop"))
+        self.poll.boost()
         self._set_playing(False)
 
     @handle_exception
     def next(self):
         self.send(self.COMMANDS.get("next"))
+        self.poll.boost()
         self._set_playing(True)
 
     @handle_exception
     def prev(self):
         self.send(self.COMMANDS.get("prev"))
+        self.poll.boost()
         self._set_playing(True)
 
     @handle_exception
     def set_src_sdcard(self):
         self.send(self.COMMANDS.get("sdcard"))
+        self.poll.boost()
         self._set_source("sdcard")
 
     @handle_exception
     def set_src_usb(self):
         self.send(self.COMMANDS.get("usb"))
+        self.poll.boost()
         self._set_source("usb")
 
     @handle_exception
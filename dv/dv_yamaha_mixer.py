@@ -1,4 +1,5 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
+from lib.level_converter import lut_index, lut_index_many
 from lib.utility import handle_exception, CommonLogger
 from lib.event_manager import EventManager
 from lib.network_manager import TcpClient, DEFAULT_TCP_CLIENT_RECONNECT_TIME
@@ -157,26 +158,17 @@ class YamahaMixer(CommonLogger, EventManager):
 
     @handle_exception
     def compare_value_with_lut(self, arr, val):
+        # arr[i] <= val < arr[i + 1] 인 인덱스 (bisect 사용)
         if len(arr) < 2:
             return 1
-        if val <= arr[0]:
-            # self.log_yamaha("compare_value_with_lut() :: value is below index 0")
-            return 0
-        if val >= arr[-1]:
-            # self.log_yamaha("compare_value_with_lut() :: value is above last index")
-            return len(arr) - 1
-        low = 0
-        high = len(arr) - 1
-        while low <= high:
-            mid = (low + high) // 2
-            if val < arr[mid]:
-                high = mid - 1
-            elif val >= arr[mid] and val < arr[mid + 1]:
-                # self.log_yamaha("compare_value_with_lut() :: result =", mid)
-                return mid
-            else:
-                low = mid + 1
-        return 0
+        return lut_index(arr, val)
+
+    @handle_exception
+    def compare_values_with_lut(self, arr, values):
+        # 여러 값을 한 번에 인덱스로 변환
+        if len(arr) < 2:
+            return [1] * len(values)
+        return lut_index_many(arr, values)
 
     # TODO - 만들거임 ㅠ
     @handle_exception
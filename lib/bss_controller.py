@@ -1,6 +1,11 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
+import json
+import threading
 from typing import Sequence, Union
 
+from lib.level_converter import level_scale
+from lib.scheduler import Scheduler
+from lib.state_snapshot import StateSnapshot
 from lib.utility import CommonLogger
 
 # 최소 값
@@ -12,35 +17,85 @@ UNIT_VAL: float = 1.0
 
 
 class BssObserver:
-    # 옵저버 리스트 초기화
+    # 옵저버 리스트 초기화 (전체 경로 옵저버 + 경로별 옵저버)
     def __init__(self, owner):
         self._observers = []
+        self._path_observers = {}
         self.owner = owner
 
-    # 옵저버 추가
-    def subscribe(self, observer):
-        self._observers.append(observer)
-        self.owner.log_debug(f"BssObserver subscribe {observer=}")
+    # 옵저버 추가 (path 지정 시 해당 경로 변경에만 알림)
+    def subscribe(self, observer, path=None):
+        if path is None:
+            self._observers.append(observer)
+        else:
+            self._path_observers.setdefault(path, []).append(observer)
+        self.owner.log_debug(f"BssObserver subscribe {observer=} {path=}")
 
     # 옵저버 제거
-    def unsubscribe(self, observer):
+    def unsubscribe(self, observer, path=None):
         try:
-            self._observers.remove(observer)
-            self.owner.log_debug(f"BssObserver unsubscribe {observer=}")
-        except ValueError:
-            self.owner.log_warn(f"BssObserver unsubscribe : observer not found {observer=}")
-
-    # 모든 옵저버에게 알림
-    def notify(self, *args, **kwargs):
-        self.owner.log_debug(f"BssObserver notify {args=} {kwargs=}")
-        for observer in list(self._observers):
+            if path is None:
+                self._observers.remove(observer)
+            else:
+                self._path_observers[path].remove(observer)
+                if not self._path_observers[path]:
+                    del self._path_observers[path]
+            self.owner.log_debug(f"BssObserver unsubscribe {observer=} {path=}")
+        except (ValueError, KeyError):
+            self.owner.log_warn(f"BssObserver unsubscribe : observer not found {observer=} {path=}")
+
+    # 전체 경로 옵저버와 해당 경로 옵저버에게 알림
+    def notify(self, path, *args, **kwargs):
+        self.owner.log_debug("BssObserver notify path=%r args=%r kwargs=%r", path, args, kwargs)
+        observers = self._observers + self._path_observers.get(path, [])
+        for observer in observers:
             try:
-                observer(*args, **kwargs)
+                observer(path, *args, **kwargs)
             except Exception as e:
                 from lib.utility import handler_loc
                 self.owner.log_error(f"BssObserver notify : observer error {handler_loc(observer)} {e=}")
 
 
+class BssWriteCoalescer:
+    """경로별 컴포넌트 쓰기를 interval 마다 최신값 하나로 합침 (첫 값은 즉시 전송)"""
+
+    def __init__(self, write, interval: float = 0.1):
+        self.write = write  # write(path, value) : 실제 컴포넌트 값 쓰기
+        self.interval = interval
+        self._pending = {}  # 경로 → 대기 중인 최신값
+        self._in_flight = set()  # interval 안에 이미 쓴 경로
+        self._lock = threading.Lock()
+        self._scheduler = Scheduler(name="BssWriteCoalescer")
+        self.write_count = 0
+        self.coalesced_count = 0
+
+    def set(self, path, value):
+        with self._lock:
+            if path in self._in_flight:
+                if path in self._pending:
+                    self.coalesced_count += 1
+                self._pending[path] = value
+                return
+            self._in_flight.add(path)
+            self.write_count += 1
+        self._scheduler.set_timeout(self.interval, lambda: self._flush(path))
+        self.write(path, value)
+
+    def _flush(self, path):
+        with self._lock:
+            if path not in self._pending:
+                self._in_flight.discard(path)
+                return
+            value = self._pending.pop(path)
+            self.write_count += 1
+        self._scheduler.set_timeout(self.interval, lambda: self._flush(path))
+        self.write(path, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"writes": self.write_count, "coalesced": self.coalesced_count, "pending": len(self._pending)}
+
+
 class BssState:
     # 상태 저장 딕셔너리 초기화
     def __init__(self, owner):
@@ -51,13 +106,14 @@ class BssState:
 
     # 상태 가져오기
     def get_state(self, key):
-        self.owner.log_debug(f"BssState get_state() {key=} val={self._states.get(key, None)}")
-        return self._states.get(key, None)
+        val = self._states.get(key, None)
+        self.owner.log_debug("BssState get_state() key=%r val=%r", key, val)
+        return val
 
     # 상태 설정하고 변경 알림
     def set_state(self, key, val):
         self._states[key] = val
-        self.owner.log_debug(f"BssState set_state() {key=} {val=}")
+        self.owner.log_debug("BssState set_state() key=%r val=%r", key, val)
         # 상태 변경 시 등록된 모든 옵저버에 알림
         self._event.notify(key)
 
@@ -65,20 +121,31 @@ class BssState:
         self.owner.log_debug(f"BssState remove_state() {key=}")
         self._states.pop(key, None)
 
+    # 현재 상태 사본
+    def snapshot(self):
+        return dict(self._states)
+
+    # 저장된 상태로 미리 채우고 알림 (이미 있는 키는 유지)
+    def restore(self, states):
+        restored = [key for key in states if key not in self._states]
+        for key in restored:
+            self.set_state(key, states[key])
+        return restored
+
     # 상태 변경 강제 알림
     def override_notify(self, key):
-        self.owner.log_debug(f"BssState override_notify() {key=}")
+        self.owner.log_debug("BssState override_notify() key=%r", key)
         self._event.notify(key)
 
-    # 옵저버 추가
-    def subscribe(self, observer):
-        self.owner.log_debug(f"BssState subscribe() {observer=}")
-        self._event.subscribe(observer)
+    # 옵저버 추가 (path 지정 시 해당 경로에만)
+    def subscribe(self, observer, path=None):
+        self.owner.log_debug(f"BssState subscribe() {observer=} {path=}")
+        self._event.subscribe(observer, path)
 
     # 옵저버 제거
-    def unsubscribe(self, observer):
-        self.owner.log_debug(f"BssState unsubscribe() {observer=}")
-        self._event.unsubscribe(observer)
+    def unsubscribe(self, observer, path=None):
+        self.owner.log_debug(f"BssState unsubscribe() {observer=} {path=}")
+        self._event.unsubscribe(observer, path)
 
 
 class BssController(CommonLogger):
@@ -93,17 +160,15 @@ class BssController(CommonLogger):
         self.MAX_VAL = max_val
         # 볼륨 조절 단위 값 설정
         self.UNIT_VAL = unit_val
+        # 상태 스냅샷 (enable_snapshot() 호출 시 사용)
+        self.snapshot = None
+        # 쓰기 합치기 (enable_write_coalescing() 호출 시 사용)
+        self.write_coalescer = None
 
     def db_to_tp(self, x):
         """dB 값을 터치패널 0-255 범위로 선형 변환"""
         try:
-            x_min = self.MIN_VAL
-            x_max = self.MAX_VAL
-            y_min = 0
-            y_max = 255
-            # 선형 변환 공식: (입력값 - 입력최소) * (출력최대 - 출력최소) / (입력최대 - 입력최소) + 출력최소
-            y = (x - x_min) * (y_max - y_min) / (x_max - x_min) + y_min
-            return y
+            return level_scale(self.MIN_VAL, self.MAX_VAL).db_to_tp(x)
         except Exception as e:
             self.log_error(f"db_to_tp() {e=}")
             return 0
@@ -111,17 +176,26 @@ class BssController(CommonLogger):
     def tp_to_db(self, x):
         """터치패널 0-255 값을 dB 값으로 선형 변환"""
         try:
-            x_min = 0
-            x_max = 255
-            y_min = self.MIN_VAL
-            y_max = self.MAX_VAL
-            # 선형 변환 공식: (입력값 - 입력최소) * (출력최대 - 출력최소) / (입력최대 - 입력최소) + 출력최소
-            y = (x - x_min) * (y_max - y_min) / (x_max - x_min) + y_min
-            return y
+            return level_scale(self.MIN_VAL, self.MAX_VAL).tp_to_db(x)
         except Exception as e:
             self.log_error(f"tp_to_db() {e=}")
             return self.MIN_VAL
 
+    def enable_snapshot(self, filename: str = "bss_state.json", interval: float = 30.0):
+        """상태 스냅샷 사용: init() 전에 호출하면 저장된 상태로 즉시 피드백하고, 주기적으로/종료 시 저장"""
+        if self.snapshot is None:
+            self.snapshot = StateSnapshot(
+                self.states.snapshot,
+                filename,
+                encode_key=lambda path: json.dumps(list(path), ensure_ascii=False),
+                decode_key=lambda text: tuple(json.loads(text)),
+                interval=interval,
+            )
+            restored = self.states.restore(self.snapshot.load())
+            self.log_debug(f"enable_snapshot() : restored {len(restored)} states")
+            self.snapshot.start()
+        return self.snapshot
+
     def init(self, *path_lists: Sequence[Union[list[str], tuple[str, ...]]]):
         """컴포넌트 초기화: 각 경로의 초기값을 상태에 저장하고 변경 감시 설정"""
         for path_list in path_lists:
@@ -134,8 +208,9 @@ class BssController(CommonLogger):
                     raise TypeError
                 component = self.get_component(path)
                 if component is not None:
-                    # 초기값 저장
-                    self.states.set_state(path, component.value)
+                    # 초기값 저장 (값이 아직 없으면 스냅샷에서 복원된 값 유지)
+                    if component.value is not None or self.states.get_state(path) is None:
+                        self.states.set_state(path, component.value)
                     # 컴포넌트의 값 변경을 감시하여 상태 업데이트 (default 파라미터로 path 값 고정)
                     component.watch(lambda evt, path=path, component=component: self._handle_component_update(evt, path, component))
 
@@ -145,13 +220,13 @@ class BssController(CommonLogger):
         이전 콜백이 새로운 콜백보다 나중에 실행되는 경우 상태를 덮어쓰지 않습니다.
         """
         evt_value = evt.value
-        self.log_debug(f"_handle_component_update() : {component=} {path=} evt.value={evt_value}")
+        self.log_debug("_handle_component_update() : component=%r path=%r evt.value=%s", component, path, evt_value)
         try:
             current_value = component.value
         except Exception:
             current_value = evt_value
         if not self._values_are_same(current_value, evt_value):
-            self.log_debug(f"_handle_component_update() : stale ignored {path=} evt.value={evt_value} component.value={current_value}")
+            self.log_debug("_handle_component_update() : stale ignored path=%r evt.value=%s component.value=%s", path, evt_value, current_value)
             return
         self.states.set_state(path, evt_value)
 
@@ -163,9 +238,21 @@ class BssController(CommonLogger):
             return abs(a_float - b_float) < 0.000001
         return a == b
 
-    def add_path_event(self, observer):
-        """상태 변경 이벤트에 옵저버 등록"""
-        self.states.subscribe(observer)
+    def add_path_event(self, observer, path: tuple[str, ...] | None = None):
+        """상태 변경 이벤트에 옵저버 등록 (path 지정 시 해당 경로 변경에만 호출)"""
+        self.states.subscribe(observer, path)
+
+    def remove_path_event(self, observer, path: tuple[str, ...] | None = None):
+        """옵저버 해제"""
+        self.states.unsubscribe(observer, path)
+
+    def enable_write_coalescing(self, interval: float = 0.1):
+        """슬라이더 드래그 등 연속 쓰기를 경로별로 interval 마다 최신값 하나로 합쳐서 전송"""
+        if self.write_coalescer is None:
+            self.write_coalescer = BssWriteCoalescer(self._write_component, interval=interval)
+        else:
+            self.write_coalescer.interval = interval
+        return self.write_coalescer
 
     def subscribe(self, observer):
         self.log_warn("subscribe() : is deprecated, use add_path_event() instead.")
@@ -187,18 +274,24 @@ class BssController(CommonLogger):
         if not isinstance(path, tuple):
             self.log_error("get_state() : path must be composed of strings surrounded by tuple")
             raise TypeError
-        self.log_debug(f"get_state() {path=}")
+        self.log_debug("get_state() path=%r", path)
         return self.states.get_state(path)
 
     def set_state(self, path: tuple[str, ...], new_value: Union[str, float]):
         """컴포넌트 값을 업데이트 (장치가 온라인 상태일 때만 실행)"""
+        if self.write_coalescer is not None:
+            self.write_coalescer.set(path, new_value)
+        else:
+            self._write_component(path, new_value)
+
+    def _write_component(self, path: tuple[str, ...], new_value: Union[str, float]):
         if self.dv.isOnline():
             component = self.get_component(path)
             if component is not None:
                 # override
                 # self.states.set_state(path, new_value)
                 component.value = new_value
-                self.log_debug(f"set_state() {component=} {new_value=}")
+                self.log_debug("set_state() component=%r new_value=%r", component, new_value)
 
     def _clamp_and_set(self, path, val: float):
         """값을 MIN/MAX 범위로 클램프한 뒤 상태 설정"""
@@ -214,29 +307,29 @@ class BssController(CommonLogger):
         try:
             return float(val)
         except (ValueError, TypeError) as e:
-            self.log_debug(f"check_val_convert_float() : cannot convert {val=} {e=}")
+            self.log_debug("check_val_convert_float() : cannot convert val=%r e=%r", val, e)
             return None
 
     def vol_up(self, path):
         """음량 증가: 현재값에 단위값을 더하고 범위 내 값으로 제한"""
         val_db = self.check_val_convert_float(self.states.get_state(path))
         if val_db is not None:
-            self.log_debug(f"vol_up() : {path=} old {val_db=}")
+            self.log_debug("vol_up() : path=%r old val_db=%r", path, val_db)
             val_db = float(round(val_db + self.UNIT_VAL))
             self._clamp_and_set(path, val_db)
 
     def vol_down(self, path):
         """음량 감소: 현재값에서 단위값을 빼고 범위 내 값으로 제한"""
-        self.log_debug(f"vol_down() : {path=}")
+        self.log_debug("vol_down() : path=%r", path)
         val_db = self.check_val_convert_float(self.states.get_state(path))
         if val_db is not None:
-            self.log_debug(f"vol_down() : {path=} old {val_db=}")
+            self.log_debug("vol_down() : path=%r old val_db=%r", path, val_db)
             val_db = float(round(val_db - self.UNIT_VAL))
             self._clamp_and_set(path, val_db)
 
     def set_vol(self, path, val: float):
         """음량을 특정값으로 설정: 범위를 벗어난 값은 MIN/MAX 값으로 제한"""
-        self.log_debug(f"set_vol() : {path=} {val=}")
+        self.log_debug("set_vol() : path=%r val=%r", path, val)
         if val is not None:
             val = float(round(val))
             self._clamp_and_set(path, val)
@@ -1,9 +1,14 @@
-# 마지막 수정일 : 20260625
+# 마지막 수정일 : 20261018
+import functools
+
 from lib.button_handler import ButtonHandler, LevelHandler
 from lib.tp import (
+    DebugFlags,
     tp_add_watcher,
     tp_add_watcher_level,
     tp_add_watcher_level_ss,
+    tp_add_watcher_range,
+    tp_notify,
 )
 
 
@@ -13,6 +18,7 @@ class ButtonDebugFlags:
 
 
 _button_handlers = {}
+_port_routers = {}  # (tp, port) → PortRouter
 
 
 class ButtonGroup(list):
@@ -22,6 +28,42 @@ class ButtonGroup(list):
         return self
 
 
+class PortRouter:
+    """(tp, port) 하나의 버튼 이벤트 라우터 : 포트의 모든 버튼에 dispatch 하나를 등록하고 이벤트 경로 dict 로 ButtonHandler 찾기"""
+
+    def __init__(self, tp, port):
+        self.tp = tp
+        self.port = port
+        self.routes = {}  # 버튼 번호 → ButtonHandler
+        self._by_path = {}  # evt.path("port/{port}/button/{button}") → ButtonHandler, bind 시점에 작성
+
+    def dispatch(self, evt):
+        handler = self._by_path.get(evt.path)
+        if DebugFlags.debug_tp_add_notification:
+            tp_notify(evt)
+        if handler is not None:
+            handler.handle_event(evt)
+
+    def bind(self, buttons):
+        """
+        아직 워처가 없는 버튼만 한 번에 워처 등록 후 ButtonHandler 생성 (get_button 으로 이미 등록된 버튼은 기존 핸들러 사용)
+        buttons 와 같은 순서의 핸들러 목록 반환, 워처 등록에 실패한 버튼은 None
+        """
+        new_buttons = [button for button in dict.fromkeys(buttons) if _button_key(self.tp, self.port, button) not in _button_handlers]
+        if new_buttons:
+            for button in tp_add_watcher_range(self.tp, self.port, new_buttons, self.dispatch) or ():
+                handler = _button_handlers[_button_key(self.tp, self.port, button)] = self.routes[button] = ButtonHandler()
+                self._by_path[f"port/{self.port}/button/{button}"] = handler
+        return [_button_handlers.get(_button_key(self.tp, self.port, button)) for button in buttons]
+
+
+def get_port_router(tp, port):
+    router = _port_routers.get((tp, port))
+    if router is None:
+        router = _port_routers[(tp, port)] = PortRouter(tp, port)
+    return router
+
+
 def add_button_set_debug_flag(
     debug_add_button=False,
     debug_add_level=False,
@@ -84,9 +126,9 @@ def add_btn_ss(tp_list, port, button, action, callback):
     return add_button_ss(tp_list, port, button, action, callback)
 
 
-def add_level(tp, port, level, callback, debounce_ms=100):
-    """LevelHandler 생성 및 레벨 변화 감지 등록 (debounce_ms로 불필요한 동작 필터링)"""
-    level_handler = LevelHandler(init_handler=callback, debounce_ms=debounce_ms)
+def add_level(tp, port, level, callback, debounce_ms=100, mode="debounce"):
+    """LevelHandler 생성 및 레벨 변화 감지 등록 (debounce_ms로 불필요한 동작 필터링, mode="throttle" 이면 드래그 중에도 갱신)"""
+    level_handler = LevelHandler(init_handler=callback, debounce_ms=debounce_ms, mode=mode)
     tp_add_watcher_level(tp, port, level, level_handler.handle_event)
     if ButtonDebugFlags.debug_add_level:
         button_log_debug(f"add_level() {tp.id} {port=} {level=}")
@@ -94,14 +136,14 @@ def add_level(tp, port, level, callback, debounce_ms=100):
 
 
 # 별칭 함수
-def add_lvl(tp, port, level, callback, debounce_ms=100):
+def add_lvl(tp, port, level, callback, debounce_ms=100, mode="debounce"):
     """LevelHandler 생성 및 레벨 변화 감지 등록 (debounce_ms로 불필요한 동작 필터링)"""
-    return add_level(tp, port, level, callback, debounce_ms)
+    return add_level(tp, port, level, callback, debounce_ms, mode)
 
 
-def add_level_ss(tp_list, port, level, callback, debounce_ms=100):
+def add_level_ss(tp_list, port, level, callback, debounce_ms=100, mode="debounce"):
     """여러 터치패널(tp_list)에 동시에 동일한 레벨 핸들러 등록"""
-    level_handler = LevelHandler(init_handler=callback, debounce_ms=debounce_ms)
+    level_handler = LevelHandler(init_handler=callback, debounce_ms=debounce_ms, mode=mode)
     tp_add_watcher_level_ss(tp_list, port, level, level_handler.handle_event)
     if ButtonDebugFlags.debug_add_level:
         button_log_debug(f"add_level_ss() {[tp.id for tp in tp_list]} {port=} {level=}")
@@ -109,5 +151,33 @@ def add_level_ss(tp_list, port, level, callback, debounce_ms=100):
 
 
 # 별칭 함수
-def add_lvl_ss(tp_list, port, level, callback, debounce_ms=100):
-    return add_level_ss(tp_list, port, level, callback, debounce_ms)
+def add_lvl_ss(tp_list, port, level, callback, debounce_ms=100, mode="debounce"):
+    return add_level_ss(tp_list, port, level, callback, debounce_ms, mode)
+
+
+def bind_range(tp_list, port, buttons, action, callback):
+    """
+    여러 버튼(range/list)에 한 번에 핸들러 등록 : callback(idx) 호출, idx 는 buttons 안에서의 순번(0부터)
+    예) bind_range(TP_LIST, 1, range(101, 149), "push", lambda idx: select_input(idx))
+    포트마다 라우터 하나가 버튼 번호로 이벤트를 전달 (버튼별 add_button 보다 등록/이벤트 처리 비용이 적음)
+    """
+    if not isinstance(tp_list, (list, tuple)):
+        tp_list = (tp_list,)
+    buttons = tuple(buttons)
+    callbacks = [functools.partial(callback, idx) for idx in range(len(buttons))]
+    handlers = ButtonGroup()
+    for tp in tp_list:
+        for handler, idx_callback in zip(get_port_router(tp, port).bind(buttons), callbacks):
+            if handler is None:
+                continue
+            handler.on(action, idx_callback)
+            handlers.append(handler)
+    if ButtonDebugFlags.debug_add_button:
+        button_log_debug(f"bind_range() {[tp.id for tp in tp_list]} {port=} buttons={len(buttons)} {action=}")
+    return handlers
+
+
+# 별칭 함수
+def bind_array(tp_list, port, buttons, action, callback):
+    """버튼 번호 목록(buttons)에 한 번에 핸들러 등록 : callback(idx)"""
+    return bind_range(tp_list, port, buttons, action, callback)
@@ -1,26 +1,35 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import threading
 
 from lib.event_manager import EventManager
-from lib.utility import debounce, run_thread
+from lib.scheduler import call_later, cancel_call
+from lib.utility import debounce, throttle
 
 
 def log_error(message):
     print(f"buttonhandler (ERROR) -- {message}")
 
 
+# 반복 가속 곡선 예시 : (반복 횟수 이상, 간격(초), 단계 크기) 구간. 길게 누를수록 빠르고 크게 변경
+REPEAT_CURVE_RAMP = ((0, 0.3, 1), (5, 0.2, 2), (15, 0.1, 4))
+
+
 class ButtonHandler(EventManager):
-    def __init__(self, hold_time=30.0, repeat_interval=0.3, trigger_release_on_hold=False, init_action=None, init_handler=None):
+    def __init__(self, hold_time=30.0, repeat_interval=0.3, trigger_release_on_hold=False, init_action=None, init_handler=None, repeat_curve=None):
         super().__init__("push", "release", "hold", "repeat")
         self.hold_time = hold_time  # 홀드 판정 시간(초)
         self.repeat_interval = repeat_interval  # 반복 이벤트 간격(초)
+        # 반복 가속 곡선 : ((반복 횟수 이상, 간격(초), 단계 크기), ...) 오름차순, None 이면 repeat_interval 고정
+        self.repeat_curve = repeat_curve
+        self.repeat_count = 0  # 이번 누름에서 발생한 반복 이벤트 수 (repeat 핸들러에서 참조)
+        self.repeat_step = 1  # 현재 가속 단계의 변경 크기 (repeat 핸들러에서 참조)
         self._is_pushed = False  # 현재 버튼 누름 상태
         self._is_hold = False  # 홀드 상태 플래그
         self.trigger_release_on_hold = trigger_release_on_hold  # 홀드 중 릴리즈 이벤트 발생 여부
-        self._thread_hold: threading.Thread | None = None  # 홀드 감지 스레드
-        self._thread_repeat: threading.Thread | None = None  # 반복 이벤트 스레드
-        self._event_hold = threading.Event()  # 홀드 스레드 종료 신호
-        self._event_repeat = threading.Event()  # 반복 스레드 종료 신호
+        self._press = 0  # 누를 때마다 증가, 이전 누름의 예약 실행 무시용
+        self._hold_call = None  # 홀드 판정 예약 (공유 타이머)
+        self._repeat_call = None  # 다음 반복 이벤트 예약 (공유 타이머)
+        self._lock = threading.Lock()
         self.init(init_action, init_handler)
 
     def init(self, init_action=None, init_handler=None):
@@ -28,30 +37,48 @@ class ButtonHandler(EventManager):
         if init_action and init_handler:
             self.on(init_action, init_handler)
 
-    def start_hold(self):
-        """hold_time 동안 버튼이 눌려있으면 홀드 이벤트 발생"""
-        if not self._event_hold.wait(self.hold_time):
-            if self._is_pushed and not self._is_hold:
-                self._is_hold = True
-                try:
-                    # emit: hold()
-                    self.emit("hold")
-                except Exception as e:
-                    log_error(f"start_hold() : emit error {e=}")
-
-    def start_repeat(self):
-        """버튼 누름 상태에서 repeat_interval 간격으로 반복 이벤트 발생"""
-        for _ in range(100):
-            if not self._is_pushed or self._event_repeat.is_set():
-                break
-            if self._event_repeat.wait(self.repeat_interval):
-                break
-            try:
-                # emit: repeat()
-                self.emit("repeat")
-            except Exception as e:
-                log_error(f"start_repeat() : emit error {e=}")
+    def _repeat_stage(self, count):
+        # 반복 횟수에 해당하는 (간격, 단계 크기)
+        if not self.repeat_curve:
+            return self.repeat_interval, 1
+        interval, step = self.repeat_interval, 1
+        for min_count, stage_interval, stage_step in self.repeat_curve:
+            if count < min_count:
                 break
+            interval, step = stage_interval, stage_step
+        return interval, step
+
+    def start_hold(self, press):
+        """hold_time 동안 버튼이 눌려있으면 홀드 이벤트 발생 (공유 타이머에서 호출)"""
+        with self._lock:
+            if press != self._press or not self._is_pushed or self._is_hold:
+                return
+            self._is_hold = True
+            self._hold_call = None
+        try:
+            # emit: hold()
+            self.emit("hold")
+        except Exception as e:
+            log_error(f"start_hold() : emit error {e=}")
+
+    def start_repeat(self, press):
+        """버튼 누름 상태에서 가속 곡선(또는 repeat_interval) 간격으로 반복 이벤트 발생 (공유 타이머에서 호출)"""
+        with self._lock:
+            if press != self._press or not self._is_pushed:
+                return
+            self.repeat_count += 1
+            _, self.repeat_step = self._repeat_stage(self.repeat_count - 1)
+            self._repeat_call = None
+        try:
+            # emit: repeat()
+            self.emit("repeat")
+        except Exception as e:
+            log_error(f"start_repeat() : emit error {e=}")
+            return
+        with self._lock:
+            if press == self._press and self._is_pushed:
+                interval, _ = self._repeat_stage(self.repeat_count)
+                self._repeat_call = call_later(interval, self.start_repeat, press)
 
     def on(self, action, handler):
         try:
@@ -100,37 +127,61 @@ class ButtonHandler(EventManager):
 
     def handle_event(self, evt):
         if evt.value:  # 버튼 눌림 (True)
-            self._is_pushed = True
-            self._is_hold = False
-            self._event_repeat.clear()
-            self._event_hold.clear()
+            with self._lock:
+                self._press += 1
+                press = self._press
+                self._is_pushed = True
+                self._is_hold = False
+                self.repeat_count = 0
+                self._cancel_calls()
             # emit: push()
             self.emit("push")
-            if "repeat" in self.actions and self.actions["repeat"]:
-                self._thread_repeat = run_thread(self._thread_repeat, self.start_repeat)
-            if "hold" in self.actions and self.actions["hold"]:
-                self._thread_hold = run_thread(self._thread_hold, self.start_hold)
+            with self._lock:
+                if press != self._press or not self._is_pushed:
+                    return
+                if "repeat" in self.actions and self.actions["repeat"]:
+                    interval, self.repeat_step = self._repeat_stage(0)
+                    self._repeat_call = call_later(interval, self.start_repeat, press)
+                if "hold" in self.actions and self.actions["hold"]:
+                    self._hold_call = call_later(self.hold_time, self.start_hold, press)
         else:  # 버튼 뗌 (False)
-            self._is_pushed = False
-            self._event_repeat.set()  # 반복 스레드 종료 신호
-            self._event_hold.set()  # 홀드 스레드 종료 신호
+            with self._lock:
+                self._is_pushed = False
+                self._cancel_calls()  # 예약된 반복/홀드 취소
+                is_hold = self._is_hold
+                self._is_hold = False
             # 홀드 상태가 아니거나 trigger_release_on_hold 설정이 True이면 릴리즈 이벤트 발생
             # (홀드 중에 버튼을 뗄 때도 릴리즈 이벤트를 발생시킬지 결정)
-            if not self._is_hold or self.trigger_release_on_hold:
+            if not is_hold or self.trigger_release_on_hold:
                 # emit: release()
                 self.emit("release")
-            self._is_hold = False
+
+    def _cancel_calls(self):
+        # 락 안에서 호출
+        cancel_call(self._repeat_call)
+        cancel_call(self._hold_call)
+        self._repeat_call = None
+        self._hold_call = None
 
 
 class LevelHandler(EventManager):
-    # 경고 -- debounce_ms는 초기화 중에 설정되며 이후에는 변경사항이 적용되지 않습니다
-    def __init__(self, init_handler=None, debounce_ms=100):
+    # 경고 -- debounce_ms, mode는 초기화 중에 설정되며 이후에는 변경사항이 적용되지 않습니다
+    def __init__(self, init_handler=None, debounce_ms=100, mode="debounce"):
         super().__init__("level")
         self.debounce_ms = debounce_ms
+        self.mode = mode
+
+        if mode == "throttle":
+            # 드래그 중에도 debounce_ms 마다 최신 값 발생, 손을 떼면 마지막 값 발생
+            limiter = throttle(self.debounce_ms)
+        elif mode == "debounce":
+            # 과도한 이벤트 발생을 방지하기 위해 debounce 적용
+            # debounce_ms 시간 동안 동일한 신호가 계속 들어오면 마지막 신호만 발생
+            limiter = debounce(self.debounce_ms)
+        else:
+            raise ValueError(f"mode must be 'debounce' or 'throttle', got {mode}")
 
-        # 과도한 이벤트 발생을 방지하기 위해 debounce 적용
-        # debounce_ms 시간 동안 동일한 신호가 계속 들어오면 마지막 신호만 발생
-        @debounce(self.debounce_ms)
+        @limiter
         def debounced_emit(value):
             self.emit("level", value)
 
@@ -140,6 +191,6 @@ class LevelHandler(EventManager):
             self.on("level", init_handler)
 
     def handle_event(self, evt):
-        # 이벤트 값을 정수로 변환하여 debounce된 이벤트 발생
+        # 이벤트 값을 정수로 변환하여 debounce/throttle 된 이벤트 발생
         value = int(evt.value)
         self.debounced_emit(value)
@@ -0,0 +1,253 @@
+# 마지막 수정일 : 20261018
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from lib.utility import CommonLogger
+
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # 대기열이 가득 차면 가장 오래된 이벤트 폐기
+OVERFLOW_BLOCK = "block"  # 대기열에 자리가 날 때까지 emit 호출 스레드 대기 (block_timeout 초과시 새 이벤트 폐기)
+OVERFLOW_COALESCE_LATEST = "coalesce_latest"  # 같은 액션의 대기 중인 이벤트를 최신 인자로 교체
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK, OVERFLOW_COALESCE_LATEST)
+
+
+class DispatchQueue:
+    """이벤트 발생원 하나(EventManager 또는 그 액션 하나)의 대기열 : 한 번에 한 워커만 처리하므로 발생 순서대로 실행"""
+
+    def __init__(
+        self,
+        dispatcher,
+        name: str,
+        runner: Callable,
+        max_queue: int = 256,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        block_timeout: float = 1.0,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow}")
+        if max_queue <= 0:
+            raise ValueError(f"max_queue must be a positive number, got {max_queue}")
+        self.dispatcher = dispatcher
+        self.name = name
+        self.runner = runner  # runner(action, handlers, args, kwargs)
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._events = deque()  # [action, handlers, args, kwargs, 대기열 진입 시각]
+        self._pending = {}  # coalesce_latest : 액션 → 아직 실행되지 않은 이벤트
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._scheduled = False
+        self.closed = False
+        self.emitted_count = 0
+        self.processed_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+        self.max_depth = 0
+        self.wait_avg = 0.0  # 대기열 대기 시간 평균(초, EWMA)
+        self.wait_max = 0.0
+        self.run_avg = 0.0  # 핸들러 실행 시간 평균(초, EWMA)
+        self.run_max = 0.0
+
+    def put(self, action, handlers, args, kwargs):
+        schedule = False
+        with self._lock:
+            if self.closed:
+                return
+            self.emitted_count += 1
+            if self.overflow == OVERFLOW_COALESCE_LATEST:
+                entry = self._pending.get(action)
+                if entry is not None:
+                    entry[1], entry[2], entry[3] = handlers, args, kwargs
+                    self.coalesced_count += 1
+                    return
+            if len(self._events) >= self.max_queue and not self._make_room():
+                self.dropped_count += 1
+                return
+            entry = [action, handlers, args, kwargs, time.monotonic()]
+            self._events.append(entry)
+            if self.overflow == OVERFLOW_COALESCE_LATEST:
+                self._pending[action] = entry
+            if len(self._events) > self.max_depth:
+                self.max_depth = len(self._events)
+            if not self._scheduled:
+                self._scheduled = schedule = True
+        if schedule:
+            self.dispatcher._schedule(self)
+
+    def _make_room(self) -> bool:
+        # 락 안에서 호출 : 대기열이 가득 찼을 때 정책에 따라 자리 확보 (False 면 새 이벤트 폐기)
+        if self.overflow == OVERFLOW_BLOCK and not self.dispatcher.is_worker_thread():
+            # 워커 스레드가 자기 대기열에 emit 하는 경우는 교착 방지를 위해 오래된 이벤트 폐기
+            deadline = time.monotonic() + self.block_timeout
+            while len(self._events) >= self.max_queue and not self.closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_full.wait(remaining)
+            return not self.closed
+        oldest = self._events.popleft()
+        if self._pending.get(oldest[0]) is oldest:
+            del self._pending[oldest[0]]
+        self.dropped_count += 1
+        return True
+
+    def _drain(self, batch: int):
+        # 워커 스레드에서 호출 : 최대 batch 개 처리 후 남은 이벤트가 있으면 다시 준비 목록 뒤로 (다른 발생원과 공평하게)
+        for _ in range(batch):
+            with self._lock:
+                if not self._events:
+                    self._scheduled = False
+                    return
+                entry = self._events.popleft()
+                if self._pending.get(entry[0]) is entry:
+                    del self._pending[entry[0]]
+                self._not_full.notify()
+            action, handlers, args, kwargs, queued_at = entry
+            started = time.monotonic()
+            try:
+                self.runner(action, handlers, args, kwargs)
+            finally:
+                finished = time.monotonic()
+                self._record(started - queued_at, finished - started)
+        with self._lock:
+            if not self._events:
+                self._scheduled = False
+                return
+        self.dispatcher._schedule(self)
+
+    def _record(self, wait: float, run: float):
+        with self._lock:
+            self.processed_count += 1
+            self.wait_avg = self.wait_avg * 0.875 + wait * 0.125
+            self.run_avg = self.run_avg * 0.875 + run * 0.125
+            if wait > self.wait_max:
+                self.wait_max = wait
+            if run > self.run_max:
+                self.run_max = run
+
+    def depth(self) -> int:
+        return len(self._events)
+
+    def close(self):
+        # 대기 중인 이벤트 폐기 및 block 대기 해제
+        with self._lock:
+            self.closed = True
+            self._events.clear()
+            self._pending.clear()
+            self._not_full.notify_all()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "depth": len(self._events),
+                "max_depth": self.max_depth,
+                "overflow": self.overflow,
+                "emitted": self.emitted_count,
+                "processed": self.processed_count,
+                "dropped": self.dropped_count,
+                "coalesced": self.coalesced_count,
+                "wait_avg": self.wait_avg,
+                "wait_max": self.wait_max,
+                "run_avg": self.run_avg,
+                "run_max": self.run_max,
+            }
+
+
+class EventDispatcher(CommonLogger):
+    """여러 EventManager 가 공유하는 워커 풀 : 발생원별 대기열을 준비된 순서대로 처리"""
+
+    def __init__(self, workers: int = 4, batch: int = 32, name: str = "EventDispatcher"):
+        if workers <= 0:
+            raise ValueError(f"workers must be a positive number, got {workers}")
+        self.name = name
+        self.workers = workers
+        self.batch = batch  # 워커가 한 대기열에서 연속으로 처리할 최대 이벤트 수
+        self._ready = deque()
+        self._cond = threading.Condition()
+        self._threads = []
+        self._worker_local = threading.local()
+        self._queues = []
+        self._stopped = False
+
+    def create_queue(self, name: str, runner: Callable, max_queue: int = 256, overflow: str = OVERFLOW_DROP_OLDEST, block_timeout: float = 1.0):
+        queue = DispatchQueue(self, name, runner, max_queue=max_queue, overflow=overflow, block_timeout=block_timeout)
+        with self._cond:
+            self._queues.append(queue)
+        self._start()
+        return queue
+
+    def remove_queue(self, queue: DispatchQueue):
+        queue.close()
+        with self._cond:
+            if queue in self._queues:
+                self._queues.remove(queue)
+
+    def is_worker_thread(self) -> bool:
+        return getattr(self._worker_local, "worker", False)
+
+    def _start(self):
+        with self._cond:
+            if self._threads or self._stopped:
+                return
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"{self.name}-{i}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+    def _schedule(self, queue: DispatchQueue):
+        with self._cond:
+            self._ready.append(queue)
+            self._cond.notify()
+
+    def _worker(self):
+        self._worker_local.worker = True
+        while True:
+            with self._cond:
+                while not self._ready and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                queue = self._ready.popleft()
+            try:
+                queue._drain(self.batch)
+            except Exception as e:
+                self.log_error(f"_worker() queue={queue.name} {e=}")
+
+    def depth(self) -> int:
+        # 전체 대기 이벤트 수
+        with self._cond:
+            queues = list(self._queues)
+        return sum(queue.depth() for queue in queues)
+
+    def stats(self) -> dict:
+        with self._cond:
+            queues = list(self._queues)
+        return {queue.name: queue.stats() for queue in queues}
+
+    def shutdown(self):
+        with self._cond:
+            self._stopped = True
+            queues = list(self._queues)
+            self._ready.clear()
+            self._cond.notify_all()
+        for queue in queues:
+            queue.close()
+        current = threading.current_thread()
+        for thread in self._threads:
+            if thread.is_alive() and thread is not current:
+                thread.join()
+
+
+_default_dispatcher = None
+_default_dispatcher_lock = threading.Lock()
+
+
+def get_default_dispatcher() -> EventDispatcher:
+    # 따로 지정하지 않은 EventManager 들이 함께 사용하는 워커 풀
+    global _default_dispatcher
+    with _default_dispatcher_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = EventDispatcher()
+        return _default_dispatcher
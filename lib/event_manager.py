@@ -1,17 +1,49 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import threading
+import time
 
+from lib.event_dispatcher import OVERFLOW_DROP_OLDEST, get_default_dispatcher
+from lib.event_pattern import EventPatternTrie
+from lib.event_profiler import EventProfiler
 from lib.utility import handler_loc
 
 
 class EventManagerDebugFlags:
     debug = False
+    profiler = None  # EventProfiler : 설정되어 있으면 모든 핸들러 실행 시간 측정
+
+
+def enable_event_profiling(slow_ms=50.0, slow_log_interval=5.0):
+    """실행 중에 핸들러 실행 시간 측정 시작 (이미 측정 중이면 기존 통계 유지하고 기준만 변경)"""
+    profiler = EventManagerDebugFlags.profiler
+    if profiler is None:
+        profiler = EventProfiler(slow_ms=slow_ms, slow_log_interval=slow_log_interval)
+    profiler.slow_ms = slow_ms
+    profiler.slow_log_interval = slow_log_interval
+    EventManagerDebugFlags.profiler = profiler
+    return profiler
+
+
+def disable_event_profiling():
+    # 측정 중지 (수집된 통계가 담긴 EventProfiler 반환)
+    profiler = EventManagerDebugFlags.profiler
+    EventManagerDebugFlags.profiler = None
+    return profiler
+
+
+def event_profile_report(n=20, sort_by="total"):
+    # 상위 n 개 핸들러 리포트 출력 (측정 중이 아니면 빈 목록)
+    profiler = EventManagerDebugFlags.profiler
+    return profiler.report(n, sort_by) if profiler else []
 
 
 class EventManager:
     def __init__(self, *initial_actions):
-        self.actions = {event: [] for event in initial_actions}
+        # 핸들러 목록은 튜플로 보관하고 변경 시 새 튜플로 교체 (emit 은 락 없이 읽기만 함)
+        self.actions = {event: () for event in initial_actions}
         self._actions_lock = threading.RLock()
+        self._dispatch_queues = {}  # 비동기 처리 대기열 : 액션 → DispatchQueue (None 키는 전체 액션)
+        self._patterns = None  # 패턴 구독 트라이 (EventPatternTrie, 없으면 None)
 
     def evt_log_debug(self, message):
         if EventManagerDebugFlags.debug:
@@ -30,7 +62,7 @@ class EventManager:
         try:
             with self._actions_lock:
                 if action not in self.actions:
-                    self.actions[action] = []
+                    self.actions[action] = ()
                 else:
                     self.evt_log_warn(f"add_event_action() -- event already exists {action=}")
         except Exception as e:
@@ -48,36 +80,121 @@ class EventManager:
             with self._actions_lock:
                 if action not in self.actions:
                     self.evt_log_debug(f"on() -- event does not exist, adding {action=}")
-                    self.actions[action] = []
-                self.actions[action].append(handler)
-            self.evt_log_debug(f"on() {action=} handler={handler_loc(handler)}")
+                    self.actions[action] = ()
+                self.actions[action] = self.actions[action] + (handler,)
+            # 핸들러 위치는 로그를 출력할 때만 계산
+            if EventManagerDebugFlags.debug:
+                self.evt_log_debug(f"on() {action=} handler={handler_loc(handler)}")
         except Exception as e:
             self.evt_log_error(f"on() {action=} handler={handler_loc(handler)} {e=}")
 
+    def on_pattern(self, pattern, handler):
+        """
+        패턴과 일치하는 모든 액션에 핸들러 등록. handler(action, *args, **kwargs) 형태로 호출
+        "*" 는 세그먼트 하나, 끝의 "**" 는 남은 세그먼트 전체와 일치 (예: "i.*.mix", "/ch/*/fader", "a.1.**")
+        """
+        try:
+            with self._actions_lock:
+                entries = self._patterns.entries if self._patterns else ()
+                self._patterns = EventPatternTrie(entries + ((pattern, handler),))
+            if EventManagerDebugFlags.debug:
+                self.evt_log_debug(f"on_pattern() {pattern=} handler={handler_loc(handler)}")
+        except Exception as e:
+            self.evt_log_error(f"on_pattern() {pattern=} handler={handler_loc(handler)} {e=}")
+
+    def remove_pattern_handler(self, pattern, handler):
+        try:
+            with self._actions_lock:
+                entries = list(self._patterns.entries if self._patterns else ())
+                entries.remove((pattern, handler))
+                self._patterns = EventPatternTrie(entries) if entries else None
+        except Exception as e:
+            self.evt_log_error(f"remove_pattern_handler() {pattern=} handler={handler_loc(handler)} {e=}")
+
     def remove_event_handler(self, action, handler):
         try:
             with self._actions_lock:
-                self.actions[action].remove(handler)
+                handlers = list(self.actions[action])
+                handlers.remove(handler)
+                self.actions[action] = tuple(handlers)
         except Exception as e:
             self.evt_log_error(f"remove_event_handler() {action=} handler={handler_loc(handler)} {e=}")
 
     def emit(self, action, *args, **kwargs):
         try:
-            with self._actions_lock:
-                if action not in self.actions:
-                    self.evt_log_info(f"emit() -- event does not exist {action=}")
+            handlers = self.actions.get(action)
+            if self._patterns is not None:
+                matched = self._patterns.match(action)
+                if matched:
+                    handlers = matched if handlers is None else handlers + matched
+            if handlers is None:
+                self.evt_log_info(f"emit() -- event does not exist {action=}")
+                return
+            if EventManagerDebugFlags.debug:
+                self.evt_log_debug(f"emit() {action=} {args=} {kwargs=}")
+            if self._dispatch_queues:
+                queue = self._dispatch_queues.get(action) or self._dispatch_queues.get(None)
+                if queue is not None:
+                    queue.put(action, handlers, args, kwargs)
                     return
-                handlers = list(self.actions[action])
-            self.evt_log_debug(f"emit() {action=} {args=} {kwargs=}")
-            for handler in handlers:
-                try:
-                    handler(*args, **kwargs)
-                except Exception as e:
-                    self.evt_log_error(f"emit() {action=} handler={handler_loc(handler)} {e=}")
+            self._run_handlers(action, handlers, args, kwargs)
         except Exception as e:
             self.evt_log_error(f"emit() {action=} {e=}")
             raise
 
+    def _run_handlers(self, action, handlers, args, kwargs):
+        profiler = EventManagerDebugFlags.profiler
+        if profiler is not None:
+            self._run_handlers_profiled(profiler, action, handlers, args, kwargs)
+            return
+        for handler in handlers:
+            try:
+                handler(*args, **kwargs)
+            except Exception as e:
+                self.evt_log_error(f"emit() {action=} handler={handler_loc(handler)} {e=}")
+
+    def _run_handlers_profiled(self, profiler, action, handlers, args, kwargs):
+        for handler in handlers:
+            error = False
+            started = time.perf_counter()
+            try:
+                handler(*args, **kwargs)
+            except Exception as e:
+                error = True
+                self.evt_log_error(f"emit() {action=} handler={handler_loc(handler)} {e=}")
+            profiler.record(self, action, handler, time.perf_counter() - started, error)
+
+    def set_async_dispatch(self, action=None, dispatcher=None, max_queue=256, overflow=OVERFLOW_DROP_OLDEST, block_timeout=1.0):
+        """
+        emit 호출 스레드 대신 공유 워커 풀에서 핸들러 실행 (느린 핸들러가 수신 루프 등을 막지 않도록)
+        action 이 None 이면 모든 액션을 하나의 대기열로(액션 간 순서 유지), 지정하면 해당 액션만 별도 대기열로 처리
+        overflow : "drop_oldest", "block", "coalesce_latest"
+        """
+        dispatcher = dispatcher or get_default_dispatcher()
+        queue_name = f"{self.__class__.__name__}@{id(self):x}" + ("" if action is None else f".{action}")
+        queue = dispatcher.create_queue(queue_name, self._run_handlers, max_queue=max_queue, overflow=overflow, block_timeout=block_timeout)
+        with self._actions_lock:
+            old = self._dispatch_queues.get(action)
+            queues = dict(self._dispatch_queues)
+            queues[action] = queue
+            self._dispatch_queues = queues
+        if old is not None:
+            old.dispatcher.remove_queue(old)
+        return queue
+
+    def clear_async_dispatch(self, action=None):
+        # 비동기 처리 해제 (대기 중인 이벤트는 폐기)
+        with self._actions_lock:
+            queues = dict(self._dispatch_queues)
+            old = queues.pop(action, None)
+            self._dispatch_queues = queues
+        if old is not None:
+            old.dispatcher.remove_queue(old)
+
+    def dispatch_stats(self) -> dict:
+        # 비동기 대기열별 깊이, 폐기/병합 수, 대기 및 핸들러 실행 시간
+        return {action: queue.stats() for action, queue in self._dispatch_queues.items()}
+
     def add_event_handler(self, action, handler):
         """on의 예전 메서드 이름"""
         self.on(action, handler)
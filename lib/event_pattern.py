@@ -0,0 +1,83 @@
+# 마지막 수정일 : 20261018
+# 이벤트 이름 패턴 매칭 : "i.*.mix", "/ch/*/fader", "a.1.**" 형태의 패턴을 세그먼트 트라이로 컴파일
+import functools
+
+WILDCARD = "*"  # 세그먼트 하나와 일치
+TAIL_WILDCARD = "**"  # 패턴 끝에서만 사용, 남은 세그먼트 하나 이상과 일치
+MATCH_CACHE_SIZE = 4096
+
+
+def split_action(action: str) -> list:
+    # "/" 로 시작하면 OSC 주소("/ch/01/fader"), 아니면 "." 구분("i.3.mix")
+    if action.startswith("/"):
+        return action[1:].split("/")
+    return action.split(".")
+
+
+class _Node:
+    __slots__ = ("children", "star", "handlers", "tail")
+
+    def __init__(self):
+        self.children = {}
+        self.star = None
+        self.handlers = []  # (등록 순서, 핸들러) : 여기서 끝나는 패턴
+        self.tail = []  # (등록 순서, 핸들러) : 여기서 "**" 로 끝나는 패턴
+
+
+class EventPatternTrie:
+    """(패턴, 핸들러) 목록을 한 번 컴파일한 불변 트라이. 변경 시 새로 만들어 교체하므로 매칭은 락 없이 수행"""
+
+    def __init__(self, entries=()):
+        self.entries = tuple(entries)
+        self._root = _Node()
+        self._cache = {}
+        for seq, (pattern, handler) in enumerate(self.entries):
+            self._insert(pattern, seq, handler)
+
+    def _insert(self, pattern: str, seq: int, handler):
+        segments = split_action(pattern)
+        node = self._root
+        for i, segment in enumerate(segments):
+            if segment == TAIL_WILDCARD:
+                if i != len(segments) - 1:
+                    raise ValueError(f"'{TAIL_WILDCARD}' is only allowed at the end of a pattern, got {pattern}")
+                node.tail.append((seq, handler))
+                return
+            if segment == WILDCARD:
+                if node.star is None:
+                    node.star = _Node()
+                node = node.star
+            else:
+                node = node.children.setdefault(segment, _Node())
+        node.handlers.append((seq, handler))
+
+    def _collect(self, node: _Node, segments: list, index: int, found: list):
+        if index == len(segments):
+            found.extend(node.handlers)
+            return
+        if node.tail:
+            found.extend(node.tail)
+        child = node.children.get(segments[index])
+        if child is not None:
+            self._collect(child, segments, index + 1, found)
+        if node.star is not None:
+            self._collect(node.star, segments, index + 1, found)
+
+    def match(self, action) -> tuple:
+        """action 과 일치하는 핸들러를 등록 순서대로 반환 (핸들러는 action 을 첫 인자로 받도록 묶어서 반환)"""
+        handlers = self._cache.get(action)
+        if handlers is not None:
+            return handlers
+        if not isinstance(action, str):
+            return ()
+        found = []
+        self._collect(self._root, split_action(action), 0, found)
+        found.sort(key=lambda item: item[0])
+        handlers = tuple(functools.partial(handler, action) for _, handler in found)
+        if len(self._cache) >= MATCH_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[action] = handlers
+        return handlers
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,126 @@
+# 마지막 수정일 : 20261018
+import functools
+import threading
+import time
+from bisect import bisect_left
+
+from lib.utility import CommonLogger, handler_loc
+
+# 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전체
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+
+class HandlerStats:
+    # (클래스, 액션, 핸들러) 하나의 호출 수 / 누적 시간 / 최대 시간 / 구간별 횟수
+    __slots__ = ("loc", "count", "total", "max", "errors", "histogram", "last_slow_log")
+
+    def __init__(self, loc: str):
+        self.loc = loc
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.last_slow_log = 0.0
+
+    def percentile(self, ratio: float) -> float:
+        # 히스토그램 구간 상한으로 근사한 백분위 (ms)
+        target = self.count * ratio
+        seen = 0
+        for i, n in enumerate(self.histogram):
+            seen += n
+            if n and seen >= target:
+                return HISTOGRAM_BOUNDS_MS[i] if i < len(HISTOGRAM_BOUNDS_MS) else self.max * 1000
+        return 0.0
+
+
+def _handler_key(handler):
+    # 같은 함수는 같은 항목으로 집계 (바운드 메서드/partial 은 원래 함수의 코드 객체 기준)
+    func = handler.func if isinstance(handler, functools.partial) else handler
+    return getattr(getattr(func, "__func__", func), "__code__", None) or func
+
+
+class EventProfiler(CommonLogger):
+    """EventManager 핸들러 실행 시간 측정 : 핸들러별 히스토그램, 느린 핸들러 로그, 상위 N 개 리포트"""
+
+    def __init__(self, slow_ms: float = 50.0, slow_log_interval: float = 5.0, max_entries: int = 10000):
+        self.name = "EventProfiler"
+        self.slow_ms = slow_ms  # 이 시간(ms) 이상 걸린 핸들러는 경고 로그
+        self.slow_log_interval = slow_log_interval  # 같은 핸들러의 경고 로그 최소 간격(초)
+        self.max_entries = max_entries  # 측정 항목 최대 수 (초과분은 overflow_count 로만 집계)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.overflow_count = 0
+
+    def record(self, owner, action, handler, elapsed: float, error: bool = False):
+        key = (owner.__class__.__name__, action, _handler_key(handler))
+        elapsed_ms = elapsed * 1000
+        slow = False
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self.max_entries:
+                    self.overflow_count += 1
+                    return
+                stats = self._stats[key] = HandlerStats(handler_loc(handler))
+            stats.count += 1
+            stats.total += elapsed
+            if elapsed > stats.max:
+                stats.max = elapsed
+            if error:
+                stats.errors += 1
+            stats.histogram[bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+            if elapsed_ms >= self.slow_ms:
+                now = time.monotonic()
+                if now - stats.last_slow_log >= self.slow_log_interval:
+                    stats.last_slow_log = now
+                    slow = True
+        if slow:
+            self.log_warn(f"slow handler {elapsed_ms:.1f}ms class={key[0]} {action=} handler={stats.loc}")
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.overflow_count = 0
+            self.started_at = time.monotonic()
+
+    def top(self, n: int = 20, sort_by: str = "total") -> list:
+        """누적 시간(total), 최대 시간(max), 호출 수(count), 평균(avg) 기준 상위 n 개"""
+        with self._lock:
+            items = [
+                ((key[0], key[1], stats.loc), stats.count, stats.total, stats.max, stats.errors)
+                + (stats.percentile(0.5), stats.percentile(0.95), stats.percentile(0.99), list(stats.histogram))
+                for key, stats in self._stats.items()
+            ]
+        rows = [
+            {
+                "class": key[0],
+                "action": key[1],
+                "handler": key[2],
+                "count": count,
+                "total_ms": total * 1000,
+                "avg_ms": total * 1000 / count if count else 0.0,
+                "max_ms": max_ * 1000,
+                "p50_ms": p50,
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "errors": errors,
+                "histogram": histogram,
+            }
+            for key, count, total, max_, errors, p50, p95, p99, histogram in items
+        ]
+        sort_key = {"total": "total_ms", "max": "max_ms", "count": "count", "avg": "avg_ms"}.get(sort_by, "total_ms")
+        rows.sort(key=lambda row: row[sort_key], reverse=True)
+        return rows[:n]
+
+    def report(self, n: int = 20, sort_by: str = "total") -> list:
+        # 상위 n 개를 로그로 출력하고 반환
+        rows = self.top(n, sort_by)
+        self.log_info(f"report() : top {len(rows)} by {sort_by} over {time.monotonic() - self.started_at:.0f}s")
+        for row in rows:
+            self.log_info(
+                f"  {row['total_ms']:9.1f}ms total  {row['count']:7d} calls  avg={row['avg_ms']:.2f}ms p95<={row['p95_ms']}ms max={row['max_ms']:.1f}ms"
+                f"  {row['class']} {row['action']!r} {row['handler']}"
+            )
+        return rows
@@ -0,0 +1,104 @@
+# 마지막 수정일 : 20261018
+# 음량 레벨 변환 공용 모듈 : 터치패널 0-255 ↔ dB, London 장비값 ↔ dB, 테이블 역참조
+import functools
+import math
+from bisect import bisect_left, bisect_right
+
+TP_LEVEL_MAX = 255  # 터치패널 레벨 최대값
+
+
+class LevelScale:
+    """dB 범위와 터치패널 0-255 사이의 선형 변환 (0-255 정수 구간은 미리 계산된 테이블 사용)"""
+
+    def __init__(self, min_db: float, max_db: float, tp_max: int = TP_LEVEL_MAX):
+        self.min_db = min_db
+        self.max_db = max_db
+        self.tp_max = tp_max
+        self._span = max_db - min_db
+        # 선형 변환 공식: (입력값 - 입력최소) * (출력최대 - 출력최소) / (입력최대 - 입력최소) + 출력최소
+        self._tp_to_db = tuple(x * self._span / tp_max + min_db for x in range(tp_max + 1))
+
+    def db_to_tp(self, x):
+        # dB 값을 터치패널 0-255 범위로 선형 변환
+        return (x - self.min_db) * self.tp_max / self._span
+
+    def tp_to_db(self, x):
+        # 터치패널 0-255 값을 dB 범위로 선형 변환
+        if type(x) is int and 0 <= x <= self.tp_max:
+            return self._tp_to_db[x]
+        return x * self._span / self.tp_max + self.min_db
+
+    def db_to_tp_many(self, values) -> list:
+        return [self.db_to_tp(x) for x in values]
+
+    def tp_to_db_many(self, values) -> list:
+        return [self.tp_to_db(x) for x in values]
+
+
+@functools.lru_cache(maxsize=32)
+def level_scale(min_db: float, max_db: float, tp_max: int = TP_LEVEL_MAX) -> LevelScale:
+    # 같은 범위의 LevelScale 은 하나만 만들어 재사용 (MIN/MAX 가 런타임에 바뀌어도 안전)
+    return LevelScale(min_db, max_db, tp_max)
+
+
+# SECTION : BSS London 장비값 (dB*10000, -10dB 미만은 로그 스케일)
+LONDON_LINEAR_LIMIT = -100000  # -10dB
+LONDON_TABLE_MIN_DB = -120  # 0.1dB 테이블 범위
+LONDON_TABLE_MAX_DB = 20
+
+
+def _london_db_to_value(db_value: float) -> int:
+    # -10dB 이상: 선형 변환, 미만: 로그 변환
+    return int(db_value * 10000 if db_value >= -10 else (-math.log10(abs(db_value / 10)) * 200000) - 100000)
+
+
+# 0.1dB 간격 dB → 장비값 테이블 (index = dB*10 - 최소*10)
+_LONDON_DB_TABLE = tuple(_london_db_to_value(k / 10) for k in range(LONDON_TABLE_MIN_DB * 10, LONDON_TABLE_MAX_DB * 10 + 1))
+
+
+def london_db_to_value(db_value: float) -> int:
+    # dB 값을 London 장비 컨트롤 값으로 변환 (테이블을 만든 값(k/10)과 정확히 같은 입력만 테이블 사용, 결과는 공식과 동일)
+    index = round(db_value * 10)
+    if LONDON_TABLE_MIN_DB * 10 <= index <= LONDON_TABLE_MAX_DB * 10 and db_value == index / 10:
+        return _LONDON_DB_TABLE[index - LONDON_TABLE_MIN_DB * 10]
+    return _london_db_to_value(db_value)
+
+
+def london_value_to_db(int_value: int) -> float:
+    # London 장비 컨트롤 값을 dB 값으로 변환
+    if int_value >= LONDON_LINEAR_LIMIT:
+        return float(int_value / 10000)
+    return float(-10 * (10 ** ((-int_value - 100000) / 200000)))
+
+
+def london_value_to_db_many(values) -> list:
+    # 메터 등 여러 장비값을 한 번에 dB 로 변환
+    return [london_value_to_db(v) for v in values]
+
+
+def london_db_to_value_many(values) -> list:
+    return [london_db_to_value(v) for v in values]
+
+
+# SECTION : 정렬된 테이블 역참조
+def lut_index(table, value) -> int:
+    # 정렬된 테이블에서 table[i] <= value < table[i + 1] 인 i 반환 (범위 밖은 양 끝 인덱스)
+    if value <= table[0]:
+        return 0
+    if value >= table[-1]:
+        return len(table) - 1
+    return bisect_right(table, value) - 1
+
+
+def lut_index_many(table, values) -> list:
+    return [lut_index(table, v) for v in values]
+
+
+def nearest_index(table, value) -> int:
+    # 정렬된 테이블에서 value 와 가장 가까운 값의 인덱스 (같은 거리면 작은 쪽)
+    i = lut_index(table, value)
+    if table[i] == value:
+        return bisect_left(table, value)
+    if i + 1 < len(table) and abs(table[i + 1] - value) < abs(value - table[i]):
+        return i + 1
+    return i
@@ -1,8 +1,13 @@
-# 마지막 수정일 : 20260629
-import math
+# 마지막 수정일 : 20261018
+import functools
 import threading
 from enum import IntEnum
 
+from lib.level_converter import level_scale, london_db_to_value, london_value_to_db
+from lib.london_meter import LondonMeterEngine
+from lib.london_pipeline import LondonSendQueue, LondonWritePipeline
+from lib.london_protocol import ACK, NAK, SPECIAL_CHARS, STX, LondonFrameReader, encode_frame, xor_checksum
+from lib.state_snapshot import StateSnapshot
 from lib.utility import CommonLogger
 
 MIN_VAL = -60  # 최소 값
@@ -12,25 +17,69 @@ UNIT_VAL = 1  # 단위 값2
 
 class LondonObserver:
     def __init__(self):
-        self._observers = []
+        # 옵저버 목록은 튜플로 보관하고 변경 시 통째로 교체 (notify 시 복사/락 불필요)
+        self._observers = ()  # 모든 키 (와일드카드)
+        self._key_observers = {}  # 키 → 옵저버 튜플
+        self._prefix_observers = {}  # 키 접두사(노드 주소 등) → 옵저버 튜플
+        self._prefix_lengths = ()
         self._lock = threading.Lock()
 
-    def subscribe(self, observer):
+    def subscribe(self, observer, key=None):
         with self._lock:
-            if observer not in self._observers:
-                self._observers.append(observer)
+            if key is None:
+                if observer not in self._observers:
+                    self._observers = self._observers + (observer,)
+            else:
+                key = bytes(key)
+                observers = self._key_observers.get(key, ())
+                if observer not in observers:
+                    self._key_observers[key] = observers + (observer,)
+
+    def unsubscribe(self, observer, key=None):
+        with self._lock:
+            if key is None:
+                if observer in self._observers:
+                    self._observers = tuple(o for o in self._observers if o != observer)
+            else:
+                key = bytes(key)
+                observers = tuple(o for o in self._key_observers.get(key, ()) if o != observer)
+                if observers:
+                    self._key_observers[key] = observers
+                else:
+                    self._key_observers.pop(key, None)
 
-    def unsubscribe(self, observer):
+    def subscribe_prefix(self, observer, prefix):
         with self._lock:
-            if observer in self._observers:
-                self._observers.remove(observer)
+            prefix = bytes(prefix)
+            observers = self._prefix_observers.get(prefix, ())
+            if observer not in observers:
+                self._prefix_observers[prefix] = observers + (observer,)
+            self._prefix_lengths = tuple(sorted({len(p) for p in self._prefix_observers}))
 
-    def notify(self, *args, **kwargs):
+    def unsubscribe_prefix(self, observer, prefix):
         with self._lock:
-            observers = list(self._observers)
+            prefix = bytes(prefix)
+            observers = tuple(o for o in self._prefix_observers.get(prefix, ()) if o != observer)
+            if observers:
+                self._prefix_observers[prefix] = observers
+            else:
+                self._prefix_observers.pop(prefix, None)
+            self._prefix_lengths = tuple(sorted({len(p) for p in self._prefix_observers}))
+
+    def notify(self, key, *args, **kwargs):
+        # 와일드카드 옵저버 + 해당 키 옵저버 + 해당 접두사 옵저버에게만 알림
+        observers = self._observers
+        lookup = bytes(key) if isinstance(key, (bytearray, memoryview)) else key
+        keyed = self._key_observers.get(lookup)
+        if keyed:
+            observers = observers + keyed
+        for length in self._prefix_lengths:
+            prefixed = self._prefix_observers.get(lookup[:length])
+            if prefixed:
+                observers = observers + prefixed
         for observer in observers:
             try:
-                observer(*args, **kwargs)
+                observer(key, *args, **kwargs)
             except Exception as e:
                 from lib.utility import handler_loc
                 print(f"(ERROR) - LondonObserver : notify() {handler_loc(observer)} {e=}")
@@ -38,7 +87,8 @@ class LondonObserver:
 
 class LondonState:
     def __init__(self):
-        self._states = {}
+        self._states = {}  # 구독된 키의 상태
+        self._warm = {}  # 스냅샷에서 복원되었지만 아직 구독되지 않은 키의 상태
         self._event = LondonObserver()
         self._lock = threading.Lock()
 
@@ -48,25 +98,73 @@ class LondonState:
 
     def get_state(self, key):
         with self._lock:
-            return self._states.get(key, None)
+            return self._states.get(key, self._warm.get(key))
 
     def set_state(self, key, value):
         with self._lock:
             self._states[key] = value
         self._event.notify(key, value)
 
+    def update_if_subscribed(self, key, value) -> bool:
+        # 등록된 키인 경우에만 하나의 락 안에서 확인 후 설정
+        with self._lock:
+            if key not in self._states:
+                return False
+            self._states[key] = value
+        self._event.notify(key, value)
+        return True
+
+    def reconcile_state(self, key, value) -> bool:
+        # 구독 시 초기 상태 설정 : 복원된 값이 있으면 그 값으로 구독 상태 전환 (True 반환)
+        with self._lock:
+            warm = key in self._warm
+            if warm:
+                value = self._warm.pop(key)
+            self._states[key] = value
+        self._event.notify(key, value)
+        return warm
+
     def remove_state(self, key):
         with self._lock:
             self._states.pop(key, None)
+            self._warm.pop(key, None)
+
+    def snapshot(self) -> dict:
+        # 현재 상태 사본
+        with self._lock:
+            return dict(self._states)
+
+    def restore(self, states: dict) -> list:
+        # 저장된 상태를 구독 전 값으로 보관하고 알림 (이미 구독된 키는 유지), 복원된 키 목록 반환
+        with self._lock:
+            restored = [key for key in states if key not in self._states]
+            for key in restored:
+                self._warm[key] = states[key]
+        for key in restored:
+            self._event.notify(key, states[key])
+        return restored
+
+    def drop_warm(self) -> int:
+        # 끝까지 구독되지 않은 복원 상태 폐기, 폐기한 개수 반환
+        with self._lock:
+            count = len(self._warm)
+            self._warm.clear()
+        return count
 
     def override_notify(self, key, *args, **kwargs):
         self._event.notify(key, *args, **kwargs)
 
-    def subscribe(self, observer):
-        self._event.subscribe(observer)
+    def subscribe(self, observer, key=None):
+        self._event.subscribe(observer, key)
 
-    def unsubscribe(self, observer):
-        self._event.unsubscribe(observer)
+    def unsubscribe(self, observer, key=None):
+        self._event.unsubscribe(observer, key)
+
+    def subscribe_prefix(self, observer, prefix):
+        self._event.subscribe_prefix(observer, prefix)
+
+    def unsubscribe_prefix(self, observer, prefix):
+        self._event.unsubscribe_prefix(observer, prefix)
 
 
 class LondonDev(IntEnum):
@@ -141,6 +239,145 @@ class LondonParam(IntEnum):
     R = 3
 
 
+def _in_only(formula):
+    # 입력 채널만 지정된 경우 (index_input != 0, index_output == 0)
+    return lambda i, o: formula(i) if i != 0 and o == 0 else None
+
+
+def _out_only(formula):
+    # 출력 채널만 지정된 경우 (index_input == 0, index_output != 0)
+    return lambda i, o: formula(o) if i == 0 and o != 0 else None
+
+
+def _first_of(*formulas):
+    # 조건이 겹치지 않는 공식들 중 처음으로 값이 나오는 공식 사용
+    def formula(i, o):
+        for f in formulas:
+            sv = f(i, o)
+            if sv is not None:
+                return sv
+        return None
+
+    return formula
+
+
+def _build_sv_table():
+    # (기기, 파라미터) → SV 공식 (index_input, index_output) 테이블
+    # 같은 값을 갖는 파라미터(MUTE=POLARITY_ON 등)는 기존 if/elif 순서대로 먼저 등록된 공식이 우선
+    table = {}
+
+    def add(devices, params, formula):
+        for device in devices:
+            per_device = table.setdefault(int(device), {})
+            for param in params:
+                per_device.setdefault(int(param), formula)
+
+    # LOGIC_SOURCE, LOGIC_END
+    add((LondonDev.LOGIC_SOURCE,), (LondonParam.LOGIC_SOURCE,), lambda i, o: 1)
+    add((LondonDev.LOGIC_END,), (LondonParam.LOGIC_END,), lambda i, o: 0)
+    # AUTOMIXER, MIXER: 입력 채널당 100 오프셋, 출력 채널(AUX/GROUP)
+    mixers = (LondonDev.AUTOMIXER, LondonDev.MIXER)
+    add(mixers, (LondonParam.GAIN,), _first_of(_in_only(lambda i: (i - 1) * 100), _out_only(lambda o: o + 20000 - 1)))
+    add(mixers, (LondonParam.MUTE,), _first_of(_in_only(lambda i: (i - 1) * 100 + 1), _out_only(lambda o: o + 20000)))
+    add(mixers, (LondonParam.PAN,), _in_only(lambda i: (i - 1) * 100 + 2))
+    add(mixers, (LondonParam.SOLO,), _in_only(lambda i: (i - 1) * 100 + 4))
+    add(mixers, (LondonParam.OVERRIDE,), _in_only(lambda i: (i - 1) * 100 + 5))
+    add(mixers, (LondonParam.OFF_GAIN,), _in_only(lambda i: (i - 1) * 100 + 6))
+    add(mixers, (LondonParam.AUTO,), _in_only(lambda i: (i - 1) * 100 + 7))
+    add(mixers, (LondonParam.AUX_GAIN,), _out_only(lambda o: (o - 1) * 10 + 10001))
+    add(mixers, (LondonParam.AUX,), _out_only(lambda o: (o - 1) * 10 + 10002))
+    add(mixers, (LondonParam.GROUP_GAIN,), _out_only(lambda o: (o - 1) * 10 + 11000))
+    # GROUP: 출력만 지정 시 출력 그룹, 입출력 모두 지정(또는 모두 0) 시 입출력 혼합
+    add(
+        mixers,
+        (LondonParam.GROUP,),
+        _first_of(
+            _out_only(lambda o: (o - 1) * 10 + 11001),
+            lambda i, o: (i - 1) * 100 + (o - 1) + 40 if (i != 0) == (o != 0) else None,
+        ),
+    )
+    # ROOM_COMBINE
+    room = (LondonDev.ROOM_COMBINE,)
+    add(room, (LondonParam.PARTITION,), _in_only(lambda i: i - 1))
+    add(room, (LondonParam.GROUP,), _in_only(lambda i: (i - 1) * 50 + 250))
+    add(room, (LondonParam.SOURCE_GAIN,), _in_only(lambda i: (i - 1) * 50 + 255))
+    add(room, (LondonParam.SOURCE_MUTE,), _in_only(lambda i: (i - 1) * 50 + 256))
+    add(room, (LondonParam.BGM_GAIN,), _in_only(lambda i: (i - 1) * 50 + 257))
+    add(room, (LondonParam.BGM_MUTE,), _in_only(lambda i: (i - 1) * 50 + 258))
+    add(room, (LondonParam.BGM_SELECT,), _in_only(lambda i: (i - 1) * 50 + 259))
+    add(room, (LondonParam.MASTER_GAIN,), _out_only(lambda o: (o - 1) * 50 + 252))
+    add(room, (LondonParam.MASTER_MUTE,), _out_only(lambda o: (o - 1) * 50 + 254))
+    # ROUTER, MATRIX_MIXER: 입출력 조합
+    routers = (LondonDev.ROUTER, LondonDev.MATRIX_MIXER)
+    add(routers, (LondonParam.MUTE, LondonParam.UNMUTE), lambda i, o: (i - 1) + ((o - 1) * 128))
+    add(routers, (LondonParam.GAIN,), lambda i, o: (i + 16383) + ((o - 1) * 128))
+    # N_GAIN: 입력 채널별 / 마스터
+    n_gain = (LondonDev.N_GAIN,)
+    add(
+        n_gain,
+        (LondonParam.MUTE, LondonParam.UNMUTE),
+        lambda i, o: (i - 1) + 32 if o == 0 else (97 if i == 0 else None),
+    )
+    add(n_gain, (LondonParam.GAIN,), lambda i, o: i - 1 if o == 0 else (96 if i == 0 else None))
+    # GAIN: 단일 게인 제어 기기 (index_input == 1, index_output == 0)
+    gain = (LondonDev.GAIN,)
+    for params, sv in (
+        ((LondonParam.GAIN,), 0),
+        ((LondonParam.MUTE, LondonParam.UNMUTE), 1),
+        ((LondonParam.POLARITY_ON, LondonParam.POLARITY_OFF), 2),
+        ((LondonParam.BUMP_UP_ON, LondonParam.BUMP_UP_OFF), 3),
+        ((LondonParam.BUMP_DOWN_ON, LondonParam.BUMP_DOWN_OFF), 4),
+    ):
+        add(gain, params, lambda i, o, sv=sv: sv if o == 0 and i == 1 else None)
+    # INPUT_CARD: 채널당 6 오프셋
+    input_card = (LondonDev.INPUT_CARD,)
+    add(input_card, (LondonParam.GAIN,), lambda i, o: {1: 4, 2: 10, 3: 16, 4: 22}.get(i))
+    add(input_card, (LondonParam.METER,), lambda i, o: (i - 1) * 6)
+    add(input_card, (LondonParam.REFERENCE,), lambda i, o: (i - 1) * 6 + 1)
+    add(input_card, (LondonParam.ATTACK,), lambda i, o: (i - 1) * 6 + 2)
+    add(input_card, (LondonParam.RELEASED,), lambda i, o: (i - 1) * 6 + 3)
+    add(input_card, (LondonParam.PHANTOM,), lambda i, o: (i - 1) * 6 + 5)
+    # OUTPUT_CARD: 채널당 4 오프셋
+    output_card = (LondonDev.OUTPUT_CARD,)
+    add(output_card, (LondonParam.METER,), lambda i, o: (i - 1) * 4)
+    add(output_card, (LondonParam.REFERENCE,), lambda i, o: (i - 1) * 4 + 1)
+    add(output_card, (LondonParam.ATTACK,), lambda i, o: (i - 1) * 4 + 2)
+    add(output_card, (LondonParam.RELEASED,), lambda i, o: (i - 1) * 4 + 3)
+    # METER
+    add((LondonDev.METER,), (LondonParam.METER,), lambda i, o: 0)
+    return table
+
+
+# 파라미터와 무관하게 SV 가 정해지는 기기
+_SV_DEVICE_FORMULAS = {
+    int(LondonDev.SOURCE_SELECTOR): lambda i, o: 0,
+    int(LondonDev.SOURCE_MATRIX): lambda i, o: i - 1,
+}
+_SV_TABLE = _build_sv_table()
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def london_sv(index_device, index_input, index_output, index_param) -> bytes | None:
+    # 기기, 입출력, 파라미터 인덱스를 장비 SV(Sub-Verb) 2바이트 값으로 변환 (결과 캐시)
+    formula = _SV_DEVICE_FORMULAS.get(index_device)
+    if formula is None:
+        formula = _SV_TABLE.get(index_device, {}).get(index_param)
+    if formula is None:
+        return None
+    sv = formula(index_input, index_output)
+    # SV 값을 2바이트 부호있는 정수로 변환 (범위를 벗어나면 None)
+    if sv is None or not 0 <= sv <= 0x7FFF:
+        return None
+    return sv.to_bytes(2, "big", signed=True)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def london_key(node_addr: bytes, index_device, index_input, index_output, index_param) -> bytes:
+    # 상태 저장소 키 (node_addr + SV) 를 캐시하여 같은 객체를 재사용
+    s_v = london_sv(index_device, index_input, index_output, index_param)
+    return node_addr + s_v if s_v else b""
+
+
 BLU_IP_PORT = 1023
 
 
@@ -149,10 +386,14 @@ class LondonController(CommonLogger):
 
     def __init__(self, dv, min_val=MIN_VAL, max_val=MAX_VAL, unit_val=UNIT_VAL):
         self.dv = dv
-        self.buffer = bytearray()
+        self.reader = LondonFrameReader()
         self.states = LondonState()
         self.meter_subscription_rate = 250
-        self.check_message_attempts = 0
+        self.meters: LondonMeterEngine | None = None
+        self.write_pipeline: LondonWritePipeline | None = None
+        self.send_queue: LondonSendQueue | None = None
+        self.snapshot: StateSnapshot | None = None
+        self._meter_keys = set()  # 구독 중인 메터 키 (메터 엔진 라우팅, 스냅샷 제외용)
         self._buffer_lock = threading.Lock()
         self.MAX_VAL = max_val
         self.MIN_VAL = min_val
@@ -166,30 +407,111 @@ class LondonController(CommonLogger):
     def parse(self, data: bytes | bytearray):
         # 수신 데이터를 버퍼에 추가하고 파싱
         with self._buffer_lock:
-            self.buffer.extend(data)
-            while self.buffer:
-                before_len = len(self.buffer)
-                self.parse_buffer()
-                if len(self.buffer) == before_len:
-                    self.log_error(f"parse() : parser made no progress, dropping byte {self.buffer[0]:02x}")
-                    self.buffer.pop(0)
+            self.reader.feed(data)
+            self.parse_buffer()
 
     def _init(self):
         # 디바이스 수신 이벤트 리스너 등록
         self.dv.receive.listen(lambda event: self.parse(event.arguments["data"]))
 
     def add_path_event(self, observer):
-        # 상태 변경 옵저버 등록
+        # 상태 변경 옵저버 등록 (모든 키)
         self.states.subscribe(observer)
 
+    def add_key_event(self, key: bytes | bytearray, observer):
+        # 특정 키의 상태 변경에만 옵저버 등록
+        self.states.subscribe(observer, key)
+
+    def add_sv_event(self, node_addr, index_device, index_input, index_output, index_param, observer):
+        # 노드와 SV 로 키를 만들어 해당 키에만 옵저버 등록
+        key = self.get_key(node_addr, index_device, index_input, index_output, index_param)
+        if not key:
+            self.log_error("add_sv_event() : invalid s_v")
+            return
+        self.states.subscribe(observer, key)
+
+    def add_node_event(self, node_addr: bytes | bytearray, observer):
+        # 키 접두사(노드 주소)가 일치하는 상태 변경에만 옵저버 등록
+        self.states.subscribe_prefix(observer, node_addr)
+
+    def remove_path_event(self, observer):
+        # add_path_event 로 등록한 옵저버 해제
+        self.states.unsubscribe(observer)
+
+    def remove_key_event(self, key: bytes | bytearray, observer):
+        self.states.unsubscribe(observer, key)
+
+    def remove_node_event(self, node_addr: bytes | bytearray, observer):
+        self.states.unsubscribe_prefix(observer, node_addr)
+
     def set_meter_subscription_rate(self, rate: int):
         # 메터 구독 주기 설정 (ms 단위)
         self.meter_subscription_rate = rate
 
+    def enable_meter_engine(self, frame_rate: float = 10.0, window: int = 8):
+        # 메터 전용 파이프라인 사용 (이미 구독한 메터도 엔진으로 옮김)
+        # 메터 수신값은 링버퍼에 쌓고 frame_rate 주기마다 변경된 메터만 상태에 반영
+        if self.meters is None:
+            meters = LondonMeterEngine(self.convert_value_to_db, on_update=self.states.update_if_subscribed, frame_rate=frame_rate, window=window)
+            # 엔진 생성 전에 구독한 메터도 메터 파이프라인으로
+            for key in list(self._meter_keys):
+                meters.register(key)
+            self.meters = meters
+            self.meters.start()
+        return self.meters
+
+    def enable_write_pipeline(self, write_interval: float = 0.05, settle_time: float = 0.2):
+        # 파라미터 쓰기 합치기 사용: 키별 SET 은 최신값만, GET 은 연속 입력이 끝난 뒤 한 번만 전송
+        if self.write_pipeline is None:
+            self.write_pipeline = LondonWritePipeline(self.send_many, write_interval=write_interval, settle_time=settle_time)
+        return self.write_pipeline
+
+    def enable_send_queue(self, window: int = 8, ack_timeout: float = 1.0, max_retries: int = 3):
+        # ACK/NAK 기반 전송 큐 사용: 응답 없는 프레임을 window 개까지만 전송, NAK/타임아웃 시 재전송
+        if self.send_queue is None:
+            self.send_queue = LondonSendQueue(self.dv.send, window=window, ack_timeout=ack_timeout, max_retries=max_retries)
+            # 연결이 끊기면 응답 대기 프레임을 되돌리고 재연결 후 다시 전송
+            if hasattr(self.dv, "offline"):
+                self.dv.offline(lambda *_args, **_kwargs: self.send_queue.pause())
+            self.dv.online(lambda *_args, **_kwargs: self.send_queue.resume())
+            self.send_queue.start()
+        return self.send_queue
+
+    def enable_snapshot(self, filename: str = "london_state.json", interval: float = 30.0):
+        # 상태 스냅샷 사용: 저장된 상태로 즉시 피드백 후 실제 수신값으로 갱신, 주기적으로/종료 시 저장
+        if self.snapshot is None:
+            self.snapshot = StateSnapshot(self._snapshot_states, filename, encode_key=bytes.hex, decode_key=bytes.fromhex, interval=interval)
+            restored = self.states.restore(self.snapshot.load())
+            self.log_debug(f"enable_snapshot() : restored {len(restored)} states")
+            self.snapshot.start()
+        return self.snapshot
+
+    def _snapshot_states(self) -> dict:
+        # 스냅샷에 저장할 상태 (메터는 순간값이므로 제외)
+        # 첫 저장 시점까지 구독되지 않은 복원 상태는 더 이상 사용하지 않는 키로 보고 폐기
+        dropped = self.states.drop_warm()
+        if dropped:
+            self.log_debug("_snapshot_states() : dropped %d unsubscribed restored states", dropped)
+        return {key: value for key, value in self.states.snapshot().items() if key not in self._meter_keys}
+
+    def _send_set_get(self, node_addr, s_v, set_message: bytes, get_message: bytes):
+        # Set 후 Get 명령으로 현재값 확인 (파이프라인 사용 시 합쳐서 전송)
+        if self.write_pipeline is not None:
+            self.write_pipeline.write(bytes(node_addr + s_v), set_message, get_message)
+        else:
+            self.send_many((set_message, get_message))
+
+    def add_meter_event(self, observer):
+        # 프레임마다 변경된 메터 {key: {"value", "peak", "rms"}} 를 한 번에 전달받는 옵저버 등록
+        self.enable_meter_engine().subscribe(observer)
+
     def get_key(self, node_addr, index_device, index_input, index_output, index_param) -> bytes:
         # 상태 저장소의 키 생성
-        s_v = self.get_sv(index_device, index_input, index_output, index_param)
-        return bytes(node_addr + s_v) if s_v else b""
+        try:
+            return london_key(bytes(node_addr), index_device, index_input, index_output, index_param)
+        except Exception as e:
+            self.log_error(f"get_key() {e=}")
+            return b""
 
     def get_val(self, key: bytes | bytearray) -> int:
         # 키에 해당하는 상태값 조회 (없으면 0 반환)
@@ -201,12 +523,12 @@ class LondonController(CommonLogger):
 
     def convert_db_to_value(self, db_value: float) -> int:
         # dB 값을 장비 컨트롤 값으로 변환
-        # -10dB 이상: 선형 변환, 미만: 로그 변환
-        return int(db_value * 10000 if db_value >= -10 else (-math.log10(abs(db_value / 10)) * 200000) - 100000)
+        # -10dB 이상: 선형 변환, 미만: 로그 변환 (0.1dB 단위는 미리 계산된 테이블 사용)
+        return london_db_to_value(db_value)
 
     def convert_value_to_db(self, int_value: int) -> float:
         # 장비 컨트롤 값을 dB 값으로 변환
-        return float(int_value / 10000) if int_value >= -100000 else float(-10 * (10 ** ((-int_value - 100000) / 200000)))
+        return london_value_to_db(int_value)
 
     def bump_up_on(self, node_addr: bytes | bytearray):
         # 상승 범프 온
@@ -253,9 +575,8 @@ class LondonController(CommonLogger):
             s_v = self.get_sv(index_device, index_input, index_output, index_param)
             my_data = bytes([0x00, 0x00, 0x00, value])
         if s_v:
-            self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
             # Set 후 Get 명령으로 현재값 확인
-            self.checksum_then_send(bytes(get_event + node_addr + s_v + bytes([0x00, 0x00, 0x00, 0x00])))
+            self._send_set_get(node_addr, s_v, bytes(event + node_addr + s_v + my_data), bytes(get_event + node_addr + s_v + b"\x00\x00\x00\x00"))
 
     def set_mixer(self, node_addr: bytes | bytearray, index_input: int, index_output: int, index_param: int, value: int):
         # 믹서 파라미터 중 특정 파라미터는 바이트 2 위치에 설정
@@ -270,8 +591,7 @@ class LondonController(CommonLogger):
             s_v = self.get_sv(LondonDev.MIXER, index_input, index_output, index_param)
             my_data = bytes([0x00, 0x00, 0x00, value])
         if s_v:
-            self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
-            self.checksum_then_send(bytes(get_event + node_addr + s_v + bytes([0x00, 0x00, 0x00, 0x00])))
+            self._send_set_get(node_addr, s_v, bytes(event + node_addr + s_v + my_data), bytes(get_event + node_addr + s_v + b"\x00\x00\x00\x00"))
 
     def set_room_combine(self, node_addr: bytes | bytearray, index_input: int, index_output: int, index_param: int, value: int):
         # 룸컴바인 파라미터 중 특정 파라미터는 바이트 2 위치에 설정
@@ -286,8 +606,7 @@ class LondonController(CommonLogger):
             s_v = self.get_sv(LondonDev.ROOM_COMBINE, index_input, index_output, index_param)
             my_data = bytes([0x00, 0x00, 0x00, value])
         if s_v:
-            self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
-            self.checksum_then_send(bytes(get_event + node_addr + s_v + bytes([0x00, 0x00, 0x00, 0x00])))
+            self._send_set_get(node_addr, s_v, bytes(event + node_addr + s_v + my_data), bytes(get_event + node_addr + s_v + b"\x00\x00\x00\x00"))
 
     def set_gain(self, node_addr: bytes | bytearray, index_device: int, index_input: int, index_output: int, _: int, value: int):
         # 게인값은 4바이트 부호있는 정수로 설정
@@ -296,8 +615,7 @@ class LondonController(CommonLogger):
         s_v = self.get_sv(index_device, index_input, index_output, LondonParam.GAIN)
         my_data = value.to_bytes(4, "big", signed=True)
         if s_v:
-            self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
-            self.checksum_then_send(bytes(get_event + node_addr + s_v + bytes([0x00, 0x00, 0x00, 0x00])))
+            self._send_set_get(node_addr, s_v, bytes(event + node_addr + s_v + my_data), bytes(get_event + node_addr + s_v + b"\x00\x00\x00\x00"))
 
     def set_preset(self, preset_type: int, preset_number: int):
         # 프리셋 타입에 따라 파라미터 또는 디바이스 프리셋 설정
@@ -306,257 +624,130 @@ class LondonController(CommonLogger):
         elif preset_type == LondonParam.DEVICE_PRESET:
             self.checksum_then_send(bytes([0x8B, 0x00, 0x00, 0x00, preset_number]))
 
-    def subscribe(self, node_addr: bytes | bytearray, index_device: int, index_input: int, index_output: int, index_param: int):
+    def _subscribe_message(self, node_addr, index_device, index_input, index_output, index_param) -> bytes | None:
         # 상태값 구독 설정 (메터는 주기설정, 기타는 0)
         event = b"\x89"
         s_v = self.get_sv(index_device, index_input, index_output, index_param)
         if not s_v:
             self.log_error("subscribe() : invalid s_v")
-            return
-        index_param = self.meter_subscription_rate if index_param == LondonParam.METER else 0
+            return None
+        is_meter = index_param == LondonParam.METER
+        index_param = self.meter_subscription_rate if is_meter else 0
         my_data = bytes([0x00, 0x00, 0x00, index_param])
-        # 초기 상태값 설정
-        self.states.set_state(bytes(node_addr + s_v), int.from_bytes(my_data, "big", signed=True))
-        # 구독 명령 전송
-        self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
-
-    def unsubscribe(self, node_addr: bytes | bytearray, index_device: int, index_input: int, index_output: int, index_param: int):
+        # 초기 상태값 설정 (스냅샷에서 복원된 값이 있으면 유지)
+        self.states.reconcile_state(bytes(node_addr + s_v), int.from_bytes(my_data, "big", signed=True))
+        if is_meter:
+            self._meter_keys.add(bytes(node_addr + s_v))
+            if self.meters is not None:
+                self.meters.register(bytes(node_addr + s_v))
+        return bytes(event + node_addr + s_v + my_data)
+
+    def _unsubscribe_message(self, node_addr, index_device, index_input, index_output, index_param) -> bytes | None:
         # 상태값 구독 해제
         event = b"\x8a"
         s_v = self.get_sv(index_device, index_input, index_output, index_param)
         if not s_v:
             self.log_error("unsubscribe() : invalid s_v")
-            return
+            return None
         index_param = self.meter_subscription_rate if index_param == LondonParam.METER else 0
         my_data = bytes([0x00, 0x00, 0x00, index_param])
         # 상태값 제거
         self.states.remove_state(bytes(node_addr + s_v))
+        self._meter_keys.discard(bytes(node_addr + s_v))
+        if self.meters is not None:
+            self.meters.unregister(bytes(node_addr + s_v))
+        return bytes(event + node_addr + s_v + my_data)
+
+    def subscribe(self, node_addr: bytes | bytearray, index_device: int, index_input: int, index_output: int, index_param: int):
+        # 구독 명령 전송
+        message = self._subscribe_message(node_addr, index_device, index_input, index_output, index_param)
+        if message:
+            self.checksum_then_send(message)
+
+    def unsubscribe(self, node_addr: bytes | bytearray, index_device: int, index_input: int, index_output: int, index_param: int):
         # 구독 해제 명령 전송
-        self.checksum_then_send(bytes(event + node_addr + s_v + my_data))
+        message = self._unsubscribe_message(node_addr, index_device, index_input, index_output, index_param)
+        if message:
+            self.checksum_then_send(message)
+
+    def subscribe_many(self, node_sv_list):
+        # 여러 상태값을 한 번에 구독 (node_sv_list: (node_addr, device, input, output, param) 목록)
+        messages = (self._subscribe_message(*node_sv) for node_sv in node_sv_list)
+        self.send_many(message for message in messages if message)
+
+    def unsubscribe_many(self, node_sv_list):
+        # 여러 상태값을 한 번에 구독 해제
+        messages = (self._unsubscribe_message(*node_sv) for node_sv in node_sv_list)
+        self.send_many(message for message in messages if message)
 
     def get_sv(self, index_device, index_input, index_output, index_param):
-        # 기기, 입출력, 파라미터 인덱스를 장비 SV(Sub-Verb) 값으로 변환
+        # 기기, 입출력, 파라미터 인덱스를 장비 SV(Sub-Verb) 값으로 변환 (미리 계산된 테이블 사용)
         try:
-            sv = None
-            # LOGIC_SOURCE: 로직 소스 SV 계산
-            if index_device == LondonDev.LOGIC_SOURCE:
-                if index_param == LondonParam.LOGIC_SOURCE:
-                    sv = 1
-            # LOGIC_END: 로직 엔드 SV 계산
-            elif index_device == LondonDev.LOGIC_END:
-                if index_param == LondonParam.LOGIC_END:
-                    sv = 0
-            # AUTOMIXER, MIXER: 입력 채널당 100 오프셋으로 파라미터별 SV 계산
-            elif index_device == LondonDev.AUTOMIXER or index_device == LondonDev.MIXER:
-                if index_input != 0 and index_output == 0:
-                    if index_param == LondonParam.GAIN:
-                        sv = (index_input - 1) * 100
-                    elif index_param == LondonParam.MUTE:
-                        sv = (index_input - 1) * 100 + 1
-                    elif index_param == LondonParam.PAN:
-                        sv = (index_input - 1) * 100 + 2
-                    elif index_param == LondonParam.SOLO:
-                        sv = (index_input - 1) * 100 + 4
-                    elif index_param == LondonParam.OVERRIDE:
-                        sv = (index_input - 1) * 100 + 5
-                    elif index_param == LondonParam.OFF_GAIN:
-                        sv = (index_input - 1) * 100 + 6
-                    elif index_param == LondonParam.AUTO:
-                        sv = (index_input - 1) * 100 + 7
-                # 출력 채널(AUX/GROUP) SV 계산
-                elif index_input == 0 and index_output != 0:
-                    if index_param == LondonParam.GAIN:
-                        sv = index_output + 20000 - 1
-                    elif index_param == LondonParam.MUTE:
-                        sv = index_output + 20000
-                    elif index_param == LondonParam.AUX_GAIN:
-                        sv = (index_output - 1) * 10 + 10001
-                    elif index_param == LondonParam.AUX:
-                        sv = (index_output - 1) * 10 + 10002
-                    elif index_param == LondonParam.GROUP_GAIN:
-                        sv = (index_output - 1) * 10 + 11000
-                    elif index_param == LondonParam.GROUP:
-                        sv = (index_output - 1) * 10 + 11001
-                # 입출력 혼합: GROUP 파라미터
-                elif index_param == LondonParam.GROUP:
-                    sv = (index_input - 1) * 100 + (index_output - 1) + 40
-            # ROOM_COMBINE: 복합 로직으로 SV 계산
-            elif index_device == LondonDev.ROOM_COMBINE:
-                if index_input != 0 and index_output == 0:
-                    if index_param == LondonParam.PARTITION:
-                        sv = index_input - 1
-                    elif index_param == LondonParam.GROUP:
-                        sv = (index_input - 1) * 50 + 250
-                    elif index_param == LondonParam.SOURCE_GAIN:
-                        sv = (index_input - 1) * 50 + 255
-                    elif index_param == LondonParam.SOURCE_MUTE:
-                        sv = (index_input - 1) * 50 + 256
-                    elif index_param == LondonParam.BGM_GAIN:
-                        sv = (index_input - 1) * 50 + 257
-                    elif index_param == LondonParam.BGM_MUTE:
-                        sv = (index_input - 1) * 50 + 258
-                    elif index_param == LondonParam.BGM_SELECT:
-                        sv = (index_input - 1) * 50 + 259
-                elif index_input == 0 and index_output != 0:
-                    if index_param == LondonParam.MASTER_GAIN:
-                        sv = (index_output - 1) * 50 + 252
-                    elif index_param == LondonParam.MASTER_MUTE:
-                        sv = (index_output - 1) * 50 + 254
-            # ROUTER, MATRIX_MIXER: 입출력 조합으로 SV 계산
-            elif index_device == LondonDev.ROUTER or index_device == LondonDev.MATRIX_MIXER:
-                if index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
-                    sv = (index_input - 1) + ((index_output - 1) * 128)
-                elif index_param == LondonParam.GAIN:
-                    sv = (index_input + 16383) + ((index_output - 1) * 128)
-            # N_GAIN: 입출력 채널별 게인 제어
-            elif index_device == LondonDev.N_GAIN:
-                if index_output == 0:
-                    if index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
-                        sv = (index_input - 1) + 32
-                    elif index_param == LondonParam.GAIN:
-                        sv = index_input - 1
-                elif index_input == 0:
-                    if index_param == LondonParam.GAIN:
-                        sv = 96
-                    elif index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
-                        sv = 97
-            # GAIN: 단일 게인 제어 기기
-            elif index_device == LondonDev.GAIN:
-                if index_output == 0 and index_input == 1:
-                    if index_param == LondonParam.GAIN:
-                        sv = 0
-                    elif index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
-                        sv = 1
-                    elif index_param == LondonParam.POLARITY_ON or index_param == LondonParam.POLARITY_OFF:
-                        sv = 2
-                    elif index_param == LondonParam.BUMP_UP_ON or index_param == LondonParam.BUMP_UP_OFF:
-                        sv = 3
-                    elif index_param == LondonParam.BUMP_DOWN_ON or index_param == LondonParam.BUMP_DOWN_OFF:
-                        sv = 4
-            # SOURCE_SELECTOR: 소스 선택기
-            elif index_device == LondonDev.SOURCE_SELECTOR:
-                sv = 0
-            # SOURCE_MATRIX: 소스 매트릭스
-            elif index_device == LondonDev.SOURCE_MATRIX:
-                sv = index_input - 1
-            # INPUT_CARD: 입력 카드 채널별 파라미터
-            elif index_device == LondonDev.INPUT_CARD:
-                if index_param == LondonParam.GAIN:
-                    if index_input == 1:
-                        sv = 4
-                    elif index_input == 2:
-                        sv = 10
-                    elif index_input == 3:
-                        sv = 16
-                    elif index_input == 4:
-                        sv = 22
-                elif index_param == LondonParam.METER:
-                    sv = (index_input - 1) * 6
-                elif index_param == LondonParam.REFERENCE:
-                    sv = (index_input - 1) * 6 + 1
-                elif index_param == LondonParam.ATTACK:
-                    sv = (index_input - 1) * 6 + 2
-                elif index_param == LondonParam.RELEASED:
-                    sv = (index_input - 1) * 6 + 3
-                elif index_param == LondonParam.PHANTOM:
-                    sv = (index_input - 1) * 6 + 5
-            # OUTPUT_CARD: 출력 카드 채널별 파라미터
-            elif index_device == LondonDev.OUTPUT_CARD:
-                if index_param == LondonParam.METER:
-                    sv = (index_input - 1) * 4
-                elif index_param == LondonParam.REFERENCE:
-                    sv = (index_input - 1) * 4 + 1
-                elif index_param == LondonParam.ATTACK:
-                    sv = (index_input - 1) * 4 + 2
-                elif index_param == LondonParam.RELEASED:
-                    sv = (index_input - 1) * 4 + 3
-            # METER: 메터 기기
-            elif index_device == LondonDev.METER:
-                if index_param == LondonParam.METER:
-                    sv = 0
-            # SV 값을 2바이트 부호있는 정수로 변환
-            if sv is None or sv < 0:
-                return None
-            return sv.to_bytes(2, "big", signed=True)
+            return london_sv(index_device, index_input, index_output, index_param)
         except Exception as e:
             self.log_error(f"get_sv() {e=}")
             return None
 
     def check_special_char(self, data: int) -> bool:
         # STX(0x02), ETX(0x03), ACK(0x06), NAK(0x15), ESC(0x1B) 특수문자 검사
-        return data in (0x02, 0x03, 0x06, 0x15, 0x1B)
+        return data in SPECIAL_CHARS
 
     def checksum_then_send(self, my_string: bytes | bytearray):
         # 체크섬 계산 및 특수문자 이스케이프 처리 후 전송
         try:
-            send = bytearray()
-            CS = 0
-            # 체크섬 계산: XOR 연산으로 모든 바이트 누적
-            for b in my_string:
-                CS = CS ^ b
-                # 특수문자는 ESC(0x1B) + (문자+128) 형식으로 변환
-                if self.check_special_char(b):
-                    send.extend([0x1B, (b + 128) & 0xFF])
-                else:
-                    send.extend([b])
-            # 최종 메시지: STX + 데이터 + 체크섬 + ETX
-            if self.check_special_char(CS):
-                send = b"\x02" + send + bytes([0x1B, (CS + 128) & 0xFF]) + b"\x03"
+            if self.send_queue is not None:
+                self.send_queue.put((encode_frame(my_string),))
             else:
-                send = b"\x02" + send + bytes([CS]) + b"\x03"
-            self.dv.send(send)
+                self.dv.send(encode_frame(my_string))
         except Exception as e:
             self.log_error(f"checksum_then_send() : {e=}")
 
+    def send_many(self, messages, max_batch: int = 64):
+        # 여러 메시지를 인코딩 후 max_batch 개씩 묶어서 한 번에 전송
+        try:
+            if self.send_queue is not None:
+                # 전송 큐 사용 시 window 여유만큼 묶어서 전송
+                self.send_queue.put([encode_frame(my_string) for my_string in messages])
+                return
+            batch = []
+            for my_string in messages:
+                batch.append(encode_frame(my_string))
+                if len(batch) >= max_batch:
+                    self.dv.send(b"".join(batch))
+                    batch = []
+            if batch:
+                self.dv.send(b"".join(batch))
+        except Exception as e:
+            self.log_error(f"send_many() : {e=}")
+
     def parse_buffer(self):
         try:
-            # 수신 버퍼 파싱: ACK, NAK, 메시지 처리
-            if self.buffer.startswith(b"\x06"):
-                # ACK(0x06) 처리
-                while self.buffer and self.buffer[0] == 0x06:
-                    self.buffer.pop(0)
-            if self.buffer.startswith(b"\x15"):
-                # NAK(0x15) 처리
-                self.buffer.pop(0)
-            if self.buffer.startswith(b"\x02"):
-                # STX(0x02)로 시작하는 메시지 처리
-                end_index = self.buffer.find(b"\x03")
-                if end_index != -1:
-                    # ETX(0x03) 발견: 완전한 메시지 추출
-                    message = self.buffer[1:end_index]
-                    self.buffer = self.buffer[end_index + 1 :]
-                    self.log_debug(f"Message extracted: {message.hex()} Remaining buffer: {self.buffer.hex()}")
-                    self.check_message_attempts = 0
-                    # 이스케이프 시퀀스 복원: ESC + (문자+128) → 원본 문자
-                    temp = bytearray(message)
-                    i = 0
-                    while i < len(temp):
-                        if temp[i] == 0x1B and i + 1 < len(temp):
-                            temp[i] = temp[i + 1] - 128
-                            temp.pop(i + 1)
-                        i += 1
+            # 수신 버퍼 파싱: ACK, NAK, 메시지 처리 (읽기 커서 기반, 완성된 프레임만 추출)
+            for token, message in self.reader.read():
+                if token == STX:
+                    if self.is_debug():
+                        self.log_debug(f"Message extracted: {message.hex()} Remaining buffer: {self.reader.pending().hex()}")
+                    if not message:
+                        continue
                     # 체크섬 검증: 마지막 바이트 제외 모든 바이트 XOR
-                    r_cs = 0
-                    for b in temp[:-1]:
-                        r_cs = r_cs ^ b
+                    r_cs = xor_checksum(message[:-1])
                     # 체크섬 일치 시 메시지 처리
-                    if r_cs == temp[-1]:
-                        self.process_feedback(temp[:-1])
+                    if r_cs == message[-1]:
+                        self.process_feedback(message[:-1])
                     else:
-                        self.log_warn(f"parse_buffer() : checksum mismatch {r_cs=} expected={temp[-1]}")
+                        self.log_warn(f"parse_buffer() : checksum mismatch {r_cs=} expected={message[-1]}")
+                elif token == ACK:
+                    if self.send_queue is not None:
+                        self.send_queue.on_ack()
+                elif token == NAK:
+                    self.log_debug("parse_buffer() : NAK received")
+                    if self.send_queue is not None:
+                        self.send_queue.on_nak()
                 else:
-                    # ETX 미발견: 재시도 횟수 증가
-                    self.check_message_attempts += 1
-                    if self.check_message_attempts > 5:
-                        # 5회 이상 실패시 버퍼 초기화
-                        self.buffer.clear()
-                        self.check_message_attempts = 0
-            elif self.buffer:
-                self.log_error(f"parse_buffer() : unexpected start byte {self.buffer[0]:02x}")
-                self.buffer.pop(0)
+                    self.log_error(f"parse_buffer() : unexpected start byte {message[0]:02x} (skipped {len(message)} bytes)")
         except Exception as e:
             self.log_error(f"parse_buffer() : {e=}")
-            self.buffer.clear()  # 예외 발생 시 클리어 추가
+            self.reader.clear()  # 예외 발생 시 클리어 추가
 
     def process_feedback(self, received_string: bytes | bytearray):
         # 수신한 피드백 메시지 처리 및 상태 업데이트
@@ -564,18 +755,25 @@ class LondonController(CommonLogger):
             if len(received_string) < 13:
                 self.log_error(f"process_feedback() : message too short {len(received_string)=}")
                 return
-            event = bytes([received_string[0]])
-            node = received_string[1:3]
-            vd = bytes([received_string[3]])
-            node_addr = received_string[4:7]
-            s_v = received_string[7:9]
             my_data = received_string[-4:]
-            self.log_debug(
-                f"process_feedback() : event={event.hex()} node={node.hex()} vd={vd.hex()} node_addr={node_addr.hex()} s_v={s_v.hex()} my_data={my_data.hex()}"
-            )
+            if self.is_debug():
+                event = bytes([received_string[0]])
+                node = received_string[1:3]
+                vd = bytes([received_string[3]])
+                node_addr = received_string[4:7]
+                s_v = received_string[7:9]
+                self.log_debug(
+                    f"process_feedback() : event={event.hex()} node={node.hex()} vd={vd.hex()} node_addr={node_addr.hex()} s_v={s_v.hex()} my_data={my_data.hex()}"
+                )
+            key = bytes(received_string[1:9])
+            value = int.from_bytes(my_data, "big", signed=True)
+            # 메터는 메터 파이프라인으로 (UI 프레임 주기로 상태 반영)
+            if self.meters is not None and self.meters.push(key, value):
+                return
+            if self.write_pipeline is not None:
+                self.write_pipeline.acknowledge(key)
             # 등록된 상태값에만 업데이트
-            if bytes(node + vd + node_addr + s_v) in self.states.get_all_states_keys():
-                self.states.set_state(bytes(node + vd + node_addr + s_v), int.from_bytes(my_data, "big", signed=True))
+            self.states.update_if_subscribed(key, value)
         except Exception as e:
             self.log_error(f"process_feedback() : {e=}")
 
@@ -656,21 +854,11 @@ class LondonController(CommonLogger):
     def db_to_tp(self, x):
         # dB 값을 터치패널 0-255 범위로 선형 변환
         try:
-            x_min = self.MIN_VAL
-            x_max = self.MAX_VAL
-            y_min = 0
-            y_max = 255
-            y = (x - x_min) * (y_max - y_min) / (x_max - x_min) + y_min
-            return y
+            return level_scale(self.MIN_VAL, self.MAX_VAL).db_to_tp(x)
         except Exception as e:
             self.log_error(f"db_to_tp() : {e=}")
             return 0
 
     def tp_to_db(self, x):
         # 터치패널 0-255 값을 dB 범위로 선형 변환
-        x_min = 0
-        x_max = 255
-        y_min = self.MIN_VAL
-        y_max = self.MAX_VAL
-        y = (x - x_min) * (y_max - y_min) / (x_max - x_min) + y_min
-        return y
+        return level_scale(self.MIN_VAL, self.MAX_VAL).tp_to_db(x)
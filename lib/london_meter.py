@@ -0,0 +1,142 @@
+# 마지막 수정일 : 20261018
+import math
+import threading
+from array import array
+from typing import Callable
+
+from lib.scheduler import Scheduler
+from lib.utility import CommonLogger
+
+
+class MeterHistory:
+    # 메터 하나의 고정 크기 링버퍼 (샘플마다 객체를 만들지 않도록 array 사용)
+    __slots__ = ("samples", "index", "count", "latest", "dirty")
+
+    def __init__(self, window: int):
+        self.samples = array("l", [0]) * window
+        self.index = 0
+        self.count = 0
+        self.latest = 0
+        self.dirty = False
+
+    def push(self, value: int):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+        self.latest = value
+        self.dirty = True
+
+    def window(self):
+        # 유효한 샘플만 반환 (오래된 순서 무관)
+        return self.samples if self.count == len(self.samples) else self.samples[: self.count]
+
+
+class LondonMeterEngine(CommonLogger):
+    """장비 메터 수신 주기와 별개로 UI 프레임 주기마다 변경된 메터만 모아서 전달"""
+
+    def __init__(self, convert_value_to_db: Callable, on_update: Callable | None = None, frame_rate: float = 10.0, window: int = 8):
+        self.name = "meter"
+        self.convert_value_to_db = convert_value_to_db
+        self.on_update = on_update  # 프레임마다 변경된 메터별 (key, value) 호출
+        self.frame_rate = frame_rate
+        self.window = window
+        self._meters = {}
+        self._observers = ()
+        self._lock = threading.Lock()
+        self._scheduler = Scheduler(name="LondonMeterEngine")
+        self._schedule = None
+
+    def register(self, key: bytes):
+        with self._lock:
+            if key not in self._meters:
+                self._meters[key] = MeterHistory(self.window)
+
+    def unregister(self, key: bytes):
+        with self._lock:
+            self._meters.pop(key, None)
+
+    def is_meter(self, key) -> bool:
+        return key in self._meters
+
+    def push(self, key, value: int) -> bool:
+        # 등록된 메터면 링버퍼에 저장하고 True 반환 (옵저버 호출 없음)
+        history = self._meters.get(key)
+        if history is None:
+            return False
+        with self._lock:
+            history.push(value)
+        return True
+
+    def subscribe(self, observer):
+        # observer(levels: dict[key, dict]) 를 프레임마다 한 번 호출
+        with self._lock:
+            if observer not in self._observers:
+                self._observers = self._observers + (observer,)
+
+    def unsubscribe(self, observer):
+        with self._lock:
+            self._observers = tuple(o for o in self._observers if o != observer)
+
+    def set_frame_rate(self, frame_rate: float):
+        self.frame_rate = frame_rate
+        if self._schedule is not None:
+            self.stop()
+            self.start()
+
+    def start(self):
+        if self._schedule is None:
+            self._schedule = self._scheduler.set_interval(1.0 / self.frame_rate, self._tick)
+
+    def stop(self):
+        if self._schedule is not None:
+            self._scheduler.cancel(self._schedule)
+            self._schedule = None
+
+    def _power_mean_db(self, samples) -> float:
+        # 윈도우의 dB 값을 전력으로 평균한 RMS (dB)
+        if not samples:
+            return float("-inf")
+        convert = self.convert_value_to_db
+        total = 0.0
+        for v in samples:
+            total += 10 ** (convert(v) / 10)
+        return 10 * math.log10(total / len(samples)) if total > 0 else float("-inf")
+
+    def _levels(self, history: MeterHistory) -> dict:
+        samples = history.window()
+        return {
+            "value": history.latest,
+            "peak": self.convert_value_to_db(max(samples)) if samples else float("-inf"),
+            "rms": self._power_mean_db(samples),
+        }
+
+    def get_levels(self, key) -> dict | None:
+        # 현재 메터 값과 윈도우 피크/RMS (dB) 조회
+        with self._lock:
+            history = self._meters.get(key)
+            if history is None:
+                return None
+            return self._levels(history)
+
+    def _tick(self):
+        with self._lock:
+            levels = {}
+            for key, history in self._meters.items():
+                if history.dirty:
+                    history.dirty = False
+                    levels[key] = self._levels(history)
+        if not levels:
+            return
+        if self.on_update:
+            for key, level in levels.items():
+                try:
+                    self.on_update(key, level["value"])
+                except Exception as e:
+                    self.log_error(f"_tick() on_update {e=}")
+        for observer in self._observers:
+            try:
+                observer(levels)
+            except Exception as e:
+                from lib.utility import handler_loc
+                self.log_error(f"_tick() {handler_loc(observer)} {e=}")
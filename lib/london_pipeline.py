@@ -0,0 +1,308 @@
+# 마지막 수정일 : 20261018
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+from lib.scheduler import Scheduler
+from lib.utility import CommonLogger
+
+
+class LondonWritePipeline(CommonLogger):
+    """키별 SET 을 write_interval 마다 최신값 하나로 합치고, 연속 입력이 끝나면 GET 을 한 번만 전송"""
+
+    def __init__(self, send_many: Callable, write_interval: float = 0.05, settle_time: float = 0.2, get_timeout: float = 1.0):
+        self.name = "write_pipeline"
+        self.send_many = send_many
+        self.write_interval = write_interval  # 같은 키의 SET 최소 간격(초)
+        self.settle_time = settle_time  # 마지막 SET 이후 GET 전송까지 대기(초)
+        self.get_timeout = get_timeout  # 응답 없는 GET 을 다시 보낼 수 있는 시간(초)
+        self._entries = {}
+        self._outstanding_gets = {}  # 키 → GET 전송 시각
+        self._lock = threading.Lock()
+        self._scheduler = Scheduler(name="LondonWritePipeline")
+        self.total_writes = 0
+        self.total_frames_sent = 0
+        self.total_frames_saved = 0
+        self.last_burst_saved = 0
+
+    def _new_entry(self):
+        return {"pending": None, "get": None, "in_flight": False, "writes": 0, "sent": 0, "flush": None, "settle": None}
+
+    def write(self, key: bytes, set_message: bytes, get_message: bytes):
+        # 전송 중인 SET 이 있으면 최신값만 보관, 없으면 즉시 전송
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = self._new_entry()
+            entry["get"] = get_message
+            entry["writes"] += 1
+            self.total_writes += 1
+            if entry["settle"] is not None:
+                self._scheduler.cancel(entry["settle"])
+                entry["settle"] = None
+            if entry["in_flight"]:
+                entry["pending"] = set_message
+                return
+            entry["in_flight"] = True
+            entry["sent"] += 1
+            entry["flush"] = self._scheduler.set_timeout(self.write_interval, lambda: self._flush(key))
+        self._send((set_message,))
+
+    def _flush(self, key: bytes):
+        # write_interval 경과: 보관된 최신값 전송, 없으면 GET 대기 시작
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            pending = entry["pending"]
+            entry["pending"] = None
+            if pending is not None:
+                entry["sent"] += 1
+                entry["flush"] = self._scheduler.set_timeout(self.write_interval, lambda: self._flush(key))
+            else:
+                entry["in_flight"] = False
+                entry["flush"] = None
+                entry["settle"] = self._scheduler.set_timeout(self.settle_time, lambda: self._settle(key))
+        if pending is not None:
+            self._send((pending,))
+
+    def _settle(self, key: bytes):
+        # 연속 입력 종료: GET 을 한 번만 전송하고 절약한 프레임 수 기록
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["in_flight"]:
+                return
+            del self._entries[key]
+            now = time.monotonic()
+            sent_get = self._outstanding_gets.get(key)
+            send_get = sent_get is None or now - sent_get > self.get_timeout
+            if send_get:
+                self._outstanding_gets[key] = now
+            frames = entry["sent"] + (1 if send_get else 0)
+            saved = entry["writes"] * 2 - frames
+            self.total_frames_saved += saved
+            self.last_burst_saved = saved
+        if self.is_debug():
+            self.log_debug("_settle() %s writes=%d frames=%d saved=%d", key.hex(), entry["writes"], frames, saved)
+        if send_get:
+            self._send((entry["get"],))
+
+    def acknowledge(self, key: bytes):
+        # 해당 키의 응답 수신: 대기 중인 GET 해제
+        if key in self._outstanding_gets:
+            with self._lock:
+                self._outstanding_gets.pop(key, None)
+
+    def _send(self, messages):
+        with self._lock:
+            self.total_frames_sent += len(messages)
+        self.send_many(messages)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "writes": self.total_writes,
+                "frames_sent": self.total_frames_sent,
+                "frames_saved": self.total_frames_saved,
+                "last_burst_saved": self.last_burst_saved,
+                "outstanding_gets": len(self._outstanding_gets),
+            }
+
+    def shutdown(self):
+        self._scheduler.shutdown()
+        with self._lock:
+            self._entries.clear()
+            self._outstanding_gets.clear()
+
+
+class LondonSendQueue(CommonLogger):
+    """
+    ACK/NAK 기반 전송 큐 : 응답 없는 프레임을 window 개까지만 보내고 NAK/타임아웃 시 재전송
+    ACK 에는 프레임 정보가 없어 전송 순서로 짝을 맞추므로, 타임아웃 후에는 늦게 오는 ACK 를 ack_timeout 동안 버리고(resync)
+    가장 오래된 프레임 하나만 다시 보내 ACK 를 확인한 뒤(probe) window 전송을 재개
+    """
+
+    def __init__(self, send: Callable, window: int = 8, ack_timeout: float = 1.0, max_retries: int = 3, max_queue: int = 4096):
+        self.name = "send_queue"
+        self.send = send
+        self.window = window  # 동시에 응답 대기할 수 있는 최대 프레임 수
+        self.ack_timeout = ack_timeout  # ACK 대기 시간(초), 초과시 재전송
+        self.max_retries = max_retries  # 재전송 최대 횟수, 초과시 폐기
+        self.max_queue = max_queue  # 대기열 최대 길이, 초과시 오래된 프레임부터 폐기
+        self._queue = deque()
+        self._in_flight = deque()  # [프레임, 전송 시각, 재전송 횟수]
+        self._lock = threading.Lock()
+        self._paused = False
+        self._resync_until = 0.0  # 타임아웃 후 이 시각까지 도착하는 ACK/NAK 는 이전 전송분으로 보고 무시
+        self._probing = False  # resync 후 프레임 하나만 보내고 ACK 대기 중 (window 1)
+        self._scheduler = Scheduler(name="LondonSendQueue")
+        self._schedule = None
+        self.rtt = None  # ACK 왕복 시간 평균(초, EWMA)
+        self.last_rtt = None
+        self.ack_count = 0
+        self.nak_count = 0
+        self.retransmit_count = 0
+        self.dropped_count = 0
+        self.stale_count = 0  # resync 중 무시한 ACK/NAK 수
+
+    def start(self):
+        if self._schedule is None:
+            self._schedule = self._scheduler.set_interval(self.ack_timeout / 2, self._check_timeout)
+
+    def stop(self):
+        if self._schedule is not None:
+            self._scheduler.cancel(self._schedule)
+            self._schedule = None
+
+    def put(self, frames):
+        # 인코딩된 프레임을 대기열에 추가하고 window 여유만큼 한 번에 전송
+        with self._lock:
+            self._queue.extend(frames)
+            while len(self._queue) > self.max_queue:
+                self._queue.popleft()
+                self.dropped_count += 1
+            to_send = self._fill()
+        self._write(to_send)
+
+    def _fill(self) -> list:
+        # 락 안에서 호출 : 대기열에서 window 여유만큼 꺼내 응답 대기 목록으로 이동
+        to_send = []
+        if self._paused or self._resync_until:
+            return to_send
+        now = time.monotonic()
+        window = 1 if self._probing else self.window
+        while self._queue and len(self._in_flight) < window:
+            frame = self._queue.popleft()
+            self._in_flight.append([frame, now, 0])
+            to_send.append(frame)
+        return to_send
+
+    def _write(self, frames):
+        if frames:
+            try:
+                self.send(b"".join(frames))
+            except Exception as e:
+                self.log_error(f"_write() : {e=}")
+
+    def on_ack(self):
+        with self._lock:
+            self.ack_count += 1
+            if self._resync_until:
+                self.stale_count += 1
+                return
+            if not self._in_flight:
+                return
+            self._probing = False
+            _, sent_at, _ = self._in_flight.popleft()
+            self.last_rtt = time.monotonic() - sent_at
+            self.rtt = self.last_rtt if self.rtt is None else self.rtt * 0.875 + self.last_rtt * 0.125
+            to_send = self._fill()
+        self._write(to_send)
+
+    def on_nak(self):
+        with self._lock:
+            self.nak_count += 1
+            if self._resync_until:
+                self.stale_count += 1
+                return
+            to_send = self._retransmit_head()
+        self._write(to_send)
+
+    def _retransmit_head(self) -> list:
+        # 락 안에서 호출 : 가장 오래된 프레임 재전송 (재시도 초과 시 폐기하고 다음 프레임 전송)
+        # 재전송한 프레임은 이미 보낸 다른 프레임들 뒤에 도착하므로 목록 끝으로 옮겨 전송 순서와 ACK 순서를 맞춤
+        if not self._in_flight:
+            return []
+        entry = self._in_flight.popleft()
+        entry[2] += 1
+        if entry[2] > self.max_retries:
+            self.dropped_count += 1
+            self.log_warn("frame dropped after %d retries %s", self.max_retries, entry[0].hex())
+            return self._fill()
+        entry[1] = time.monotonic()
+        self._in_flight.append(entry)
+        self.retransmit_count += 1
+        return [entry[0]]
+
+    def _check_timeout(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._paused:
+                return
+            if self._resync_until:
+                if now < self._resync_until:
+                    return
+                to_send = self._probe(now)
+            elif self._in_flight and now - self._in_flight[0][1] >= self.ack_timeout:
+                self._start_resync(now)
+                return
+            else:
+                return
+        self._write(to_send)
+
+    def _start_resync(self, now: float):
+        # 락 안에서 호출 : 가장 오래된 프레임 타임아웃
+        # 뒤에 보낸 프레임은 대기열 앞으로 되돌리고, 늦게 오는 ACK 가 다른 프레임에 잘못 매칭되지 않도록 잠시 ACK 무시
+        entry = self._in_flight.popleft()
+        while self._in_flight:
+            self._queue.appendleft(self._in_flight.pop()[0])
+        entry[2] += 1
+        if entry[2] > self.max_retries:
+            self.dropped_count += 1
+            self.log_warn("frame dropped after %d retries %s", self.max_retries, entry[0].hex())
+        else:
+            self._in_flight.append(entry)
+        self._resync_until = now + self.ack_timeout
+        self._probing = False
+
+    def _probe(self, now: float) -> list:
+        # 락 안에서 호출 : resync 종료, 프레임 하나만 (재)전송하고 ACK 확인 후 window 전송 재개
+        self._resync_until = 0.0
+        self._probing = True
+        if not self._in_flight:
+            return self._fill()
+        entry = self._in_flight[0]
+        entry[1] = now
+        self.retransmit_count += 1
+        return [entry[0]]
+
+    def pause(self):
+        # 연결 끊김 : 응답 대기 중이던 프레임은 대기열 앞으로 되돌림
+        with self._lock:
+            self._paused = True
+            self._resync_until = 0.0
+            self._probing = False
+            while self._in_flight:
+                self._queue.appendleft(self._in_flight.pop()[0])
+
+    def resume(self):
+        # 재연결 : 대기열 전송 재개
+        with self._lock:
+            self._paused = False
+            to_send = self._fill()
+        self._write(to_send)
+
+    def clear(self):
+        with self._lock:
+            self._queue.clear()
+            self._in_flight.clear()
+            self._resync_until = 0.0
+            self._probing = False
+
+    def depth(self) -> int:
+        return len(self._queue) + len(self._in_flight)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": len(self._queue),
+                "in_flight": len(self._in_flight),
+                "rtt": self.rtt,
+                "last_rtt": self.last_rtt,
+                "acks": self.ack_count,
+                "naks": self.nak_count,
+                "retransmits": self.retransmit_count,
+                "dropped": self.dropped_count,
+                "stale": self.stale_count,
+            }
@@ -0,0 +1,128 @@
+# 마지막 수정일 : 20261018
+# BSS London(BLU) 프레이밍 프로토콜 : STX + 이스케이프된 데이터 + 체크섬 + ETX
+
+STX = 0x02
+ETX = 0x03
+ACK = 0x06
+NAK = 0x15
+ESC = 0x1B
+
+SPECIAL_CHARS = (STX, ETX, ACK, NAK, ESC)
+
+# 이스케이프 테이블 : 특수문자는 ESC(0x1B) + (문자+128), 나머지는 원본 1바이트
+ESCAPE_TABLE = tuple(bytes([ESC, (b + 128) & 0xFF]) if b in SPECIAL_CHARS else bytes([b]) for b in range(256))
+# 이스케이프 복원 테이블 : ESC 다음 바이트(문자+128) → 원본 문자
+UNESCAPE_TABLE = bytes((b - 128) & 0xFF for b in range(256))
+
+
+def unescape(message: bytes | bytearray | memoryview) -> bytes:
+    # 이스케이프 시퀀스 복원: ESC + (문자+128) → 원본 문자 (한 번의 split 으로 처리)
+    message = bytes(message)
+    if ESC not in message:
+        return message
+    parts = message.split(b"\x1b")
+    out = bytearray(parts[0])
+    last = len(parts) - 1
+    for i in range(1, last + 1):
+        part = parts[i]
+        if part:
+            out.append(UNESCAPE_TABLE[part[0]])
+            out += part[1:]
+        elif i == last:
+            # 마지막 ESC 뒤에 바이트가 없으면 원본 유지
+            out.append(ESC)
+    return bytes(out)
+
+
+def encode_frame(message: bytes | bytearray) -> bytes:
+    # 체크섬 계산과 이스케이프를 한 번에 처리: STX + 데이터 + 체크섬 + ETX
+    table = ESCAPE_TABLE
+    cs = 0
+    parts = [b"\x02"]
+    append = parts.append
+    for b in message:
+        cs ^= b
+        append(table[b])
+    append(table[cs])
+    append(b"\x03")
+    return b"".join(parts)
+
+
+def xor_checksum(data: bytes | bytearray) -> int:
+    # 체크섬 계산: XOR 연산으로 모든 바이트 누적
+    cs = 0
+    for b in data:
+        cs ^= b
+    return cs
+
+
+class LondonFrameReader:
+    """수신 바이트를 누적하고 읽기 커서로 완성된 프레임을 추출 (버퍼는 가끔만 압축)"""
+
+    COMPACT_THRESHOLD = 4096  # 읽은 바이트가 이 크기를 넘으면 버퍼 앞부분 정리
+    MAX_INCOMPLETE_ATTEMPTS = 5  # ETX 없는 프레임이 남아있을 수 있는 최대 수신 횟수
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self.incomplete_attempts = 0
+
+    def __len__(self):
+        return len(self._buffer) - self._pos
+
+    def feed(self, data: bytes | bytearray):
+        self._buffer.extend(data)
+
+    def clear(self):
+        self._buffer.clear()
+        self._pos = 0
+        self.incomplete_attempts = 0
+
+    def pending(self) -> bytes:
+        # 아직 처리하지 않은 버퍼 내용 (디버그용)
+        return bytes(self._buffer[self._pos :])
+
+    def read(self) -> list:
+        """버퍼에서 처리 가능한 항목을 (토큰, 데이터) 리스트로 반환.
+        토큰: STX=복원된 메시지(데이터+체크섬), ACK/NAK=None, None=알 수 없는 바이트열
+        """
+        buf = self._buffer
+        end = len(buf)
+        pos = self._pos
+        items = []
+        with memoryview(buf) as view:
+            while pos < end:
+                b = buf[pos]
+                if b == STX:
+                    end_index = buf.find(b"\x03", pos + 1)
+                    if end_index == -1:
+                        # ETX 미발견: 다음 수신까지 대기, 일정 횟수 초과시 폐기
+                        self.incomplete_attempts += 1
+                        if self.incomplete_attempts > self.MAX_INCOMPLETE_ATTEMPTS:
+                            self.incomplete_attempts = 0
+                            pos = end
+                        break
+                    self.incomplete_attempts = 0
+                    items.append((STX, unescape(view[pos + 1 : end_index])))
+                    pos = end_index + 1
+                elif b == ACK or b == NAK:
+                    items.append((b, None))
+                    pos += 1
+                else:
+                    # 다음 특수문자까지의 알 수 없는 바이트는 한 번에 건너뜀
+                    skip_end = pos + 1
+                    while skip_end < end and buf[skip_end] not in (STX, ACK, NAK):
+                        skip_end += 1
+                    items.append((None, bytes(view[pos:skip_end])))
+                    pos = skip_end
+        self._pos = pos
+        self._compact()
+        return items
+
+    def _compact(self):
+        if self._pos >= len(self._buffer):
+            self._buffer.clear()
+            self._pos = 0
+        elif self._pos > self.COMPACT_THRESHOLD:
+            del self._buffer[: self._pos]
+            self._pos = 0
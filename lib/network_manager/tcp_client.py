@@ -1,4 +1,4 @@
-# 마지막 수정일 : 20260625
+# 마지막 수정일 : 20261018
 import atexit
 import socket
 import threading
@@ -74,7 +74,7 @@ class TcpClient(CommonLogger, EventManager):
             if not (sock and is_connected):
                 return
             try:
-                self.log_debug(f"send() : sending {msg=}")
+                self.log_debug("send() : sending msg=%r", msg)
                 sock.sendall(msg)
             except Exception as e:
                 self.log_error(f"send() : failed to send {msg=} {e=}")
@@ -163,7 +163,7 @@ class TcpClient(CommonLogger, EventManager):
                     self.log_debug("_receive_loop() no data received, connection closed")
                     break
 
-                self.log_debug(f"_receive_loop() received {data=}")
+                self.log_debug("_receive_loop() received data=%r", data)
                 try:
                     self._emit_received(data, address=(self.ip, self.port))
                 except Exception as e:
@@ -0,0 +1,201 @@
+# 마지막 수정일 : 20261018
+import threading
+import time
+from typing import Callable
+
+from lib.scheduler import Scheduler, call_later
+from lib.utility import CommonLogger, handler_loc
+
+PHASE_STEP = 0.6180339887498949  # 황금비 : 등록 순서대로 주기 안에서 고르게 흩어지는 위상
+
+
+class PollTask:
+    __slots__ = ("group", "func", "interval", "next_due", "sent", "deferred", "late_avg", "late_max")
+
+    def __init__(self, group, func: Callable, interval: float, next_due: float):
+        self.group = group
+        self.func = func
+        self.interval = interval
+        self.next_due = next_due
+        self.sent = 0
+        self.deferred = 0  # 예산 부족으로 다음 틱으로 미룬 횟수
+        self.late_avg = 0.0  # 예정 시각 대비 실행 지연(초, EWMA)
+        self.late_max = 0.0
+
+
+class PollGroup:
+    """장비 하나의 폴링 작업 묶음 (드라이버의 self.poll) : start() 로 등록, stop()/shutdown() 으로 해제"""
+
+    def __init__(self, coordinator, name: str, transport=None):
+        self.coordinator = coordinator
+        self.name = name
+        self.transport = transport  # 같은 통신 경로(TcpClient 등)를 쓰는 그룹끼리 초당 명령 수를 함께 제한
+        self.tasks = ()
+        self.boost_until = 0.0
+
+    def start(self, *funcs: Callable, interval: float = 10.0, delay: float = 1.0):
+        """funcs 를 interval 초마다 폴링 (기존 작업은 교체). 첫 실행은 delay 이후 주기 안에서 고르게 분산"""
+        self.coordinator._replace(self, funcs, interval, delay)
+
+    def stop(self):
+        self.coordinator._replace(self, (), 0.0, 0.0)
+
+    def shutdown(self):
+        # 예전 Scheduler 와 같은 이름 (오프라인 시 폴링 중지)
+        self.stop()
+
+    def boost(self, duration: float | None = None):
+        """사용자 명령 직후 잠시 빠르게 폴링해서 상태 피드백을 빨리 받음"""
+        self.coordinator._boost(self, duration)
+
+    def stats(self) -> dict:
+        tasks = self.tasks
+        return {
+            "tasks": len(tasks),
+            "sent": sum(task.sent for task in tasks),
+            "deferred": sum(task.deferred for task in tasks),
+            "late_avg": max((task.late_avg for task in tasks), default=0.0),
+            "late_max": max((task.late_max for task in tasks), default=0.0),
+            "boosted": self.boost_until > time.monotonic(),
+        }
+
+
+class PollCoordinator(CommonLogger):
+    """모든 장비 폴링을 하나의 고정 주기 틱에서 실행 : 위상 분산, 전체/통신 경로별 초당 명령 수 제한, 사용자 명령 후 가속"""
+
+    def __init__(
+        self,
+        tick: float = 0.1,
+        max_per_second: float = 20.0,
+        transport_max_per_second: float = 4.0,
+        boost_interval: float = 1.0,
+        boost_duration: float = 5.0,
+    ):
+        self.name = "PollCoordinator"
+        self.tick = tick
+        self.max_per_second = max_per_second  # 전체 초당 폴링 명령 수
+        self.transport_max_per_second = transport_max_per_second  # 통신 경로 하나의 초당 폴링 명령 수
+        self.boost_interval = boost_interval  # 가속 중 폴링 주기(초)
+        self.boost_duration = boost_duration  # 가속 유지 시간(초)
+        self._tasks = ()
+        self._registered = 0  # 지금까지 등록한 작업 수 (위상 계산용)
+        self._tokens = max_per_second
+        self._transport_tokens = {}  # 통신 경로 → [남은 명령 수, 마지막 충전 시각]
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._scheduler = Scheduler(name="PollCoordinator")
+        self._schedule = None
+        self.sent_count = 0
+        self.deferred_count = 0
+        self.rate = 0.0  # 실제 초당 폴링 명령 수 (EWMA)
+
+    def group(self, name: str, transport=None) -> PollGroup:
+        return PollGroup(self, name, transport)
+
+    def _replace(self, group: PollGroup, funcs, interval: float, delay: float):
+        now = time.monotonic()
+        with self._lock:
+            tasks = []
+            for func in funcs:
+                phase = (self._registered * PHASE_STEP) % 1.0
+                self._registered += 1
+                tasks.append(PollTask(group, func, interval, now + delay + phase * interval))
+            group.tasks = tuple(tasks)
+            self._tasks = tuple(task for task in self._tasks if task.group is not group) + group.tasks
+            if self._tasks and self._schedule is None:
+                self._last_refill = now
+                self._schedule = self._scheduler.set_interval(self.tick, self._tick, fixed_rate=True)
+            elif not self._tasks and self._schedule is not None:
+                self._scheduler.cancel(self._schedule)
+                self._schedule = None
+
+    def _boost(self, group: PollGroup, duration: float | None):
+        now = time.monotonic()
+        with self._lock:
+            group.boost_until = now + (self.boost_duration if duration is None else duration)
+            for task in group.tasks:
+                task.next_due = min(task.next_due, now + self.boost_interval)
+
+    def _take_transport_token(self, transport, now: float) -> bool:
+        # 락 안에서 호출
+        if transport is None:
+            return True
+        bucket = self._transport_tokens.get(transport)
+        if bucket is None:
+            bucket = self._transport_tokens[transport] = [self.transport_max_per_second, now]
+        bucket[0] = min(self.transport_max_per_second, bucket[0] + (now - bucket[1]) * self.transport_max_per_second)
+        bucket[1] = now
+        if bucket[0] < 1:
+            return False
+        bucket[0] -= 1
+        return True
+
+    def _tick(self):
+        now = time.monotonic()
+        to_run = []
+        with self._lock:
+            self._tokens = min(self.max_per_second, self._tokens + (now - self._last_refill) * self.max_per_second)
+            self._last_refill = now
+            due = sorted((task for task in self._tasks if task.next_due <= now), key=lambda task: task.next_due)
+            for task in due:
+                if self._tokens < 1 or not self._take_transport_token(task.group.transport, now):
+                    task.deferred += 1
+                    self.deferred_count += 1
+                    continue
+                self._tokens -= 1
+                late = now - task.next_due
+                task.late_avg = task.late_avg * 0.875 + late * 0.125
+                if late > task.late_max:
+                    task.late_max = late
+                interval = self.boost_interval if task.group.boost_until > now else task.interval
+                task.next_due += interval
+                if task.next_due <= now:
+                    task.next_due = now + interval
+                task.sent += 1
+                to_run.append(task)
+            self.sent_count += len(to_run)
+            self.rate = self.rate * 0.98 + (len(to_run) / self.tick) * 0.02
+        # 통신 경로별로 묶어 공유 워커 풀에서 실행 (응답이 느린 장비가 틱과 다른 장비의 폴링을 막지 않도록, 같은 경로는 순서 유지)
+        batches = {}
+        for task in to_run:
+            transport = task.group.transport
+            batches.setdefault(task if transport is None else transport, []).append(task)
+        for batch in batches.values():
+            call_later(0, self._run_tasks, batch)
+
+    def _run_tasks(self, tasks):
+        for task in tasks:
+            try:
+                task.func()
+            except Exception as e:
+                self.log_error(f"_run_tasks() group={task.group.name} func={handler_loc(task.func)} {e=}")
+
+    def stats(self) -> dict:
+        """전체 폴링 부하 : 작업 수, 전송/지연 누적, 초당 전송률, 가장 늦은 그룹"""
+        with self._lock:
+            groups = {}
+            for task in self._tasks:
+                groups.setdefault(task.group.name, task.group)
+            return {
+                "tasks": len(self._tasks),
+                "groups": len(groups),
+                "sent": self.sent_count,
+                "deferred": self.deferred_count,
+                "rate": self.rate,
+                "max_per_second": self.max_per_second,
+                "late_max": max((task.late_max for task in self._tasks), default=0.0),
+                "by_group": {name: group.stats() for name, group in groups.items()},
+            }
+
+
+_poll_coordinator = None
+_poll_coordinator_lock = threading.Lock()
+
+
+def get_poll_coordinator() -> PollCoordinator:
+    # 모든 드라이버가 함께 사용하는 폴링 관리자 (설정은 생성 후 속성으로 변경 가능)
+    global _poll_coordinator
+    with _poll_coordinator_lock:
+        if _poll_coordinator is None:
+            _poll_coordinator = PollCoordinator()
+        return _poll_coordinator
@@ -1,16 +1,197 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import atexit
+import functools
+import heapq
+import itertools
 import threading
+import time
+from collections import deque
 from typing import Callable
 
 from lib.utility import CommonLogger
 
 
+class _TimerService(CommonLogger):
+    """
+    모든 Scheduler 가 공유하는 타이머 스레드 하나(힙) + 작업 스레드 풀 (작업이 밀리면 MAX_WORKERS 까지 늘어나고 한가하면 줄어듦)
+    작업 스레드가 모두 사용 중이면 대기열에 넣고, STALL_TIMEOUT 이 지나도록 꺼내지지 않은 작업은 별도 스레드에서 실행하고 경고 로그
+    (막힌 콜백 때문에 다른 타이머가 멈추지 않도록, 짧은 작업이 한꺼번에 몰린 경우에는 스레드를 만들지 않음)
+    """
+
+    MIN_WORKERS = 2
+    MAX_WORKERS = 32
+    IDLE_TIMEOUT = 30.0  # MIN_WORKERS 초과 작업 스레드가 이 시간(초) 동안 할 일이 없으면 종료
+    STALL_TIMEOUT = 0.1  # 작업 스레드가 모두 사용 중일 때 대기열에서 기다릴 최대 시간(초), 초과시 별도 스레드에서 실행
+    SATURATION_LOG_INTERVAL = 10.0  # 풀 포화 경고 로그 최소 간격(초)
+
+    def __init__(self):
+        self.name = "SchedulerTimer"
+        self._heap = []  # [마감 시각, 순번, 실행 함수(취소 시 None)]
+        self._seq = itertools.count()
+        self._cancelled = 0
+        self._cond = threading.Condition()
+        self._timer_thread = None
+        self._jobs = deque()  # (대기열에 넣은 시각, 실행 함수)
+        self._job_cond = threading.Condition()
+        self._workers = 0
+        self._idle = 0
+        self.overflow_count = 0  # 풀 포화로 별도 스레드에서 실행한 작업 수
+        self._last_saturation_log = 0.0
+
+    def add(self, delay: float, func: Callable) -> list:
+        return self.add_at(time.monotonic() + delay, func)
+
+    def add_at(self, deadline: float, func: Callable) -> list:
+        # deadline : time.monotonic() 기준 실행 시각
+        entry = [deadline, next(self._seq), func]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._timer_loop, name="SchedulerTimer", daemon=True)
+                self._timer_thread.start()
+            if self._heap[0] is entry:
+                self._cond.notify()
+        return entry
+
+    def cancel(self, entry: list):
+        # 힙에서 바로 빼지 않고 표시만 함 (취소된 항목이 절반을 넘으면 힙 재구성)
+        with self._cond:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                self._heap = [e for e in self._heap if e[2] is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _timer_loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    # 대기열에 작업이 남아 있으면 STALL_TIMEOUT 마다 깨어나 오래 기다린 작업 확인
+                    stall_wait = self.STALL_TIMEOUT if self._jobs else None
+                    if not self._heap:
+                        self._cond.wait(stall_wait)
+                        self._run_stalled()
+                        continue
+                    entry = self._heap[0]
+                    if entry[2] is None:
+                        heapq.heappop(self._heap)
+                        self._cancelled -= 1
+                        continue
+                    remaining = entry[0] - time.monotonic()
+                    if remaining <= 0:
+                        heapq.heappop(self._heap)
+                        func, entry[2] = entry[2], None
+                        break
+                    self._cond.wait(remaining if stall_wait is None else min(remaining, stall_wait))
+                    self._run_stalled()
+            self.submit(func)
+
+    def submit(self, func: Callable):
+        with self._job_cond:
+            self._jobs.append((time.monotonic(), func))
+            if self._idle >= len(self._jobs):
+                self._job_cond.notify()
+                return
+            if self._workers >= self.MAX_WORKERS:
+                return  # 풀 포화 : 대기열에서 STALL_TIMEOUT 동안 기다림 (_run_stalled)
+            self._workers += 1
+        threading.Thread(target=self._worker_loop, name="SchedulerWorker", daemon=True).start()
+
+    def _run_stalled(self):
+        # 타이머 스레드에서 호출 : STALL_TIMEOUT 이상 꺼내지지 않은 작업은 작업 스레드가 모두 막힌 것으로 보고 별도 스레드에서 실행
+        if not self._jobs:
+            return
+        deadline = time.monotonic() - self.STALL_TIMEOUT
+        stalled = []
+        with self._job_cond:
+            while self._jobs and self._jobs[0][0] <= deadline:
+                stalled.append(self._jobs.popleft()[1])
+            if not stalled:
+                return
+            self.overflow_count += len(stalled)
+            now = time.monotonic()
+            log_saturation = now - self._last_saturation_log >= self.SATURATION_LOG_INTERVAL
+            if log_saturation:
+                self._last_saturation_log = now
+        for func in stalled:
+            threading.Thread(target=functools.partial(self._run_overflow, func), name="SchedulerOverflow", daemon=True).start()
+        if log_saturation:
+            self.log_warn(
+                "_run_stalled() : all %d workers busy, running job on a separate thread (overflow=%d) - scheduled callbacks must not block",
+                self._workers,
+                self.overflow_count,
+            )
+
+    def _run_overflow(self, func: Callable):
+        try:
+            func()
+        except Exception:
+            pass  # Scheduler 가 감싼 함수에서 이미 로그 처리
+
+    def _worker_loop(self):
+        while True:
+            with self._job_cond:
+                while not self._jobs:
+                    self._idle += 1
+                    signaled = self._job_cond.wait(self.IDLE_TIMEOUT)
+                    self._idle -= 1
+                    if not signaled and not self._jobs and self._workers > self.MIN_WORKERS:
+                        self._workers -= 1
+                        return
+                func = self._jobs.popleft()[1]
+            try:
+                func()
+            except Exception:
+                pass  # Scheduler 가 감싼 함수에서 이미 로그 처리
+
+    def stats(self) -> dict:
+        with self._cond:
+            pending = len(self._heap) - self._cancelled
+        with self._job_cond:
+            return {"pending": pending, "queued": len(self._jobs), "workers": self._workers, "idle": self._idle, "overflow": self.overflow_count}
+
+
+_timer_service = _TimerService()
+
+
+def call_later(delay: float, func: Callable, *args, **kwargs) -> list:
+    """Scheduler 인스턴스 없이 공유 타이머로 delay 초 뒤 한 번 실행 (cancel_call 용 핸들 반환, 스레드 생성 없음)"""
+
+    def run():
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            from lib.utility import handler_loc
+            print(f"(ERROR) - call_later : func={handler_loc(func)} {e=}")
+
+    return _timer_service.add(max(0.0, delay), run)
+
+
+def cancel_call(handle: list | None):
+    # 아직 실행되지 않은 call_later 취소 (이미 실행되었거나 None 이면 무시)
+    if handle is not None:
+        _timer_service.cancel(handle)
+
+
+MISSED_SKIP = "skip"  # fixed_rate 에서 놓친 틱은 건너뛰고 다음 주기 시각에 맞춤
+MISSED_CATCH_UP = "catch_up"  # fixed_rate 에서 놓친 틱을 연달아 실행 (최대 max_catch_up 회, 초과분은 건너뜀)
+
+
 class Scheduler(CommonLogger):
+    """
+    공유 타이머에서 set_interval/set_timeout 실행 (인스턴스마다 스레드를 만들지 않음)
+    주의 : 모든 Scheduler, call_later, debounce/throttle/pulse, 버튼 hold/repeat 가 같은 작업 스레드 풀을 사용하므로
+    콜백 안에서 오래 막히는 작업(네트워크 응답 대기, 긴 sleep 등)을 하지 말 것. 필요하면 콜백에서 별도 스레드 시작
+    """
+
     def __init__(self, name="Scheduler"):
         self.name = name
-        self.schedules = []
+        self.schedules = {}  # id(schedule) → schedule
         self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)  # 스케줄 종료 알림 (shutdown 대기용)
         self._local = threading.local()
         atexit.register(self.shutdown)
 
@@ -25,9 +206,10 @@ class Scheduler(CommonLogger):
         if parent and parent["stop_event"].is_set():
             return None
 
-        schedule = {"kind": kind, "stop_event": threading.Event(), "thread": None}
+        # entry : 공유 타이머 힙 항목, running : 작업 스레드에서 실행 중, deadline : 예정 실행 시각
+        schedule = {"kind": kind, "stop_event": threading.Event(), "entry": None, "running": False, "deadline": None, "stats": None}
         with self._lock:
-            self.schedules.append(schedule)
+            self.schedules[id(schedule)] = schedule
         return schedule
 
     def _run(self, schedule, func: Callable):
@@ -44,41 +226,117 @@ class Scheduler(CommonLogger):
     def _stop(self, schedule):
         if schedule:
             schedule["stop_event"].set()
+            with self._lock:
+                running = schedule["running"]
+                entry = schedule["entry"]
+            if entry is not None:
+                _timer_service.cancel(entry)
+            if not running:
+                self._finalize(schedule)
 
     def _finalize(self, schedule):
         with self._lock:
-            if schedule in self.schedules:
-                self.schedules.remove(schedule)
+            self.schedules.pop(id(schedule), None)
+            schedule["entry"] = None
+            self._finished.notify_all()
+
+    def _arm(self, schedule, deadline, fire):
+        # 락 안에서 호출 : 공유 타이머에 다음 실행 등록
+        schedule["deadline"] = deadline
+        schedule["entry"] = _timer_service.add_at(deadline, fire)
+
+    def _begin(self, schedule) -> bool:
+        # 타이머 만료 : 이미 취소되었으면 종료 처리, 아니면 실행 중으로 표시하고 지연 시간 기록
+        with self._lock:
+            if not schedule["stop_event"].is_set():
+                schedule["running"] = True
+                schedule["entry"] = None
+                self._record_lateness(schedule, time.monotonic() - schedule["deadline"])
+                return True
+        self._finalize(schedule)
+        return False
+
+    def _record_lateness(self, schedule, late: float):
+        # 락 안에서 호출 : 예정 시각 대비 실제 실행 지연(초)
+        stats = schedule["stats"]
+        if stats is None:
+            stats = schedule["stats"] = {"runs": 0, "skipped": 0, "late_last": 0.0, "late_avg": 0.0, "late_max": 0.0}
+        stats["runs"] += 1
+        stats["late_last"] = late
+        stats["late_avg"] = late if stats["runs"] == 1 else stats["late_avg"] * 0.875 + late * 0.125
+        if late > stats["late_max"]:
+            stats["late_max"] = late
+
+    def get_stats(self, schedule) -> dict | None:
+        """스케줄의 실행 횟수, 건너뛴 틱 수, 지연 시간(초) : late_last / late_avg(EWMA) / late_max"""
+        if not schedule:
+            return None
+        with self._lock:
+            stats = schedule["stats"]
+            return dict(stats) if stats else {"runs": 0, "skipped": 0, "late_last": 0.0, "late_avg": 0.0, "late_max": 0.0}
+
+    def stats(self) -> list:
+        # 현재 등록된 모든 스케줄의 종류와 지연 통계
+        with self._lock:
+            schedules = list(self.schedules.values())
+        return [{"kind": schedule["kind"], **self.get_stats(schedule)} for schedule in schedules]
+
+    def _next_fixed_rate(self, schedule, interval, missed, max_catch_up) -> float:
+        # 락 안에서 호출 : 이전 예정 시각 + interval (실행 시간과 무관하게 주기 유지)
+        deadline = schedule["deadline"] + interval
+        behind = time.monotonic() - deadline
+        if behind <= 0:
+            return deadline
+        ticks = int(behind // interval) + 1  # 이미 지나간 예정 시각 수
+        if missed == MISSED_CATCH_UP and ticks <= max_catch_up:
+            return deadline
+        skip = ticks if missed == MISSED_SKIP else ticks - max_catch_up
+        schedule["stats"]["skipped"] += skip
+        return deadline + skip * interval
 
     def cancel(self, schedule):
         self._stop(schedule)
 
-    def set_interval(self, interval: int | float, func: Callable):
+    def set_interval(self, interval: int | float, func: Callable, fixed_rate=False, missed=MISSED_SKIP, max_catch_up=3):
+        """
+        interval 초마다 func 실행
+        fixed_rate=False : 실행이 끝난 뒤 interval 대기 (실행 시간만큼 주기가 밀림)
+        fixed_rate=True : 시작 시각 기준 interval 배수 시각에 실행 (밀리지 않음), 놓친 틱은 missed 정책에 따름
+        """
         if not isinstance(interval, (int, float)) or interval <= 0:
             raise ValueError(f"interval must be a positive number, got {interval}")
         if not isinstance(func, Callable):
             raise ValueError(f"func must be Callable, got {type(func)}")
+        if missed not in (MISSED_SKIP, MISSED_CATCH_UP):
+            raise ValueError(f"missed must be '{MISSED_SKIP}' or '{MISSED_CATCH_UP}', got {missed}")
 
         schedule = self._create("interval")
         if not schedule:
             return None
 
-        stop_event = schedule["stop_event"]
-
-        def wrapper():
+        def fire():
+            if not self._begin(schedule):
+                return
             try:
-                while not stop_event.wait(interval):
-                    try:
-                        self._run(schedule, func)
-                    except Exception as e:
-                        from lib.utility import handler_loc
-                        self.log_error(f"set_interval() func={handler_loc(func)} {e=}")
-            finally:
+                self._run(schedule, func)
+            except Exception as e:
+                from lib.utility import handler_loc
+                self.log_error(f"set_interval() func={handler_loc(func)} {e=}")
+            # 실행이 끝난 뒤 다음 실행 등록 (같은 스케줄이 겹쳐 실행되지 않음)
+            with self._lock:
+                schedule["running"] = False
+                stopped = schedule["stop_event"].is_set()
+                if not stopped:
+                    if fixed_rate:
+                        deadline = self._next_fixed_rate(schedule, interval, missed, max_catch_up)
+                    else:
+                        deadline = time.monotonic() + interval
+                    self._arm(schedule, deadline, fire)
+            if stopped:
                 self._finalize(schedule)
 
-        thread = threading.Thread(target=wrapper, daemon=True)
-        schedule["thread"] = thread
-        thread.start()
+        with self._lock:
+            self._arm(schedule, time.monotonic() + interval, fire)
         return schedule
 
     def set_timeout(self, delay: int | float, func: Callable):
@@ -91,32 +349,31 @@ class Scheduler(CommonLogger):
         if not schedule:
             return None
 
-        stop_event = schedule["stop_event"]
-
-        def wrapper():
+        def fire():
+            if not self._begin(schedule):
+                return
             try:
-                if not stop_event.wait(delay):
-                    try:
-                        self._run(schedule, func)
-                    except Exception as e:
-                        from lib.utility import handler_loc
-                        self.log_error(f"set_timeout() func={handler_loc(func)} {e=}")
+                self._run(schedule, func)
+            except Exception as e:
+                from lib.utility import handler_loc
+                self.log_error(f"set_timeout() func={handler_loc(func)} {e=}")
             finally:
+                with self._lock:
+                    schedule["running"] = False
                 self._finalize(schedule)
 
-        thread = threading.Thread(target=wrapper, daemon=True)
-        schedule["thread"] = thread
-        thread.start()
+        with self._lock:
+            self._arm(schedule, time.monotonic() + delay, fire)
         return schedule
 
     def shutdown(self):
         atexit.unregister(self.shutdown)  # 누적 방지
         with self._lock:
-            schedules = list(self.schedules)
+            schedules = list(self.schedules.values())
         for schedule in schedules:
             self._stop(schedule)
-        current = threading.current_thread()
-        for schedule in schedules:
-            thread = schedule.get("thread")
-            if thread and thread.is_alive() and thread is not current:
-                thread.join()
+        # 실행 중인 함수가 끝날 때까지 대기 (shutdown 을 호출한 스케줄 자신은 제외)
+        current = self._get_current_schedule()
+        with self._lock:
+            while any(id(schedule) in self.schedules for schedule in schedules if schedule is not current):
+                self._finished.wait()
@@ -0,0 +1,81 @@
+# 마지막 수정일 : 20261018
+import atexit
+import json
+import os
+import threading
+from typing import Callable
+
+from lib.scheduler import Scheduler
+from lib.userdata import get_userdata_folder
+from lib.utility import CommonLogger
+
+
+class StateSnapshot(CommonLogger):
+    """상태 dict 를 주기적으로(그리고 종료 시) 로컬 파일에 저장하고, 재시작 시 불러와 바로 피드백에 사용"""
+
+    def __init__(
+        self,
+        get_states: Callable,
+        filename: str,
+        encode_key: Callable = str,
+        decode_key: Callable = str,
+        interval: float = 30.0,
+        foldername=None,
+    ):
+        self.name = filename
+        self.get_states = get_states  # 현재 상태 dict 사본을 반환하는 함수
+        self.encode_key = encode_key  # 상태 키 → JSON 문자열 키
+        self.decode_key = decode_key  # JSON 문자열 키 → 상태 키
+        self.interval = interval
+        self.filename = filename if filename.endswith(".json") else filename + ".json"
+        # foldername=None 이면 Userdata 기본 폴더, "" 이면 프로젝트 루트
+        folder = get_userdata_folder() if foldername is None else get_userdata_folder(foldername)
+        self.filepath = os.path.join(folder, self.filename)
+        self._last_saved = None
+        self._lock = threading.Lock()
+        self._scheduler = Scheduler(name="StateSnapshot")
+        self._schedule = None
+
+    def start(self):
+        # 주기 저장 시작 및 종료 시 저장 등록
+        if self._schedule is None:
+            self._schedule = self._scheduler.set_interval(self.interval, self.save)
+            atexit.register(self.save)
+
+    def stop(self):
+        if self._schedule is not None:
+            self._scheduler.cancel(self._schedule)
+            self._schedule = None
+            atexit.unregister(self.save)
+
+    def save(self):
+        # 변경된 경우에만 임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 파일 유지)
+        try:
+            states = self.get_states()
+            with self._lock:
+                if states == self._last_saved:
+                    return
+                data = {self.encode_key(key): value for key, value in states.items()}
+                folder = os.path.dirname(self.filepath)
+                if not os.path.exists(folder):
+                    os.makedirs(folder)
+                temp_path = self.filepath + ".tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, self.filepath)
+                self._last_saved = states
+            self.log_debug(f"save() : {len(data)} states saved to {self.filepath}")
+        except (OSError, TypeError, ValueError) as e:
+            self.log_error(f"save() : failed to save {self.filepath=} {e=}")
+
+    def load(self) -> dict:
+        # 저장된 상태 dict 반환 (파일이 없거나 깨졌으면 빈 dict)
+        if not os.path.exists(self.filepath):
+            return {}
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {self.decode_key(key): value for key, value in data.items()}
+        except (OSError, TypeError, ValueError) as e:
+            self.log_error(f"load() : failed to load {self.filepath=} {e=}")
+            return {}
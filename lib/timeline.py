@@ -1,11 +1,83 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import atexit
+import heapq
+import itertools
 import threading
 import time
 from types import SimpleNamespace
 from typing import Callable, List
 
-from lib.utility import CommonLogger, start_thread
+from lib.utility import CommonLogger
+
+
+class TimelineEngine(CommonLogger):
+    """여러 Timeline 을 스레드 하나에서 실행 : 절대 시각(monotonic) 힙으로 다음 이벤트 시각에 정확히 깨어남"""
+
+    def __init__(self, name="TimelineEngine"):
+        self.name = name
+        self._heap = []  # (예정 시각, 순번, timeline, generation)
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._firing = None  # 지금 이벤트를 실행 중인 timeline
+
+    def schedule(self, timeline, deadline: float, generation: int):
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._seq), timeline, generation))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+            if self._heap[0][2] is timeline:
+                self._cond.notify()
+
+    def is_engine_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def wait_idle(self, timeline):
+        # timeline 의 이벤트 핸들러가 실행 중이면 끝날 때까지 대기 (엔진 스레드에서 호출 시 대기 안 함)
+        if self.is_engine_thread():
+            return
+        with self._cond:
+            while self._firing is timeline:
+                self._cond.wait()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    deadline, _, timeline, generation = self._heap[0]
+                    if generation != timeline._generation:
+                        heapq.heappop(self._heap)  # 정지/일시정지/재시작으로 무효가 된 예약
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        heapq.heappop(self._heap)
+                        self._firing = timeline
+                        break
+                    self._cond.wait(remaining)
+            try:
+                timeline._fire(deadline, generation)
+            except Exception as e:
+                self.log_error(f"_loop() {e=}")
+            finally:
+                with self._cond:
+                    self._firing = None
+                    self._cond.notify_all()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_timeline_engine() -> TimelineEngine:
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = TimelineEngine()
+        return _engine
 
 
 class Timeline(CommonLogger):
@@ -26,19 +98,23 @@ class Timeline(CommonLogger):
                     from lib.utility import handler_loc
                     self._owner.log_error(f"expired handler={handler_loc(handler)} {e=}")
 
-    def __init__(self):
-        self._thread_runner: threading.Thread | None = None
+    def __init__(self, engine: TimelineEngine | None = None):
+        self._engine = engine or get_timeline_engine()
         self._lock: threading.Lock = threading.Lock()
-        self._stop_flag: threading.Event = threading.Event()
-        self._pause_flag: threading.Event = threading.Event()
-        self._resume_event: threading.Event = threading.Event()
-        self._resume_event.set()  # 초기 상태: 일시정지 아님
         self.expired: Timeline.Expired = Timeline.Expired(self)
         # repeat_count: 0=1회 실행, N=N+1회 실행, -1=무한 반복
         self.repeat_count: int = 0
         self.repetition: int = 0
         self.is_absolute: bool = False
         self._time: List[int] = []
+        self._steps: List[float] = []  # 이전 이벤트 예정 시각부터 각 이벤트까지의 간격(초)
+        self._index = 0
+        self._deadline = 0.0
+        self._running = False
+        self._paused = False
+        self._remaining = 0.0  # 일시정지 시점에 남아 있던 대기 시간(초)
+        self._in_trigger = False  # _fire 가 이벤트 핸들러를 실행 중 (다음 이벤트 예약 전)
+        self._generation = 0  # 변경될 때마다 증가, 엔진에 예약된 이전 이벤트를 무효화
         atexit.register(self.stop)
 
     def start(self, _time: List[int], is_absolute=False, repeat_count=0):
@@ -48,43 +124,52 @@ class Timeline(CommonLogger):
             self._time = [int(t) for t in _time if int(t) >= 0]
             self.is_absolute = is_absolute
             self.repeat_count = repeat_count
-            self._stop_flag.clear()
-            self._pause_flag.clear()
-            self._resume_event.set()
-
-        def runner():
-            with self._lock:
-                time_snapshot = list(self._time)
-                is_abs = self.is_absolute
-            self.repetition = 0
-            while not self._stop_flag.is_set() and (self.repeat_count == -1 or self.repetition <= self.repeat_count):
-                self.repetition += 1
-                # 일시정지 대기 (event 기반, busy-wait 없음)
-                while self._pause_flag.is_set():
-                    if self._stop_flag.is_set():
-                        return
-                    self._resume_event.wait(timeout=0.05)
-                last_absolute_time = 0.0
-                for s, t in enumerate(time_snapshot):
-                    if self._stop_flag.is_set():
-                        break
-                    ts = time.time()
-                    self.log_debug(f"Timestamp Start: {ts * 1000}")
-                    if is_abs:
-                        target_time = float(t / 1000)
-                        wait_time = max(0, target_time - last_absolute_time)
-                        last_absolute_time = target_time
-                        if not self._wait(wait_time):
-                            break
-                    else:
-                        if not self._wait(float(t / 1000)):
-                            break
-                    self.log_debug(f"Timestamp End: {(time.time() - ts) * 1000}")
-                    if self._stop_flag.is_set():
-                        break
-                    self.trigger(s, t)
+            if is_absolute:
+                # 절대 시간: 이전 이벤트보다 이른 시간은 바로 실행 (간격 0)
+                previous = [0] + self._time[:-1]
+                self._steps = [max(0, t - p) / 1000 for t, p in zip(self._time, previous)]
+            else:
+                self._steps = [t / 1000 for t in self._time]
+            if not self._steps:
+                return
+            self.repetition = 1
+            self._index = 0
+            self._running = True
+            self._paused = False
+            self._generation += 1
+            self._deadline = time.monotonic() + self._steps[0]
+            deadline, generation = self._deadline, self._generation
+        self._engine.schedule(self, deadline, generation)
 
-        self._thread_runner = start_thread(runner)
+    def _fire(self, deadline: float, generation: int):
+        # 엔진 스레드에서 호출 : 이벤트 실행 후 이전 예정 시각 기준으로 다음 이벤트 예약 (오차 누적 없음)
+        with self._lock:
+            if generation != self._generation or not self._running:
+                return
+            s = self._index
+            t = self._time[s]
+            self._in_trigger = True
+        self.log_debug("_fire() sequence=%d late=%.2fms", s, (time.monotonic() - deadline) * 1000)
+        self.trigger(s, t)
+        with self._lock:
+            self._in_trigger = False
+            if generation != self._generation or not self._running:
+                return
+            self._index += 1
+            if self._index >= len(self._steps):
+                if self.repeat_count != -1 and self.repetition > self.repeat_count:
+                    self._running = False
+                    self._generation += 1
+                    return
+                self.repetition += 1
+                self._index = 0
+            self._deadline = deadline + self._steps[self._index]
+            if self._paused:
+                # 핸들러 실행 중에 pause() 한 경우 : 남은 시간만 기록하고 resume() 때 예약
+                self._remaining = max(0.0, self._deadline - time.monotonic())
+                return
+            next_deadline, generation = self._deadline, self._generation
+        self._engine.schedule(self, next_deadline, generation)
 
     def trigger(self, s: int, t: int):
         evt = SimpleNamespace()
@@ -95,32 +180,36 @@ class Timeline(CommonLogger):
         evt.arguments["this"] = self
         self.expired.trigger(evt)
 
-    def _wait(self, seconds: float) -> bool:
-        remaining = max(0.0, seconds)
-        while remaining > 0 and not self._stop_flag.is_set():
-            # 일시정지 대기 (event 기반)
-            if self._pause_flag.is_set():
-                self._resume_event.wait(timeout=0.05)
-                continue
-            step = min(0.01, remaining)
-            start = time.monotonic()
-            if self._stop_flag.wait(step):
-                return False
-            remaining -= time.monotonic() - start
-        return not self._stop_flag.is_set()
-
     def stop(self):
         atexit.unregister(self.stop)  # 누적 방지
-        self._stop_flag.set()
-        self._resume_event.set()  # pause 중 stop 시 대기 해제
-        if self._thread_runner and self._thread_runner.is_alive() and threading.current_thread() is not self._thread_runner:
-            self._thread_runner.join()
-        self._thread_runner = None
+        with self._lock:
+            self._running = False
+            self._paused = False
+            self._generation += 1
+        self._engine.wait_idle(self)  # 실행 중인 핸들러가 끝날 때까지 대기
 
     def pause(self):
-        self._pause_flag.set()
-        self._resume_event.clear()
+        # 남은 대기 시간을 기록하고 예약 취소 (일시정지 동안 시간이 흐르지 않음)
+        with self._lock:
+            if not self._running or self._paused:
+                return
+            self._paused = True
+            if not self._in_trigger:
+                # 예약된 이벤트 무효화 (다음 이벤트가 이미 예약되었거나 엔진이 꺼내 실행하려는 중이어도 실행되지 않음)
+                self._remaining = max(0.0, self._deadline - time.monotonic())
+                self._generation += 1
 
     def resume(self):
-        self._pause_flag.clear()
-        self._resume_event.set()
+        with self._lock:
+            if not self._running or not self._paused:
+                return
+            self._paused = False
+            if self._in_trigger:
+                return  # 핸들러 실행 중 pause/resume : 이어서 _fire() 가 다음 이벤트 예약
+            self._generation += 1
+            self._deadline = time.monotonic() + self._remaining
+            deadline, generation = self._deadline, self._generation
+        self._engine.schedule(self, deadline, generation)
+
+    def is_running(self) -> bool:
+        return self._running
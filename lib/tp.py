@@ -1,5 +1,6 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import functools
+import threading
 
 
 class DebugFlags:
@@ -52,14 +53,149 @@ def tp_log_error(message):
     print(f"(ERROR) - tp : {message}")
 
 
+class TpShadowCache:
+    """패널별 마지막 전송 값(채널/레벨/^TXT ^UNI ^SHO ^ENA) : 같은 값 재전송 생략, 패널 오프라인/온라인 시 초기화"""
+
+    KINDS = ("channel", "level", "text")
+
+    def __init__(self):
+        self._panels = {}  # tp → {(종류, 포트, 주소): 마지막 전송 값}
+        self._lock = threading.Lock()
+        self.sent = dict.fromkeys(self.KINDS, 0)
+        self.suppressed = dict.fromkeys(self.KINDS, 0)
+        self.invalidations = 0
+
+    def should_send(self, tp, key, value) -> bool:
+        # 마지막 전송 값과 같으면 False (생략), 다르면 값을 기록하고 True
+        with self._lock:
+            values = self._panels.get(tp)
+            watch = values is None
+            if watch:
+                values = self._panels[tp] = {}
+            if key in values and values[key] == value:
+                self.suppressed[key[0]] += 1
+                return False
+            values[key] = value
+            self.sent[key[0]] += 1
+        if watch:
+            _shadow_watch(tp)
+        return True
+
+    def forget(self, tp, key):
+        # 패널에서 값이 바뀐 경우 (레벨 드래그 등) : 다음 전송은 항상 보냄
+        with self._lock:
+            values = self._panels.get(tp)
+            if values:
+                values.pop(key, None)
+
+    def forget_port(self, tp, kind, port):
+        # 포트 하나의 kind 기록 모두 삭제 (겹칠 수 있는 범위/목록 주소 명령을 보낸 경우)
+        with self._lock:
+            values = self._panels.get(tp)
+            if values:
+                for key in [key for key in values if key[0] == kind and key[1] == port]:
+                    del values[key]
+
+    def invalidate(self, tp=None):
+        """tp 의 기록 삭제 (None 이면 모든 패널)"""
+        with self._lock:
+            if tp is None:
+                self._panels.clear()
+            elif self._panels.pop(tp, None) is None:
+                return
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "sent": sum(self.sent.values()),
+                "suppressed": sum(self.suppressed.values()),
+                "by_kind": {kind: {"sent": self.sent[kind], "suppressed": self.suppressed[kind]} for kind in self.KINDS},
+                "panels": len(self._panels),
+                "entries": sum(len(values) for values in self._panels.values()),
+                "invalidations": self.invalidations,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.sent = dict.fromkeys(self.KINDS, 0)
+            self.suppressed = dict.fromkeys(self.KINDS, 0)
+            self.invalidations = 0
+
+
+_shadow = None  # tp_enable_shadow_cache() 전에는 None (모든 값 전송)
+_shadow_watched = set()  # online/offline 콜백을 등록한 패널 id (캐시를 끄고 다시 켜도 패널당 한 번만 등록)
+_shadow_watched_lock = threading.Lock()
+
+
+def tp_enable_shadow_cache() -> TpShadowCache:
+    """같은 채널/레벨/텍스트 값 재전송 생략 (피드백 갱신 루프의 불필요한 전송 감소). 레벨 워처 등록 전에 호출 권장"""
+    global _shadow
+    if _shadow is None:
+        _shadow = TpShadowCache()
+    return _shadow
+
+
+def tp_disable_shadow_cache():
+    global _shadow
+    _shadow = None
+
+
+def tp_invalidate_shadow_cache(tp=None):
+    # 패널 화면을 외부에서 바꾼 경우 등 : 다음 갱신을 모두 전송
+    if _shadow is not None:
+        _shadow.invalidate(tp)
+
+
+def _shadow_watch(tp):
+    # 재부팅/재연결된 패널은 화면이 초기 상태이므로 온라인/오프라인 시 현재 캐시의 해당 패널 기록 삭제
+    with _shadow_watched_lock:
+        if id(tp) in _shadow_watched:
+            return
+        _shadow_watched.add(id(tp))
+    try:
+        tp.online(lambda *_args, **_kwargs: tp_invalidate_shadow_cache(tp))
+        tp.offline(lambda *_args, **_kwargs: tp_invalidate_shadow_cache(tp))
+    except Exception as e:
+        tp_log_error(f"_shadow_watch() {tp.id} {e=}")
+
+
+def tp_shadow_cache_stats() -> dict | None:
+    """전송/생략 횟수 (종류별), 기록 중인 패널/항목 수, 초기화 횟수"""
+    return _shadow.stats() if _shadow is not None else None
+
+
+# 버튼 텍스트/표시 상태를 바꾸는 명령 : 주소 하나(숫자)인 ^TXT/^UNI/^SHO/^ENA 만 캐시, 나머지는 포트의 텍스트 기록 삭제
+SHADOW_CACHED_COMMANDS = ("^TXT", "^UNI", "^SHO", "^ENA")
+SHADOW_TEXT_COMMANDS = SHADOW_CACHED_COMMANDS + ("^BMF", "^BAT", "^BAU", "^UTF")
+
+
+def _shadow_command_key(port, command):
+    # 캐시 대상 명령이면 (키, 값), 아니면 None : ^TXT/^UNI 는 같은 주소의 텍스트로 취급 (값에 명령/상태 포함)
+    head = command[:4]
+    if head not in SHADOW_CACHED_COMMANDS or command[4:5] != "-":
+        return None
+    addr, _, rest = command[5:].partition(",")
+    if not addr.isdigit():
+        return None  # "1.10", "1&3" 등 범위/목록 주소
+    if head in ("^TXT", "^UNI"):
+        return ("text", port, int(addr)), (head, rest)
+    return ("text", port, head, int(addr)), rest
+
+
 def _notify(evt):
     # 버튼 상태 변화 이벤트를 디버그 로깅
     if DebugFlags.debug_tp_add_notification:
-        try:
-            _, port, _, button = (int(x) if x.isdigit() else x for x in evt.path.split("/"))
-            tp_log_debug(f"BUTTON {'    PUSH' if evt.value else ' RELEASE'} > {evt.device} {port=} {button=}")
-        except Exception as e:
-            tp_log_error(f"_notify() : path parse error {evt.path=} {e=}")
+        tp_notify(evt)
+
+
+def tp_notify(evt):
+    # 플래그 확인 없이 버튼 이벤트 로깅 (tp_add_watcher_range 로 등록한 핸들러는 플래그 확인 후 직접 호출)
+    try:
+        _, port, _, button = (int(x) if x.isdigit() else x for x in evt.path.split("/"))
+        tp_log_debug(f"BUTTON {'    PUSH' if evt.value else ' RELEASE'} > {evt.device} {port=} {button=}")
+    except Exception as e:
+        tp_log_error(f"_notify() : path parse error {evt.path=} {e=}")
 
 
 @tp_handle_exception
@@ -113,7 +249,10 @@ def tp_add_notification_level_ss(tp_list, port, level):
 def tp_get_device_state(tp):
     # 터치패널 온라인 상태 확인 (isOnline이 메서드인 경우와 프로퍼티인 경우 모두 처리)
     result = tp.isOnline
-    return result() if callable(result) else bool(result)
+    online = result() if callable(result) else bool(result)
+    if not online and _shadow is not None:
+        _shadow.invalidate(tp)  # online/offline 콜백이 없는 장비도 오프라인을 확인하면 기록 삭제
+    return online
 
 
 @tp_handle_exception
@@ -137,6 +276,23 @@ def tp_add_watcher_ss(tp_list: list | tuple, port, button, handler):
         tp_add_watcher(tp, port, button, handler)
 
 
+@tp_handle_exception
+def tp_add_watcher_range(tp, port, buttons, handler) -> list:
+    # 여러 버튼에 같은 핸들러 하나를 등록하고 등록된 버튼 목록 반환 (버튼별 중복 검사/알림 워처 없음, 디버그 알림은 handler 에서 처리)
+    port_buttons = tp.port[port].button
+    added = []
+    for button in buttons:
+        try:
+            port_buttons[button].watch(handler)
+        except Exception as e:
+            tp_log_error(f"tp_add_watcher_range() : {tp.id} {port=} {button=} {e=}")
+            continue
+        added.append(button)
+    if DebugFlags.debug_tp_add_watcher:
+        tp_log_debug(f"tp_add_watcher_range() : {tp.id} {port=} buttons={len(added)}/{len(buttons)}")
+    return added
+
+
 @tp_handle_exception
 def tp_clear_watcher(tp, port, button):
     # 버튼의 모든 워처 제거
@@ -150,6 +306,14 @@ def tp_add_watcher_level(tp, port, level, handler):
     if tp.port[port].level[level].pythonWatchers and handler in tp.port[port].level[level].pythonWatchers:
         tp_log_debug(f"tp_add_watcher_level() : duplicate skipped {tp.id=} {port=} {level=}")
     tp.port[port].level[level].watch(handler)
+    if _shadow is not None:
+
+        def _forget_shadow_level(_evt):
+            # 패널에서 레벨을 바꾸면 기록과 화면이 달라지므로 기록 삭제
+            if _shadow is not None:
+                _shadow.forget(tp, ("level", port, level))
+
+        tp.port[port].level[level].watch(_forget_shadow_level)
     if DebugFlags.debug_tp_add_watcher_level:
         tp_log_debug(f"tp_add_watcher_level() : {tp.id} {port=} {level=}")
     tp_add_notification_level(tp, port, level)
@@ -212,6 +376,8 @@ def tp_get_btn_state(tp, port, button):
 def tp_set_button(tp, port, button, value):
     # 버튼 피드백(채널 값) 설정
     if tp_get_device_state(tp):
+        if _shadow is not None and not _shadow.should_send(tp, ("channel", port, button), bool(value)):
+            return
         tp.port[port].channel[button].value = value
         if DebugFlags.debug_tp_set_button:
             tp_log_debug(f"BUTTON FEEDBACK < {tp.id} {port=} {button=} {value=}")
@@ -357,6 +523,8 @@ def tp_get_lvl(tp, port, level):
 def tp_send_level(tp, port, level, value):
     # 레벨 값 전송/설정
     if tp_get_device_state(tp):
+        if _shadow is not None and not _shadow.should_send(tp, ("level", port, level), value):
+            return
         tp.port[port].level[level].value = value
         if DebugFlags.debug_tp_send_level:
             print(f"LEVEL VALUE CHANGE - {tp.id} {port=} {level=} {value=}")
@@ -419,6 +587,12 @@ def convert_txt_to_unicode(text):
 def tp_send_command(tp, port, command):
     # 터치패널에 명령어 전송
     if tp_get_device_state(tp):
+        if _shadow is not None and isinstance(command, str) and command[:4] in SHADOW_TEXT_COMMANDS:
+            cached = _shadow_command_key(port, command)
+            if cached is None:
+                _shadow.forget_port(tp, "text", port)
+            elif not _shadow.should_send(tp, *cached):
+                return
         tp.port[port].send_command(command)
         if DebugFlags.debug_tp_send_command:
             print(f"tp_send_command() : {tp.id} {port=} {command=}")
@@ -492,8 +666,13 @@ def tp_set_btn_txt_ss(tp_list: list | tuple, port, index_addr, text):
 def tp_set_button_show_hide(tp, port, index_addr, value):
     # 버튼 표시/숨김 및 활성화/비활성화 설정
     state_str = 1 if value else 0
-    tp.port[port].send_command(f"^SHO-{index_addr},{state_str}")
-    tp.port[port].send_command(f"^ENA-{index_addr},{state_str}")
+    if _shadow is None:
+        tp.port[port].send_command(f"^SHO-{index_addr},{state_str}")
+        tp.port[port].send_command(f"^ENA-{index_addr},{state_str}")
+        return
+    # 섀도 캐시 사용 시 : 같은 상태 재전송 생략 (tp_send_command 경유이므로 오프라인이면 전송 안 함, 온라인 시 기록이 초기화됨)
+    tp_send_command(tp, port, f"^SHO-{index_addr},{state_str}")
+    tp_send_command(tp, port, f"^ENA-{index_addr},{state_str}")
 
 
 # 별칭 함수
@@ -1,4 +1,4 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import json
 import os
 import threading
@@ -13,6 +13,11 @@ _PROGRAM_NAME = os.path.basename(_SRC_DIR)  # 프로젝트루트 폴더명
 _DEFAULT_FOLDER = f"{_PROGRAM_NAME}_userdata"  # e.g. "(2026_06)_HSW_KHNP_CRI_userdata"
 
 
+def get_userdata_folder(foldername=_DEFAULT_FOLDER):
+    # 사용자 데이터 폴더 경로 (foldername 이 비어 있으면 프로젝트 루트)
+    return os.path.join(_BASE_DIR, foldername) if foldername else _BASE_DIR
+
+
 class Userdata(CommonLogger):
     def __init__(self, filename="userdata.json", foldername=_DEFAULT_FOLDER, default_value=None):
         self.filename = filename if filename.endswith(".json") else filename + ".json"
@@ -23,8 +28,7 @@ class Userdata(CommonLogger):
         self.init(default_value)
 
     def get_file_path(self):
-        folder = os.path.join(_BASE_DIR, self.foldername) if self.foldername else _BASE_DIR
-        return os.path.join(folder, self.filename)
+        return os.path.join(get_userdata_folder(self.foldername), self.filename)
 
     def init(self, default_value=None):
         # 폴더가 없으면 생성
@@ -1,12 +1,38 @@
-# 마지막 수정일 : 20260629
+# 마지막 수정일 : 20261018
 import functools
 import inspect
 import threading
+import time
+import weakref
 from typing import Callable
 
+_handler_loc_cache = weakref.WeakKeyDictionary()  # 코드 객체 → {path_parts: 위치 문자열}
+_handler_loc_lock = threading.Lock()
+
+
+def _handler_code(handler):
+    # 함수/바운드 메서드의 코드 객체 (없으면 None: partial, 호출 가능 객체 등)
+    return getattr(getattr(handler, "__func__", handler), "__code__", None)
+
 
 def handler_loc(handler, path_parts: int = 3) -> str:
     """핸들러 함수의 qualname과 소스 위치(파일:줄번호)를 반환. path_parts: 경로 끝에서 남길 세그먼트 수"""
+    # 소스 파일을 읽는 inspect 호출은 코드 객체당 한 번만 (코드 객체가 사라지면 캐시도 제거)
+    if isinstance(handler, functools.partial):
+        handler = handler.func
+    code = _handler_code(handler)
+    if code is None:
+        return _handler_loc(handler, path_parts)
+    cached = _handler_loc_cache.get(code)
+    if cached is not None and path_parts in cached:
+        return cached[path_parts]
+    loc = _handler_loc(handler, path_parts)
+    with _handler_loc_lock:
+        _handler_loc_cache.setdefault(code, {})[path_parts] = loc
+    return loc
+
+
+def _handler_loc(handler, path_parts: int) -> str:
     try:
         src = inspect.getsourcefile(handler) or ""
         line = inspect.getsourcelines(handler)[1]
@@ -64,18 +90,31 @@ class CommonLogger:
             full_msg = f"({level}) - {cls_name} : {message}"
         print(full_msg, end="\n", flush=True)
 
-    def log_debug(self, message):
+    def is_debug(self) -> bool:
+        # 디버그 메시지를 만들기 전에 확인하는 용도 (비용이 큰 메시지는 if self.is_debug(): 로 감싸기)
+        return self.debug
+
+    @staticmethod
+    def _format_message(message, args):
+        # 지연 포맷: callable 이면 호출, args 가 있으면 %-포맷 (로그가 출력될 때만 실행)
+        if callable(message):
+            return message()
+        if args:
+            return message % args
+        return message
+
+    def log_debug(self, message, *args):
         if self.debug:
-            self._log_message("DEBUG", message)
+            self._log_message("DEBUG", self._format_message(message, args))
 
-    def log_error(self, message):
-        self._log_message("ERROR", message)
+    def log_error(self, message, *args):
+        self._log_message("ERROR", self._format_message(message, args))
 
-    def log_warn(self, message):
-        self._log_message("WARN", message)
+    def log_warn(self, message, *args):
+        self._log_message("WARN", self._format_message(message, args))
 
-    def log_info(self, message):
-        self._log_message("INFO", message)
+    def log_info(self, message, *args):
+        self._log_message("INFO", self._format_message(message, args))
 
 
 def handle_exception(func):
@@ -96,11 +135,13 @@ def pulse(duration_seconds, off_method, *off_args, **off_kwargs):
     """함수 실행 후 지정된 시간 후에 off_method를 자동으로 호출하는 데코레이터"""
 
     def decorator(func):
+        from lib.scheduler import call_later
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
-            # Threading.Timer를 사용하여 비동기로 off_method 실행
-            threading.Timer(duration_seconds, off_method, args=off_args, kwargs=off_kwargs).start()
+            # 공유 타이머로 off_method 실행 (호출마다 스레드를 만들지 않음)
+            call_later(duration_seconds, off_method, *off_args, **off_kwargs)
             return result
 
         return wrapper
@@ -112,20 +153,86 @@ def debounce(timeout_ms: float):
     """마지막 호출로부터 지정된 시간 동안 동일한 함수 호출을 무시하는 데코레이터"""
 
     def decorator(func):
+        from lib.scheduler import call_later, cancel_call
+
+        lock = threading.Lock()
+        pending = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal pending
+            with lock:
+                # 이전 예약 취소 후 마지막 인자로 다시 예약 (밀리초를 초로 변환)
+                cancel_call(pending)
+                pending = call_later(timeout_ms / 1000, func, *args, **kwargs)
+
+        def cancel():
+            nonlocal pending
+            with lock:
+                cancel_call(pending)
+                pending = None
+
+        wrapper.cancel = cancel
+        return wrapper
+
+    return decorator
+
+
+def throttle(interval_ms: float, leading: bool = True, trailing: bool = True):
+    """interval_ms 마다 최대 한 번만 실행하는 데코레이터
+    leading: 구간 첫 호출을 즉시 실행, trailing: 구간 중 들어온 마지막 호출을 구간 끝에 실행"""
+
+    def decorator(func):
+        from lib.scheduler import call_later, cancel_call
+
+        interval = interval_ms / 1000
         lock = threading.Lock()
-        func_timer = None
+        last_run = None  # 마지막 실행(또는 구간 시작) 시각
+        pending_args = None  # 구간 끝에 실행할 마지막 인자
+        timer = None
+
+        def fire():
+            nonlocal last_run, pending_args, timer
+            with lock:
+                timer = None
+                call_args = pending_args
+                pending_args = None
+                if call_args is None:
+                    return
+                last_run = time.monotonic()
+                # 실행 후에도 구간 유지 : 그 사이 들어온 호출은 다음 구간 끝에 실행
+                timer = call_later(interval, fire)
+            func(*call_args[0], **call_args[1])
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal func_timer
+            nonlocal last_run, pending_args, timer
+            now = time.monotonic()
+            with lock:
+                if timer is None and (last_run is None or now - last_run >= interval):
+                    last_run = now
+                    if not leading:
+                        pending_args = (args, kwargs) if trailing else None
+                        timer = call_later(interval, fire)
+                        return
+                    timer = call_later(interval, fire)
+                elif trailing:
+                    pending_args = (args, kwargs)
+                    if timer is None:
+                        timer = call_later(last_run + interval - now, fire)
+                    return
+                else:
+                    return
+            func(*args, **kwargs)
+
+        def cancel():
+            nonlocal pending_args, timer
             with lock:
-                # 이전 타이머가 실행 중이면 취소
-                if func_timer and func_timer.is_alive():
-                    func_timer.cancel()
-                # 새로운 타이머 설정 (밀리초를 초로 변환)
-                func_timer = threading.Timer(timeout_ms / 1000, func, args=args, kwargs=kwargs)
-                func_timer.start()
+                cancel_call(timer)
+                timer = None
+                pending_args = None
 
+        wrapper.cancel = cancel
         return wrapper
 
     return decorator
@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from lib import button as button_module
+
+
+class FakeButton:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.pythonWatchers = []
+
+    def watch(self, handler):
+        if self.fail:
+            raise RuntimeError("watch failed")
+        self.pythonWatchers.append(handler)
+
+
+class FakePanel:
+    id = "tp"
+
+    def __init__(self, buttons, failing=()):
+        self.port = {1: SimpleNamespace(button={b: FakeButton(b in failing) for b in buttons})}
+
+
+def push(panel, button):
+    evt = SimpleNamespace(path=f"port/1/button/{button}", value=True, device=panel.id)
+    for watcher in panel.port[1].button[button].pythonWatchers:
+        watcher(evt)
+
+
+def test_bind_range_dispatches_by_path_and_skips_failed_watchers():
+    panel = FakePanel((101, 102, 103), failing=(102,))
+    pushed = []
+    handlers = button_module.bind_range(panel, 1, (101, 102, 103), "push", pushed.append)
+    assert len(handlers) == 2
+    router = button_module.get_port_router(panel, 1)
+    assert sorted(router.routes) == [101, 103]  # 워처 등록에 실패한 버튼은 라우트 없음
+    push(panel, 101)
+    push(panel, 103)
+    assert pushed == [0, 2]
+    router.dispatch(SimpleNamespace(path="port/1/button/x", value=True, device=panel.id))  # 모르는 경로는 무시
+    assert pushed == [0, 2]
@@ -0,0 +1,26 @@
+import math
+import random
+
+from lib.level_converter import level_scale, london_db_to_value, london_db_to_value_many
+
+
+def formula_db_to_value(db_value):
+    return int(db_value * 10000 if db_value >= -10 else (-math.log10(abs(db_value / 10)) * 200000) - 100000)
+
+
+def test_london_db_to_value_matches_formula():
+    rng = random.Random(0)
+    values = [k / 10 for k in range(-1200, 201)]
+    values += [k * 0.1 for k in range(-1200, 201)]  # 0.1dB 근처의 격자 밖 float
+    values += [k / 10 + 1e-12 for k in range(-1200, 201)]
+    values += [rng.uniform(-130, 25) for _ in range(20000)]
+    assert [london_db_to_value(v) for v in values] == [formula_db_to_value(v) for v in values]
+    assert london_db_to_value_many(values) == [formula_db_to_value(v) for v in values]
+
+
+def test_level_scale_batch_matches_scalar():
+    rng = random.Random(0)
+    scale = level_scale(-60, 10)
+    values = [rng.uniform(-70, 20) for _ in range(20000)]
+    assert scale.db_to_tp_many(values) == [(x - -60) * (255 - 0) / (10 - -60) + 0 for x in values]
+    assert scale.tp_to_db_many(range(256)) == [(x - 0) * (10 - -60) / (255 - 0) + -60 for x in range(256)]
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from lib.london_controller import LondonController, LondonDev, LondonParam
+
+NODE = bytes([0x00, 0x01, 0x03, 0x00, 0x01, 0x4E])
+
+
+def make_controller():
+    dv = SimpleNamespace(receive=SimpleNamespace(listen=lambda _listener: None), send=lambda _data: None, isOnline=lambda: True)
+    return LondonController(dv)
+
+
+def meter_key(controller):
+    return controller.get_key(NODE, LondonDev.METER, 1, 0, LondonParam.METER)
+
+
+def feed(controller, key, value):
+    controller.process_feedback(b"\x88" + key + value.to_bytes(4, "big", signed=True))
+
+
+def test_meters_subscribed_before_engine_are_rerouted():
+    controller = make_controller()
+    controller.subscribe(NODE, LondonDev.METER, 1, 0, LondonParam.METER)
+    key = meter_key(controller)
+    meters = controller.enable_meter_engine()
+    meters.stop()
+    feed(controller, key, -200000)
+    assert meters.get_levels(key)["value"] == -200000
+    assert controller.states.get_state(key) != -200000  # 프레임 주기 전에는 상태 갱신 없음
+    meters._tick()
+    assert controller.states.get_state(key) == -200000
+
+
+def test_meter_tick_after_unsubscribe_does_not_resurrect_key():
+    controller = make_controller()
+    meters = controller.enable_meter_engine()
+    meters.stop()
+    controller.subscribe(NODE, LondonDev.METER, 1, 0, LondonParam.METER)
+    key = meter_key(controller)
+    feed(controller, key, -150000)
+    history = meters._meters[key]
+    controller.unsubscribe(NODE, LondonDev.METER, 1, 0, LondonParam.METER)
+    meters._meters[key] = history  # 구독 해제 직전에 도착한 프레임
+    meters._tick()
+    assert key not in controller.states.snapshot()
+
+
+def test_snapshot_excludes_meters():
+    controller = make_controller()
+    controller.subscribe(NODE, LondonDev.METER, 1, 0, LondonParam.METER)
+    controller.subscribe(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)
+    assert list(controller._snapshot_states()) == [controller.get_key(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)]
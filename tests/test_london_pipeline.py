@@ -0,0 +1,71 @@
+from lib.london_pipeline import LondonSendQueue
+
+
+def make_queue(window):
+    sent = []
+    queue = LondonSendQueue(sent.append, window=window)
+    return queue, sent
+
+
+def test_nak_retransmit_keeps_wire_order():
+    queue, sent = make_queue(window=3)
+    queue.put([b"A", b"B", b"C"])
+    assert sent == [b"ABC"]
+
+    queue.on_nak()  # A 재전송 : 전송 순서는 B, C, A
+    assert sent[-1] == b"A"
+    assert [entry[0] for entry in queue._in_flight] == [b"B", b"C", b"A"]
+
+    queue.on_ack()  # B
+    queue.on_ack()  # C
+    assert [entry[0] for entry in queue._in_flight] == [b"A"]
+
+    queue.on_nak()  # 두 번째 NAK 는 아직 ACK 받지 못한 A 를 재전송
+    assert sent[-1] == b"A"
+    assert queue._in_flight[0][2] == 2
+
+    queue.on_ack()  # A
+    assert not queue._in_flight
+    assert queue.ack_count == 3
+    assert queue.retransmit_count == 2
+
+
+def test_nak_after_max_retries_drops_frame_and_sends_next():
+    queue, sent = make_queue(window=2)
+    queue.max_retries = 1
+    queue.put([b"A", b"B", b"C"])
+    queue.on_nak()  # A 재전송 → [B, A]
+    queue.on_ack()  # B → [A, C]
+    assert [entry[0] for entry in queue._in_flight] == [b"A", b"C"]
+    queue.on_nak()  # A 재시도 초과로 폐기
+    assert queue.dropped_count == 1
+    assert [entry[0] for entry in queue._in_flight] == [b"C"]
+
+
+def test_timeout_then_late_ack_is_not_credited_to_another_frame(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("lib.london_pipeline.time.monotonic", lambda: clock[0])
+    queue, sent = make_queue(window=3)
+    queue.put([b"A", b"B", b"C"])
+
+    clock[0] += queue.ack_timeout  # A 타임아웃 : B, C 는 대기열로 되돌리고 resync
+    queue._check_timeout()
+    assert sent == [b"ABC"]
+    assert [entry[0] for entry in queue._in_flight] == [b"A"]
+
+    queue.on_ack()  # 처음 보낸 A 에 대한 늦은 ACK : 무시
+    queue.on_ack()  # 처음 보낸 B 에 대한 늦은 ACK : 무시
+    assert queue.stale_count == 2
+    assert [entry[0] for entry in queue._in_flight] == [b"A"]
+
+    clock[0] += queue.ack_timeout  # resync 종료 : A 하나만 재전송
+    queue._check_timeout()
+    assert sent[-1] == b"A"
+    assert queue._in_flight[0][2] == 1
+
+    queue.on_ack()  # A 확인 후 window 전송 재개
+    assert sent[-1] == b"BC"
+    assert [entry[0] for entry in queue._in_flight] == [b"B", b"C"]
+    queue.on_ack()  # B
+    queue.on_ack()  # C
+    assert not queue._in_flight and not queue._queue
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+from lib.london_controller import LondonController, LondonDev, LondonParam
+
+NODE = bytes([0x00, 0x01, 0x03, 0x00, 0x01, 0x4E])
+
+
+def make_controller():
+    dv = SimpleNamespace(receive=SimpleNamespace(listen=lambda _listener: None), send=lambda _data: None, isOnline=lambda: True)
+    return LondonController(dv)
+
+
+def feed(controller, key, value):
+    controller.process_feedback(b"\x88" + key + value.to_bytes(4, "big", signed=True))
+
+
+def test_restored_state_is_not_subscribed_until_reconciled():
+    controller = make_controller()
+    key = controller.get_key(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)
+    controller.states.restore({key: -100})
+    assert controller.states.get_state(key) == -100
+    feed(controller, key, -50)  # 구독 전 수신값은 반영하지 않음
+    assert key not in controller.states.snapshot()
+
+    controller.subscribe(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)
+    assert controller.states.snapshot() == {key: -100}  # 구독 시 복원값 유지
+    feed(controller, key, -50)
+    assert controller.states.get_state(key) == -50
+
+
+def test_unreconciled_restored_state_is_dropped_on_first_save():
+    controller = make_controller()
+    kept = controller.get_key(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)
+    stale = controller.get_key(NODE, LondonDev.MIXER, 3, 0, LondonParam.GAIN)
+    controller.states.restore({kept: -100, stale: -200})
+    controller.subscribe(NODE, LondonDev.MIXER, 2, 0, LondonParam.GAIN)
+    assert controller._snapshot_states() == {kept: -100}
+    assert controller.states.get_state(stale) is None
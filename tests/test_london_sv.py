@@ -0,0 +1,179 @@
+from types import SimpleNamespace
+
+from lib.london_controller import LondonController, LondonDev, LondonParam, london_sv
+
+# 입출력 인덱스 : 일반 범위 전체 + 128 채널 경계, 2바이트 범위 초과 값
+INDEXES = list(range(0, 66)) + [127, 128, 129, 200, 255, 256, 300]
+DEVICES = [int(d) for d in LondonDev] + [0, 5, 99]
+PARAMS = sorted({int(p) for p in LondonParam}) + [99]
+
+
+def baseline_get_sv(index_device, index_input, index_output, index_param):
+    # 225b3d8 의 LondonController.get_sv (if/elif 버전) 그대로
+    try:
+        sv = None
+        if index_device == LondonDev.LOGIC_SOURCE:
+            if index_param == LondonParam.LOGIC_SOURCE:
+                sv = 1
+        elif index_device == LondonDev.LOGIC_END:
+            if index_param == LondonParam.LOGIC_END:
+                sv = 0
+        elif index_device == LondonDev.AUTOMIXER or index_device == LondonDev.MIXER:
+            if index_input != 0 and index_output == 0:
+                if index_param == LondonParam.GAIN:
+                    sv = (index_input - 1) * 100
+                elif index_param == LondonParam.MUTE:
+                    sv = (index_input - 1) * 100 + 1
+                elif index_param == LondonParam.PAN:
+                    sv = (index_input - 1) * 100 + 2
+                elif index_param == LondonParam.SOLO:
+                    sv = (index_input - 1) * 100 + 4
+                elif index_param == LondonParam.OVERRIDE:
+                    sv = (index_input - 1) * 100 + 5
+                elif index_param == LondonParam.OFF_GAIN:
+                    sv = (index_input - 1) * 100 + 6
+                elif index_param == LondonParam.AUTO:
+                    sv = (index_input - 1) * 100 + 7
+            elif index_input == 0 and index_output != 0:
+                if index_param == LondonParam.GAIN:
+                    sv = index_output + 20000 - 1
+                elif index_param == LondonParam.MUTE:
+                    sv = index_output + 20000
+                elif index_param == LondonParam.AUX_GAIN:
+                    sv = (index_output - 1) * 10 + 10001
+                elif index_param == LondonParam.AUX:
+                    sv = (index_output - 1) * 10 + 10002
+                elif index_param == LondonParam.GROUP_GAIN:
+                    sv = (index_output - 1) * 10 + 11000
+                elif index_param == LondonParam.GROUP:
+                    sv = (index_output - 1) * 10 + 11001
+            elif index_param == LondonParam.GROUP:
+                sv = (index_input - 1) * 100 + (index_output - 1) + 40
+        elif index_device == LondonDev.ROOM_COMBINE:
+            if index_input != 0 and index_output == 0:
+                if index_param == LondonParam.PARTITION:
+                    sv = index_input - 1
+                elif index_param == LondonParam.GROUP:
+                    sv = (index_input - 1) * 50 + 250
+                elif index_param == LondonParam.SOURCE_GAIN:
+                    sv = (index_input - 1) * 50 + 255
+                elif index_param == LondonParam.SOURCE_MUTE:
+                    sv = (index_input - 1) * 50 + 256
+                elif index_param == LondonParam.BGM_GAIN:
+                    sv = (index_input - 1) * 50 + 257
+                elif index_param == LondonParam.BGM_MUTE:
+                    sv = (index_input - 1) * 50 + 258
+                elif index_param == LondonParam.BGM_SELECT:
+                    sv = (index_input - 1) * 50 + 259
+            elif index_input == 0 and index_output != 0:
+                if index_param == LondonParam.MASTER_GAIN:
+                    sv = (index_output - 1) * 50 + 252
+                elif index_param == LondonParam.MASTER_MUTE:
+                    sv = (index_output - 1) * 50 + 254
+        elif index_device == LondonDev.ROUTER or index_device == LondonDev.MATRIX_MIXER:
+            if index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
+                sv = (index_input - 1) + ((index_output - 1) * 128)
+            elif index_param == LondonParam.GAIN:
+                sv = (index_input + 16383) + ((index_output - 1) * 128)
+        elif index_device == LondonDev.N_GAIN:
+            if index_output == 0:
+                if index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
+                    sv = (index_input - 1) + 32
+                elif index_param == LondonParam.GAIN:
+                    sv = index_input - 1
+            elif index_input == 0:
+                if index_param == LondonParam.GAIN:
+                    sv = 96
+                elif index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
+                    sv = 97
+        elif index_device == LondonDev.GAIN:
+            if index_output == 0 and index_input == 1:
+                if index_param == LondonParam.GAIN:
+                    sv = 0
+                elif index_param == LondonParam.MUTE or index_param == LondonParam.UNMUTE:
+                    sv = 1
+                elif index_param == LondonParam.POLARITY_ON or index_param == LondonParam.POLARITY_OFF:
+                    sv = 2
+                elif index_param == LondonParam.BUMP_UP_ON or index_param == LondonParam.BUMP_UP_OFF:
+                    sv = 3
+                elif index_param == LondonParam.BUMP_DOWN_ON or index_param == LondonParam.BUMP_DOWN_OFF:
+                    sv = 4
+        elif index_device == LondonDev.SOURCE_SELECTOR:
+            sv = 0
+        elif index_device == LondonDev.SOURCE_MATRIX:
+            sv = index_input - 1
+        elif index_device == LondonDev.INPUT_CARD:
+            if index_param == LondonParam.GAIN:
+                if index_input == 1:
+                    sv = 4
+                elif index_input == 2:
+                    sv = 10
+                elif index_input == 3:
+                    sv = 16
+                elif index_input == 4:
+                    sv = 22
+            elif index_param == LondonParam.METER:
+                sv = (index_input - 1) * 6
+            elif index_param == LondonParam.REFERENCE:
+                sv = (index_input - 1) * 6 + 1
+            elif index_param == LondonParam.ATTACK:
+                sv = (index_input - 1) * 6 + 2
+            elif index_param == LondonParam.RELEASED:
+                sv = (index_input - 1) * 6 + 3
+            elif index_param == LondonParam.PHANTOM:
+                sv = (index_input - 1) * 6 + 5
+        elif index_device == LondonDev.OUTPUT_CARD:
+            if index_param == LondonParam.METER:
+                sv = (index_input - 1) * 4
+            elif index_param == LondonParam.REFERENCE:
+                sv = (index_input - 1) * 4 + 1
+            elif index_param == LondonParam.ATTACK:
+                sv = (index_input - 1) * 4 + 2
+            elif index_param == LondonParam.RELEASED:
+                sv = (index_input - 1) * 4 + 3
+        elif index_device == LondonDev.METER:
+            if index_param == LondonParam.METER:
+                sv = 0
+        if sv is None or sv < 0:
+            return None
+        return sv.to_bytes(2, "big", signed=True)
+    except Exception:
+        return None
+
+
+def make_controller():
+    dv = SimpleNamespace(receive=SimpleNamespace(listen=lambda _listener: None), send=lambda _data: None, isOnline=lambda: True)
+    return LondonController(dv)
+
+
+def test_london_sv_matches_baseline_get_sv():
+    mismatches = []
+    for device in DEVICES:
+        for param in PARAMS:
+            for index_input in INDEXES:
+                for index_output in INDEXES:
+                    expected = baseline_get_sv(device, index_input, index_output, param)
+                    actual = london_sv(device, index_input, index_output, param)
+                    if actual != expected:
+                        mismatches.append((device, index_input, index_output, param, expected, actual))
+    assert not mismatches, mismatches[:20]
+
+
+def test_get_key_matches_baseline():
+    controller = make_controller()
+    node_addr = bytes([0x00, 0x01, 0x03, 0x00, 0x01, 0x4E])
+    for device in DEVICES:
+        for param in PARAMS:
+            for index_input in range(0, 9):
+                for index_output in range(0, 9):
+                    s_v = baseline_get_sv(device, index_input, index_output, param)
+                    expected = bytes(node_addr + s_v) if s_v else b""
+                    assert controller.get_key(node_addr, device, index_input, index_output, param) == expected
+                    assert controller.get_sv(device, index_input, index_output, param) == s_v
+
+
+def test_get_key_returns_interned_key():
+    controller = make_controller()
+    node_addr = bytearray([0x00, 0x01, 0x03, 0x00, 0x01, 0x4E])
+    first = controller.get_key(node_addr, LondonDev.MIXER, 3, 0, LondonParam.GAIN)
+    assert controller.get_key(bytes(node_addr), LondonDev.MIXER, 3, 0, LondonParam.GAIN) is first
@@ -0,0 +1,35 @@
+import threading
+import time
+
+from lib.poll_coordinator import PollCoordinator
+
+
+def test_slow_transport_does_not_block_other_transports():
+    coordinator = PollCoordinator(tick=0.01, max_per_second=100.0, transport_max_per_second=100.0)
+    release = threading.Event()
+    fast_done = threading.Event()
+    order = []
+
+    def slow():
+        release.wait(2.0)
+        order.append("slow")
+
+    slow_group = coordinator.group("slow", transport="tcp-a")
+    slow_group.start(slow, lambda: order.append("after slow"), interval=60.0, delay=0.0)
+    fast_group = coordinator.group("fast", transport="tcp-b")
+    fast_group.start(fast_done.set, interval=60.0, delay=0.0)
+    for task in coordinator._tasks:
+        task.next_due = time.monotonic()  # 위상 분산 없이 모두 지금 실행
+    try:
+        coordinator._tick()
+        assert fast_done.wait(1.0)  # 다른 통신 경로는 느린 폴링을 기다리지 않음
+        assert order == []
+        release.set()
+        deadline = time.monotonic() + 2.0
+        while len(order) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert order == ["slow", "after slow"]  # 같은 통신 경로는 순서대로 실행
+    finally:
+        release.set()
+        slow_group.stop()
+        fast_group.stop()
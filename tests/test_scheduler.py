@@ -0,0 +1,21 @@
+import threading
+
+from lib.scheduler import _timer_service, call_later
+
+
+def test_burst_of_short_jobs_does_not_overflow_the_pool():
+    done = threading.Event()
+    count = [0]
+    lock = threading.Lock()
+
+    def job():
+        with lock:
+            count[0] += 1
+            if count[0] == 1000:
+                done.set()
+
+    overflow = _timer_service.overflow_count
+    for _ in range(1000):
+        call_later(0, job)
+    assert done.wait(5.0)
+    assert _timer_service.overflow_count == overflow
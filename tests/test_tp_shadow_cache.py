@@ -0,0 +1,82 @@
+from lib import tp as tp_module
+
+
+class FakePort:
+    def __init__(self, log):
+        self.log = log
+
+    def send_command(self, command):
+        self.log.append(command)
+
+
+class FakePanel:
+    id = "tp"
+    isOnline = True
+
+    def __init__(self):
+        self.log = []
+        self.port = {1: FakePort(self.log)}
+
+    def online(self, callback):
+        pass
+
+    def offline(self, callback):
+        pass
+
+
+def send_all(commands):
+    tp_module.tp_enable_shadow_cache()
+    try:
+        panel = FakePanel()
+        for command in commands:
+            tp_module.tp_send_command(panel, 1, command)
+        return panel.log
+    finally:
+        tp_module.tp_disable_shadow_cache()
+
+
+def test_unchanged_single_address_text_is_suppressed():
+    assert send_all(["^TXT-1,0,A", "^TXT-1,0,A", "^UNI-2,0,0041", "^UNI-2,0,0041"]) == ["^TXT-1,0,A", "^UNI-2,0,0041"]
+
+
+def test_range_address_invalidates_overlapping_text():
+    commands = ["^TXT-1,0,A", "^TXT-1.5,0,B", "^TXT-1,0,A"]
+    assert send_all(commands) == commands
+
+
+def test_list_address_invalidates_show_state():
+    commands = ["^SHO-2,1", "^SHO-2&3,0", "^SHO-2,1"]
+    assert send_all(commands) == commands
+
+
+def test_uncached_text_command_invalidates_port_text():
+    commands = ["^TXT-1,0,A", "^BMF-1,0,%TB", "^TXT-1,0,A"]
+    assert send_all(commands) == commands
+
+
+def test_show_hide_without_cache_sends_even_when_offline():
+    panel = FakePanel()
+    panel.isOnline = False
+    tp_module.tp_set_button_show_hide(panel, 1, 5, True)
+    assert panel.log == ["^SHO-5,1", "^ENA-5,1"]
+
+
+def test_online_callbacks_are_registered_once_and_reach_the_current_cache():
+    panel = FakePanel()
+    callbacks = []
+    panel.online = callbacks.append
+    panel.offline = callbacks.append
+    for _ in range(2):  # 캐시를 끄고 다시 켜도 패널당 한 번만 등록
+        tp_module.tp_enable_shadow_cache()
+        tp_module.tp_send_command(panel, 1, "^TXT-1,0,A")
+        tp_module.tp_disable_shadow_cache()
+    assert len(callbacks) == 2
+    cache = tp_module.tp_enable_shadow_cache()
+    try:
+        tp_module.tp_send_command(panel, 1, "^TXT-1,0,A")
+        callbacks[0]()  # 온라인 : 현재 캐시의 패널 기록 삭제
+        tp_module.tp_send_command(panel, 1, "^TXT-1,0,A")
+        assert panel.log == ["^TXT-1,0,A"] * 4
+        assert cache.invalidations == 1
+    finally:
+        tp_module.tp_disable_shadow_cache()